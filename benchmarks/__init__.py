@@ -0,0 +1 @@
+"""Benchmarks of `ayon_max` hot paths running without 3ds Max."""
@@ -0,0 +1,96 @@
+"""Fixtures of the `ayon_max` benchmarks.
+
+The fake pymxs runtime is installed before any test module imports
+`ayon_max`.
+"""
+import os
+import sys
+import tracemalloc
+from typing import Any, Callable
+
+import pytest
+
+from benchmarks import fake_pymxs
+from benchmarks.scene import SCENE_SIZES, SyntheticScene, get_scene
+
+
+CLIENT_DIR = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "client")
+if CLIENT_DIR not in sys.path:
+    sys.path.insert(0, CLIENT_DIR)
+
+rt = fake_pymxs.install()
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--scene-sizes",
+        default=",".join(str(size) for size in SCENE_SIZES[:-1]),
+        help=(
+            "Comma separated node counts of the benchmarked scenes. "
+            f"Defaults to all but the largest of {SCENE_SIZES}."
+        ),
+    )
+
+
+def pytest_generate_tests(metafunc):
+    if "scene" not in metafunc.fixturenames:
+        return
+    sizes = [
+        int(size)
+        for size in metafunc.config.getoption("--scene-sizes").split(",")
+        if size.strip()
+    ]
+    # Session scope groups the tests by scene size, so each scene
+    # is generated once.
+    metafunc.parametrize(
+        "scene", sizes, indirect=True, scope="session",
+        ids=[f"{size}nodes" for size in sizes]
+    )
+
+
+@pytest.fixture(scope="session")
+def scene(request) -> SyntheticScene:
+    return get_scene(rt, request.param)
+
+
+@pytest.fixture
+def current_scene(scene) -> SyntheticScene:
+    """Make sure the session scene is current, other tests may reset it."""
+    return get_scene(rt, scene.spec.node_count)
+
+
+def measure_peak_memory(func: Callable[[], Any]) -> int:
+    """Get peak memory in bytes allocated by a single call of `func`."""
+    tracemalloc.start()
+    try:
+        func()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return peak
+
+
+@pytest.fixture
+def run_benchmark(benchmark, current_scene):
+    """Benchmark function and record throughput and peak memory.
+
+    MaxScript functions of the fake runtime are stubbed, a warm up call
+    computes their results so only the Python side is measured.
+    Throughput is the number of scene nodes processed per second.
+    """
+    def run(func: Callable[[], Any], group: str) -> Any:
+        benchmark.group = group
+        node_count = current_scene.spec.node_count
+        benchmark.extra_info["scene_nodes"] = node_count
+        with rt.stubbed_maxscript():
+            func()
+            benchmark.extra_info["peak_memory_bytes"] = (
+                measure_peak_memory(func))
+            result = benchmark(func)
+        mean = benchmark.stats.stats.mean
+        if mean:
+            benchmark.extra_info["nodes_per_second"] = node_count / mean
+        return result
+
+    return run
@@ -0,0 +1,805 @@
+# -*- coding: utf-8 -*-
+"""In-memory stand-in of `pymxs.runtime` for benchmarks without 3ds Max.
+
+Only the part of the runtime used by the scene query hot paths of
+`ayon_max.api` is modelled: nodes with their hierarchy, user properties,
+modifiers and custom attributes, render settings and the render element
+manager. Like pymxs, global and property names are case-insensitive.
+
+MaxScript is not interpreted. `Execute` defines the `fn ayon_*` functions
+of `ayon_max` modules from their Python implementations registered with
+`maxscript_function`, and creates custom attribute definitions from
+`attributes` scripts. Any other script raises `NotImplementedError`.
+
+The Python implementations only stand in for the MaxScript contract, their
+speed says nothing about the MaxScript. Inside `stubbed_maxscript` each
+function computes its result once per arguments and then returns it in
+constant time, so benchmarks time only the Python side of `ayon_max`.
+
+The fake runtime has to be installed before any `ayon_max` module is
+imported::
+
+    from benchmarks import fake_pymxs
+
+    rt = fake_pymxs.install()
+"""
+from __future__ import annotations
+import re
+import sys
+import contextlib
+import functools
+import types
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+
+# Python implementations of MaxScript functions by lowercase name.
+MAXSCRIPT_FUNCTIONS: Dict[str, Callable[..., Any]] = {}
+
+_FN_NAME_REGEX = re.compile(r"^fn\s+(\w+)", re.MULTILINE)
+_ATTRIBUTES_REGEX = re.compile(r'^\s*attributes\s+"?(\w+)"?')
+_PARAMETER_REGEX = re.compile(r"^\s*(\w+)\s+type:\s*#(\w+)", re.MULTILINE)
+
+
+@functools.lru_cache(maxsize=None)
+def _get_class_attributes(cls: type) -> Dict[str, str]:
+    """Get attribute names of the class by their lowercase name."""
+    return {attr.lower(): attr for attr in dir(cls)}
+
+
+def maxscript_function(name: str):
+    """Register Python implementation of a MaxScript function.
+
+    The implementation gets the runtime as the first argument.
+
+    Args:
+        name (str): Name of the MaxScript function.
+    """
+    def decorator(func):
+        MAXSCRIPT_FUNCTIONS[name.lower()] = func
+        return func
+    return decorator
+
+
+class MaxObject(object):
+    """Value with case-insensitive properties, like pymxs wrappers."""
+
+    def __init__(self, **properties):
+        object.__setattr__(self, "_props", {})
+        for key, value in properties.items():
+            setattr(self, key, value)
+
+    def __getattr__(self, name: str) -> Any:
+        props = object.__getattribute__(self, "_props")
+        try:
+            return props[name.lower()]
+        except KeyError:
+            pass
+        attr = _get_class_attributes(type(self)).get(name.lower())
+        if attr is None:
+            raise AttributeError(f"Unknown property: \"{name}\" in {self}")
+        return object.__getattribute__(self, attr)
+
+    def __setattr__(self, name: str, value: Any):
+        self._props[name.lower()] = value
+
+    def has_property(self, name: str) -> bool:
+        return name.lower() in self._props
+
+
+class MaxName(str):
+    """MaxScript name value, e.g. `#noPrompt`."""
+
+    def __repr__(self) -> str:
+        return f"#{self}"
+
+
+class MaxClass(object):
+    """MaxScript class, calling it creates an instance of the class.
+
+    Args:
+        runtime (FakeRuntime): Runtime the class belongs to.
+        name (str): Class name, e.g. "Box".
+        superclass (Optional[MaxClass]): Superclass of the class instances,
+            e.g. `GeometryClass`.
+        factory (Optional[Callable]): Creates instance of the class.
+    """
+
+    def __init__(
+        self,
+        runtime: "FakeRuntime",
+        name: str,
+        superclass: Optional["MaxClass"] = None,
+        factory: Optional[Callable[..., Any]] = None,
+    ):
+        self.runtime = runtime
+        self.name = name
+        self.superclass = superclass
+        self.factory = factory
+
+    def __call__(self, **kwargs) -> Any:
+        if self.factory is None:
+            raise TypeError(f"Cannot create instance of {self.name}")
+        return self.factory(self, **kwargs)
+
+    def __str__(self) -> str:
+        return self.name
+
+    def __repr__(self) -> str:
+        return self.name
+
+
+class FakeMesh(MaxObject):
+    """Triangle mesh statistics of a geometry node."""
+
+    def __init__(
+        self,
+        num_verts: int = 8,
+        num_faces: int = 12,
+        num_tverts: int = 8,
+        num_maps: int = 2,
+    ):
+        super(FakeMesh, self).__init__(
+            numVerts=num_verts,
+            numFaces=num_faces,
+            numTVerts=num_tverts,
+        )
+        object.__setattr__(self, "num_maps", num_maps)
+
+
+class Modifier(MaxObject):
+    """Modifier with custom attributes."""
+
+    def __init__(self, max_class: MaxClass, **properties):
+        super(Modifier, self).__init__(**properties)
+        object.__setattr__(self, "max_class", max_class)
+        if not self.has_property("name"):
+            self.name = max_class.name
+
+    def __str__(self) -> str:
+        return f"{self.max_class.name}:{self.name}"
+
+
+class AttributeDefinition(object):
+    """Custom attribute definition created by an `attributes` script."""
+
+    def __init__(self, name: str, parameters: Dict[str, str]):
+        self.name = name
+        self.parameters = parameters
+
+    def create(self) -> MaxObject:
+        values = {}
+        for param, param_type in self.parameters.items():
+            if param_type.lower().endswith("tab"):
+                values[param] = []
+            elif param_type.lower() == "string":
+                values[param] = ""
+            else:
+                values[param] = None
+        return MaxObject(**values)
+
+
+class NodeTransformMonitor(MaxObject):
+    """Weak reference to a node as stored in `#maxObjectTab` parameters."""
+
+    def __init__(self, node: "Node"):
+        super(NodeTransformMonitor, self).__init__(node=node)
+
+
+class Node(MaxObject):
+    """Scene node.
+
+    Renaming and reparenting keep the scene index and children updated.
+    """
+
+    def __init__(self, scene: "Scene", max_class: MaxClass, name: str):
+        object.__setattr__(self, "_props", {})
+        object.__setattr__(self, "scene", scene)
+        object.__setattr__(self, "max_class", max_class)
+        # Ordered by creation like in 3ds Max, keyed by handle
+        object.__setattr__(self, "child_nodes", {})
+        object.__setattr__(self, "modifier_stack", [])
+        object.__setattr__(self, "user_props", {})
+        self._props.update({
+            "name": name,
+            "handle": scene.next_handle(),
+            "parent": None,
+            "baseobject": MaxObject(),
+            "isanimated": False,
+            "ishidden": False,
+            "mesh": None,
+            "pos": (0.0, 0.0, 0.0),
+            "rotation": (0.0, 0.0, 0.0, 1.0),
+            "scale": (1.0, 1.0, 1.0),
+        })
+
+    def __getattr__(self, name: str) -> Any:
+        lower = name.lower()
+        if lower == "children":
+            children = object.__getattribute__(self, "child_nodes")
+            return tuple(children.values())
+        if lower == "modifiers":
+            return tuple(object.__getattribute__(self, "modifier_stack"))
+        return super(Node, self).__getattr__(name)
+
+    def __setattr__(self, name: str, value: Any):
+        lower = name.lower()
+        if lower == "name":
+            self.scene.rename(self, value)
+        elif lower == "parent":
+            self.set_parent(value)
+        else:
+            super(Node, self).__setattr__(name, value)
+
+    def set_parent(self, parent: Optional["Node"]):
+        old_parent = self._props["parent"] or self.scene.root
+        handle = self._props["handle"]
+        old_parent.child_nodes.pop(handle, None)
+        self._props["parent"] = parent
+        (parent or self.scene.root).child_nodes[handle] = self
+
+    def __str__(self) -> str:
+        return f"${self.max_class.name}:{self._props['name']} @ [0,0,0]"
+
+    def __repr__(self) -> str:
+        return str(self)
+
+
+class Scene(object):
+    """Nodes of the scene with an index by name and by handle."""
+
+    def __init__(self, runtime: "FakeRuntime"):
+        self.runtime = runtime
+        self._handle = 0
+        self.root = Node(self, runtime.RootNodeClass, "Scene Root")
+        self.root_scene = MaxObject()
+        self.nodes: Dict[int, Node] = {}
+        self.nodes_by_name: Dict[str, List[Node]] = {}
+
+    def next_handle(self) -> int:
+        self._handle += 1
+        return self._handle
+
+    def add(self, node: Node, parent: Optional[Node] = None):
+        self.nodes[node.handle] = node
+        self.nodes_by_name.setdefault(node.name.lower(), []).append(node)
+        node.set_parent(parent)
+
+    def delete(self, node: Node):
+        for child in list(node.child_nodes.values()):
+            self.delete(child)
+        parent = node.parent or self.root
+        parent.child_nodes.pop(node.handle)
+        self.nodes.pop(node.handle, None)
+        self.nodes_by_name[node.name.lower()].remove(node)
+
+    def rename(self, node: Node, name: str):
+        old_name = node._props.get("name")
+        if node.handle in self.nodes:
+            self.nodes_by_name[old_name.lower()].remove(node)
+            self.nodes_by_name.setdefault(name.lower(), []).append(node)
+        node._props["name"] = name
+
+    def get_node_by_name(self, name: str) -> Optional[Node]:
+        nodes = self.nodes_by_name.get(str(name).lower())
+        return nodes[0] if nodes else None
+
+
+class RenderElementManager(MaxObject):
+    """Render element manager of the current renderer."""
+
+    def __init__(self):
+        super(RenderElementManager, self).__init__()
+        object.__setattr__(self, "elements", [])
+
+    def add_element(self, name: str, filename: str, enabled: bool = True):
+        element = MaxObject(elementname=name, enabled=enabled)
+        self.elements.append((element, filename))
+        return element
+
+    def NumRenderElements(self) -> int:
+        return len(self.elements)
+
+    def GetRenderElement(self, index: int) -> MaxObject:
+        return self.elements[index][0]
+
+    def GetRenderElementFilename(self, index: int) -> str:
+        return self.elements[index][1]
+
+    def RemoveAllRenderElements(self):
+        self.elements.clear()
+
+
+class Renderer(MaxObject):
+    """Renderer, prints as `<class>:<class>` like the pymxs wrapper."""
+
+    def __init__(self, max_class: MaxClass, **properties):
+        super(Renderer, self).__init__(**properties)
+        object.__setattr__(self, "max_class", max_class)
+
+    def __str__(self) -> str:
+        return f"{self.max_class.name}:{self.max_class.name}"
+
+
+class Callbacks(object):
+    """`callbacks` struct storing the registered scripts."""
+
+    def __init__(self):
+        self.scripts: Dict[str, List[Any]] = {}
+
+    def addScript(self, event, script, id=None):
+        self.scripts.setdefault(str(id), []).append((str(event), script))
+
+    def removeScripts(self, id=None):
+        self.scripts.pop(str(id), None)
+
+
+class FakeRuntime(object):
+    """In-memory `pymxs.runtime` with a single scene."""
+
+    def __init__(self):
+        object.__setattr__(self, "_globals", {})
+        object.__setattr__(self, "_stubbed_results", None)
+        self._define_classes()
+        self.callbacks = Callbacks()
+        self.custAttributes = MaxObject(add=self._add_custom_attribute)
+        self.maxOps = MaxObject(
+            getNodeByHandle=self._get_node_by_handle,
+            GetCurRenderElementMgr=lambda: self._render_element_manager,
+            isInNonInteractiveMode=lambda: True,
+        )
+        self.resetMaxFile()
+
+    # Globals are case-insensitive in MaxScript
+    def __getattr__(self, name: str) -> Any:
+        try:
+            return self._globals[name.lower()]
+        except KeyError:
+            pass
+        attr = _get_class_attributes(type(self)).get(name.lower())
+        if attr is None:
+            raise AttributeError(f"Unknown runtime global: {name}")
+        return object.__getattribute__(self, attr)
+
+    def __setattr__(self, name: str, value: Any):
+        self._globals[name.lower()] = value
+
+    def _define_classes(self):
+        geometry = MaxClass(self, "GeometryClass")
+        helper = MaxClass(self, "helper")
+        modifier = MaxClass(self, "modifier")
+        self.GeometryClass = geometry
+        self.helper = helper
+        self.modifier = modifier
+        self.shape = MaxClass(self, "shape")
+        self.light = MaxClass(self, "light")
+        self.camera = MaxClass(self, "camera")
+        self.RootNodeClass = MaxClass(self, "RootNodeClass")
+        for class_name in ("Box", "Sphere", "Editable_Poly", "Editable_mesh"):
+            setattr(self, class_name, MaxClass(
+                self, class_name, geometry, self._create_node))
+        for class_name in ("Container", "Dummy", "Point"):
+            setattr(self, class_name, MaxClass(
+                self, class_name, helper, self._create_node))
+        self.Line = MaxClass(self, "Line", self.shape, self._create_node)
+        self.Omnilight = MaxClass(
+            self, "Omnilight", self.light, self._create_node)
+        self.Freecamera = MaxClass(
+            self, "Freecamera", self.camera, self._create_node)
+        for class_name in ("EmptyModifier", "Edit_Poly", "TurboSmooth"):
+            setattr(self, class_name, MaxClass(
+                self, class_name, modifier,
+                lambda max_class, **kwargs: Modifier(max_class, **kwargs)
+            ))
+        for class_name in (
+            "Default_Scanline_Renderer",
+            "V_Ray_6_Hotfix_3",
+            "Arnold",
+            "Redshift_Renderer",
+        ):
+            setattr(self, class_name, MaxClass(
+                self, class_name,
+                factory=lambda max_class, **kwargs: Renderer(
+                    max_class, **kwargs)
+            ))
+
+    def _create_node(self, max_class: MaxClass, name: str = "", **kwargs):
+        node = Node(self.scene, max_class, name or self.uniqueName(
+            max_class.name))
+        if max_class.superclass is self.GeometryClass:
+            node.mesh = FakeMesh()
+        parent = kwargs.pop("parent", None)
+        for key, value in kwargs.items():
+            setattr(node, key, value)
+        self.scene.add(node, parent)
+        return node
+
+    # Scene
+    def resetMaxFile(self, *args):
+        """Start a new empty scene with scanline renderer."""
+        self.scene = Scene(self)
+        self.RootNode = self.scene.root
+        self.rootScene = self.scene.root_scene
+        self._render_element_manager = RenderElementManager()
+        self.renderers = MaxObject(
+            production=self.Default_Scanline_Renderer(),
+        )
+        self.renderers.current = self.renderers.production
+        self.rendOutputFilename = ""
+        self.rendTimeType = 1
+        self.rendStart = 0
+        self.rendEnd = 100
+        self.rendPickupFrames = ""
+        self.rendSaveFile = True
+        self.maxFilePath = ""
+        self.maxFileName = ""
+
+    def load_scene(self, scene: Scene):
+        """Make previously generated scene the current scene.
+
+        Render settings are kept as they are.
+        """
+        self.scene = scene
+        self.RootNode = scene.root
+        self.rootScene = scene.root_scene
+
+    @property
+    def objects(self) -> List[Node]:
+        return list(self.scene.nodes.values())
+
+    def getNodeByName(self, name: str) -> Optional[Node]:
+        return self.scene.get_node_by_name(name)
+
+    def _get_node_by_handle(self, handle: int) -> Optional[Node]:
+        return self.scene.nodes.get(int(handle))
+
+    def getHandleByAnim(self, node: Node) -> int:
+        return node.handle
+
+    def isValidNode(self, node: Any) -> bool:
+        return isinstance(node, Node) and node.handle in self.scene.nodes
+
+    def delete(self, nodes: Any):
+        if isinstance(nodes, Node):
+            nodes = [nodes]
+        for node in list(nodes):
+            self.scene.delete(node)
+
+    def uniqueName(self, prefix: str) -> str:
+        index = 1
+        while True:
+            name = f"{prefix}{index:03d}"
+            if self.scene.get_node_by_name(name) is None:
+                return name
+            index += 1
+
+    def classOf(self, value: Any) -> Any:
+        max_class = getattr(value, "max_class", None)
+        if isinstance(value, (Node, Modifier, Renderer)):
+            return max_class
+        if isinstance(value, MaxClass):
+            return MaxClass(self, "MAXClass")
+        if callable(value):
+            return MaxClass(self, "Primitive")
+        return MaxClass(self, type(value).__name__)
+
+    def superClassOf(self, value: Any) -> Any:
+        max_class = self.classOf(value)
+        return max_class.superclass
+
+    def isKindOf(self, value: Any, max_class: MaxClass) -> bool:
+        own_class = self.classOf(value)
+        return own_class is max_class or own_class.superclass is max_class
+
+    def Name(self, name: str) -> MaxName:
+        return MaxName(name)
+
+    # Selection and redraw
+    def GetCurrentSelection(self) -> List[Node]:
+        return [
+            node for node in self.scene.nodes.values()
+            if node._props.get("isselected")
+        ]
+
+    def select(self, nodes: Optional[Iterable[Node]] = None):
+        for node in self.scene.nodes.values():
+            node._props["isselected"] = False
+        if isinstance(nodes, Node):
+            nodes = [nodes]
+        for node in nodes or []:
+            node._props["isselected"] = True
+
+    def disableSceneRedraw(self):
+        pass
+
+    def enableSceneRedraw(self):
+        pass
+
+    def suspendEditing(self, *args, **kwargs):
+        pass
+
+    def resumeEditing(self, *args, **kwargs):
+        pass
+
+    # User properties
+    def getUserProp(self, node: Node, key: str) -> Any:
+        item = node.user_props.get(str(key).lower())
+        if item is None:
+            return None
+        return _parse_user_prop_value(item[1])
+
+    def setUserProp(self, node: Node, key: str, value: Any):
+        if isinstance(value, bool):
+            value = "true" if value else "false"
+        node.user_props[str(key).lower()] = (str(key), str(value))
+
+    def getUserPropBuffer(self, node: Node) -> str:
+        return "\r\n".join(
+            f"{key} = {value}" for key, value in node.user_props.values()
+        )
+
+    def setUserPropBuffer(self, node: Node, buffer: str):
+        node.user_props.clear()
+        for line in buffer.split("\r\n"):
+            key, sep, value = line.partition("=")
+            if sep:
+                node.user_props[key.strip().lower()] = (
+                    key.strip(), value.strip())
+
+    # Modifiers and custom attributes
+    def addModifier(self, node: Node, modifier: Modifier):
+        # New modifiers are added on top of the stack
+        node.modifier_stack.insert(0, modifier)
+
+    def NodeTransformMonitor(self, node: Node) -> Any:
+        return NodeTransformMonitor(node)
+
+    def _add_custom_attribute(
+        self, obj: MaxObject, definition: AttributeDefinition
+    ):
+        setattr(obj, definition.name, definition.create())
+
+    def isProperty(self, obj: Any, name: str) -> bool:
+        return isinstance(obj, MaxObject) and obj.has_property(str(name))
+
+    def hasProperty(self, obj: Any, name: str) -> bool:
+        return self.isProperty(obj, name)
+
+    def getProperty(self, obj: Any, name: str) -> Any:
+        return getattr(obj, str(name))
+
+    def setProperty(self, obj: Any, name: str, value: Any):
+        setattr(obj, str(name), value)
+
+    # MaxScript
+    def Execute(self, script: str) -> Any:
+        """Define functions and attributes of the script.
+
+        Returns:
+            Any: The last defined function or the attribute definition.
+        """
+        match = _ATTRIBUTES_REGEX.match(script)
+        if match:
+            parameters = {
+                name: param_type
+                for name, param_type in _PARAMETER_REGEX.findall(script)
+            }
+            return AttributeDefinition(match.group(1), parameters)
+
+        function = None
+        for fn_name in _FN_NAME_REGEX.findall(script):
+            implementation = MAXSCRIPT_FUNCTIONS.get(fn_name.lower())
+            if implementation is None:
+                raise NotImplementedError(
+                    f"MaxScript function '{fn_name}' is not implemented by "
+                    "the fake runtime.")
+            function = _bind(implementation, self)
+            setattr(self, fn_name, function)
+        if function is None:
+            raise NotImplementedError(
+                "Fake runtime cannot evaluate MaxScript: "
+                f"{script.strip()[:80]!r}")
+        return function
+
+
+    @contextlib.contextmanager
+    def stubbed_maxscript(self):
+        """Return results of the `fn ayon_*` functions in constant time.
+
+        Results are computed on the first call with the arguments and
+        returned on the following calls, until the context exits. The scene
+        must not change in the context.
+        """
+        object.__setattr__(self, "_stubbed_results", {})
+        try:
+            yield
+        finally:
+            object.__setattr__(self, "_stubbed_results", None)
+
+
+def _freeze(value: Any) -> Any:
+    """Get hashable key of MaxScript function arguments."""
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
+def _bind(implementation: Callable[..., Any], runtime: FakeRuntime):
+    def function(*args, **kwargs):
+        results = runtime._stubbed_results
+        if results is None:
+            return implementation(runtime, *args, **kwargs)
+        key = (
+            implementation, _freeze(args), _freeze(sorted(kwargs.items())))
+        try:
+            result = results[key]
+        except KeyError:
+            result = results[key] = implementation(runtime, *args, **kwargs)
+        except TypeError:
+            # Unhashable arguments
+            return implementation(runtime, *args, **kwargs)
+        # Callers may modify returned arrays
+        return list(result) if isinstance(result, list) else result
+    function.__name__ = implementation.__name__
+    return function
+
+
+def _parse_user_prop_value(value: str) -> Any:
+    """Convert user property like `getUserProp` does."""
+    if value == "true":
+        return True
+    if value == "false":
+        return False
+    try:
+        return int(value)
+    except ValueError:
+        pass
+    try:
+        return float(value)
+    except ValueError:
+        return value
+
+
+@maxscript_function("ayon_get_mesh_statistics")
+def _get_mesh_statistics(rt: FakeRuntime, nodes: List[Node]) -> List[list]:
+    result = []
+    for node in nodes:
+        stats = None
+        superclass = ""
+        if rt.isValidNode(node):
+            superclass = str(node.max_class.superclass)
+            mesh = node.mesh
+            if mesh is not None:
+                stats = [
+                    True, mesh.numVerts, mesh.numFaces, mesh.numTVerts,
+                    mesh.num_maps, superclass
+                ]
+        result.append(stats or [False, 0, 0, -1, 0, superclass])
+    return result
+
+
+@maxscript_function("ayon_get_node_handles")
+def _get_node_handles(rt: FakeRuntime, nodes: List[Node]) -> List[int]:
+    return [node.handle if rt.isValidNode(node) else 0 for node in nodes]
+
+
+@maxscript_function("ayon_anim_has_keys")
+def _anim_has_keys(rt: FakeRuntime, anim: Any, depth: int, max_depth: int):
+    return False
+
+
+@maxscript_function("ayon_get_animated_node_handles")
+def _get_animated_node_handles(
+    rt: FakeRuntime, nodes: List[Node], max_depth: int
+) -> List[int]:
+    return [
+        node.handle for node in nodes
+        if rt.isValidNode(node) and node.isAnimated
+    ]
+
+
+@maxscript_function("ayon_get_anim_handles")
+def _get_anim_handles(rt: FakeRuntime, nodes: List[Node]) -> List[int]:
+    return [node.handle if rt.isValidNode(node) else 0 for node in nodes]
+
+
+@maxscript_function("ayon_get_instance_nodes")
+def _get_instance_nodes(
+    rt: FakeRuntime, instance_ids: List[str]
+) -> List[list]:
+    instance_ids = set(instance_ids)
+    result = []
+    for node in rt.objects:
+        node_id = rt.getUserProp(node, "id")
+        if node_id is None or str(node_id) not in instance_ids:
+            continue
+        creator_id = rt.getUserProp(node, "creator_identifier")
+        result.append([
+            node,
+            node.name,
+            "" if creator_id is None else str(creator_id),
+            rt.getUserPropBuffer(node),
+        ])
+    return result
+
+
+@maxscript_function("ayon_create_instance_nodes")
+def _create_instance_nodes(
+    rt: FakeRuntime,
+    names: List[str],
+    members_list: List[List[Node]],
+    buffers: List[str],
+    attrs: AttributeDefinition,
+) -> List[Node]:
+    nodes = []
+    for name, members, buffer in zip(names, members_list, buffers):
+        node = rt.Container(name=name)
+        modifier = rt.EmptyModifier()
+        rt.addModifier(node, modifier)
+        modifier.name = "AYON Data"
+        rt.custAttributes.add(modifier, attrs)
+        modifier.AYONData.all_handles = [
+            rt.NodeTransformMonitor(node=member) for member in members
+        ]
+        modifier.AYONData.sel_list = [str(member) for member in members]
+        rt.setUserPropBuffer(node, buffer)
+        nodes.append(node)
+    return nodes
+
+
+@maxscript_function("ayon_get_descendants")
+def _get_descendants(
+    rt: FakeRuntime,
+    root_node: Node,
+    with_root: bool,
+    super_cls: Optional[MaxClass],
+    cls_name: Optional[str],
+    prop: Optional[str],
+    any_value: bool,
+) -> List[list]:
+    result = []
+    values = []
+    stack = [root_node]
+    while stack:
+        node = stack.pop()
+        matched = with_root or node is not root_node
+        if matched and super_cls is not None:
+            matched = rt.superClassOf(node) == super_cls
+        if matched and cls_name is not None:
+            matched = str(rt.classOf(node.baseObject)) == cls_name
+        prop_value = None
+        if matched and prop is not None:
+            prop_value = rt.getUserProp(node, prop)
+            if isinstance(prop_value, bool):
+                prop_value = "true" if prop_value else "false"
+            matched = prop_value is not None
+            if matched and any_value:
+                matched = prop_value not in ("false", "")
+        if matched:
+            result.append(node)
+            if prop is not None:
+                values.append(str(prop_value))
+        stack.extend(reversed(node.Children))
+    return [result, values]
+
+
+def install(runtime: Optional[FakeRuntime] = None) -> FakeRuntime:
+    """Register the fake runtime as `pymxs` module.
+
+    Args:
+        runtime (Optional[FakeRuntime]): Runtime to install, a new one
+            is created when not provided.
+
+    Returns:
+        FakeRuntime: Installed runtime.
+    """
+    module = sys.modules.get("pymxs")
+    if module is not None and not getattr(module, "IS_FAKE", False):
+        raise RuntimeError("Real pymxs is loaded, fake runtime not needed.")
+    if module is not None and runtime is None:
+        return module.runtime
+
+    module = types.ModuleType("pymxs")
+    module.IS_FAKE = True
+    module.runtime = runtime or FakeRuntime()
+    sys.modules["pymxs"] = module
+    return module.runtime
@@ -0,0 +1,303 @@
+# -*- coding: utf-8 -*-
+"""Synthetic scenes for the fake pymxs runtime.
+
+Generated scene is a mix of loaded containers with their content,
+publish instances with their members and plain geometry in nested
+hierarchies, resembling a production shot.
+"""
+from __future__ import annotations
+import json
+import random
+from dataclasses import dataclass, field
+from typing import Dict, List, Sequence
+
+from .fake_pymxs import FakeRuntime, MaxObject, Node, Scene
+
+
+# Kept in sync with `ayon_core.pipeline` so scenes can be generated
+# without `ayon_core` installed.
+AYON_CONTAINER_ID = "ayon.load.container"
+AYON_INSTANCE_ID = "ayon.create.instance"
+
+JSON_PREFIX = "JSON::"
+
+FOLDER_NAME = "sh010"
+
+SCENE_SIZES = (1_000, 10_000, 100_000, 500_000)
+
+AYON_DATA_ATTRIBUTE = """attributes "AYONData"
+(
+    parameters main rollout:OPparams
+    (
+        all_handles type:#maxObjectTab tabSize:0 tabSizeVariable:on
+        sel_list type:#stringTab tabSize:0 tabSizeVariable:on
+    )
+)
+"""
+
+PRODUCT_TYPES = ("model", "rig", "pointcache", "camera", "workfile")
+
+
+@dataclass
+class SceneSpec:
+    """Specification of a synthetic scene.
+
+    Attributes:
+        node_count (int): Total number of nodes in the scene.
+        container_ratio (float): Ratio of the nodes which are loaded
+            container nodes.
+        container_size (int): Number of nodes in each container.
+        instance_count (int): Number of publish instances.
+        instance_size (int): Number of members of each instance.
+        depth (int): Depth of the plain geometry hierarchies.
+        branching (int): Number of children of each hierarchy node.
+        seed (int): Seed of the random generator.
+    """
+    node_count: int
+    container_ratio: float = 0.01
+    container_size: int = 20
+    instance_count: int = 10
+    instance_size: int = 50
+    depth: int = 4
+    branching: int = 4
+    seed: int = 0
+
+
+@dataclass
+class SyntheticScene:
+    """Nodes of a generated scene by their role."""
+    spec: SceneSpec
+    max_scene: Scene
+    containers: List[Node] = field(default_factory=list)
+    instances: List[Node] = field(default_factory=list)
+    geometry: List[Node] = field(default_factory=list)
+
+    @property
+    def node_count(self) -> int:
+        return (
+            len(self.containers) + len(self.instances) + len(self.geometry)
+        )
+
+
+def _imprint(rt: FakeRuntime, node: Node, data: dict):
+    for key, value in data.items():
+        if isinstance(value, (dict, list)):
+            value = f"{JSON_PREFIX}{json.dumps(value)}"
+        rt.setUserProp(node, key, value)
+
+
+def _add_ayon_data(rt: FakeRuntime, node: Node, members: Sequence[Node]):
+    modifier = rt.EmptyModifier()
+    rt.addModifier(node, modifier)
+    modifier.name = "AYON Data"
+    rt.custAttributes.add(modifier, rt.Execute(AYON_DATA_ATTRIBUTE))
+    ayon_data = modifier.AYONData
+    ayon_data.all_handles = [
+        rt.NodeTransformMonitor(node=member) for member in members
+    ]
+    ayon_data.sel_list = [str(member) for member in members]
+
+
+def _create_hierarchy(
+    rt: FakeRuntime,
+    parent: Node,
+    count: int,
+    depth: int,
+    branching: int,
+    prefix: str,
+) -> List[Node]:
+    """Create up to `count` geometry nodes breadth first under `parent`."""
+    nodes = []
+    level = [parent]
+    for _ in range(depth):
+        next_level = []
+        for level_parent in level:
+            for _ in range(branching):
+                if len(nodes) >= count:
+                    return nodes
+                node = rt.Box(
+                    name=f"{prefix}_{len(nodes):06d}", parent=level_parent)
+                nodes.append(node)
+                next_level.append(node)
+        level = next_level
+    while len(nodes) < count:
+        nodes.append(rt.Box(
+            name=f"{prefix}_{len(nodes):06d}", parent=parent))
+    return nodes
+
+
+def generate_scene(rt: FakeRuntime, spec: SceneSpec) -> SyntheticScene:
+    """Reset the runtime scene and fill it with synthetic nodes.
+
+    Args:
+        rt (FakeRuntime): Fake runtime to generate the scene in.
+        spec (SceneSpec): Specification of the scene.
+
+    Returns:
+        SyntheticScene: Generated nodes.
+    """
+    rt.resetMaxFile()
+    rng = random.Random(spec.seed)
+    scene = SyntheticScene(spec, rt.scene)
+    remaining = spec.node_count
+
+    # Loaded containers with their content parented to them
+    container_count = int(spec.node_count * spec.container_ratio)
+    loaded_count = {}
+    for index in range(container_count):
+        if remaining <= 0:
+            break
+        # Named like loaders name the containers with `unique_namespace`
+        product_type = rng.choice(PRODUCT_TYPES)
+        name = f"{product_type}Main"
+        loaded_count[name] = loaded_count.get(name, 0) + 1
+        namespace = f"{FOLDER_NAME}_{name}_{loaded_count[name]:02d}_"
+        container = rt.Container(name=f"{namespace}:{name}_CON")
+        remaining -= 1
+        content_count = min(spec.container_size, remaining)
+        content = _create_hierarchy(
+            rt, container, content_count, 2, spec.branching,
+            f"{namespace}:{name}"
+        )
+        remaining -= len(content)
+        _add_ayon_data(rt, container, content)
+        _imprint(rt, container, {
+            "id": AYON_CONTAINER_ID,
+            "name": name,
+            "namespace": namespace,
+            "loader": "ModelAbcLoader",
+            "representation": f"{rng.getrandbits(128):032x}",
+            "project_name": "benchmark",
+            "productType": product_type,
+            "productBaseType": product_type,
+        })
+        scene.containers.append(container)
+        scene.geometry.extend(content)
+
+    # Plain geometry hierarchies, instance members are picked from them
+    instance_count = min(spec.instance_count, max(remaining, 0))
+    geometry_count = max(remaining - instance_count, 0)
+    roots_count = max(1, geometry_count // max(
+        1, spec.branching ** spec.depth))
+    created = 0
+    plain_geometry = []
+    for index in range(roots_count):
+        count = geometry_count - created
+        if index < roots_count - 1:
+            count = min(count, geometry_count // roots_count)
+        if count <= 0:
+            break
+        root = rt.Box(name=f"geo_root_{index:06d}")
+        nodes = [root] + _create_hierarchy(
+            rt, root, count - 1, spec.depth, spec.branching,
+            f"geo_{index:06d}"
+        )
+        created += len(nodes)
+        plain_geometry.extend(nodes)
+    scene.geometry.extend(plain_geometry)
+
+    # Publish instances
+    for index in range(instance_count):
+        product_type = PRODUCT_TYPES[index % len(PRODUCT_TYPES)]
+        product_name = f"{product_type}Main{index:03d}"
+        instance = rt.Container(name=product_name)
+        members = rng.sample(
+            plain_geometry, min(spec.instance_size, len(plain_geometry)))
+        _add_ayon_data(rt, instance, members)
+        _imprint(rt, instance, {
+            "id": AYON_INSTANCE_ID,
+            "folderPath": f"/shots/{FOLDER_NAME}",
+            "task": "modeling",
+            "productName": product_name,
+            "productType": product_type,
+            "productBaseType": product_type,
+            "creator_identifier": f"io.ayon.creators.max.{product_type}",
+            "active": True,
+            "variant": "Main",
+            "creator_attributes": {},
+            "publish_attributes": {
+                "ValidateNoAnimation": {"active": True},
+            },
+        })
+        scene.instances.append(instance)
+
+    return scene
+
+
+# Only the last generated scene is kept to limit memory of large scenes.
+_last_scene: Dict[int, SyntheticScene] = {}
+
+
+def get_scene(rt: FakeRuntime, node_count: int) -> SyntheticScene:
+    """Get synthetic scene of the node count as the current scene.
+
+    Scene generated with the default `SceneSpec` is reused when the same
+    node count is requested again.
+
+    Args:
+        rt (FakeRuntime): Fake runtime.
+        node_count (int): Number of nodes in the scene.
+
+    Returns:
+        SyntheticScene: Current scene.
+    """
+    scene = _last_scene.get(node_count)
+    if scene is None:
+        _last_scene.clear()
+        scene = generate_scene(rt, SceneSpec(node_count=node_count))
+        _last_scene[node_count] = scene
+    rt.load_scene(scene.max_scene)
+    return scene
+
+
+def configure_renderer(
+    rt: FakeRuntime,
+    renderer: str = "Redshift_Renderer",
+    render_elements: int = 8,
+    frames: str = "",
+    output: str = "C:/renders/sh010/beauty.exr",
+):
+    """Set renderer, render output and render elements of the scene.
+
+    Args:
+        rt (FakeRuntime): Fake runtime.
+        renderer (str): Renderer class name.
+        render_elements (int): Number of render elements to add.
+        frames (str): Custom frames, e.g. "1-50,60,70-100". The scene
+            frame range is rendered when empty.
+        output (str): Render output file path.
+    """
+    production = getattr(rt, renderer)()
+    if renderer.startswith("V_Ray_"):
+        production.output_rawfilename = ""
+        production.output_splitfilename = output
+        production.output_splitgbuffer = True
+    elif renderer == "Arnold":
+        directory, _, filename = output.rpartition("/")
+        production.AOVManager = MaxObject(
+            outputPath=directory,
+            drivers=[MaxObject(
+                multipart=False,
+                filenameSuffix=filename.rpartition(".")[0],
+            )],
+        )
+    elif renderer == "Redshift_Renderer":
+        production.separateAovFiles = True
+        production.OutputExrMultipart = False
+    rt.renderers.production = production
+    rt.renderers.current = production
+    rt.rendOutputFilename = output
+    if frames:
+        rt.rendTimeType = 4
+        rt.rendPickupFrames = frames
+
+    manager = rt.maxOps.GetCurRenderElementMgr()
+    manager.RemoveAllRenderElements()
+    directory, _, filename = output.rpartition("/")
+    name, _, extension = filename.rpartition(".")
+    for index in range(render_elements):
+        element_name = f"AOV{index:02d}"
+        manager.add_element(
+            element_name,
+            f"{directory}/{name}_{element_name}.{extension}"
+        )
@@ -0,0 +1,69 @@
+"""Checks of the growth of scene query times with the scene size.
+
+A linear function gets about ten times slower on ten times larger scene,
+a quadratic one about a hundred times. Growth exponent above
+`MAX_GROWTH_EXPONENT` fails the check. MaxScript functions of the fake
+runtime are stubbed, so only the Python side of the queries is checked.
+"""
+import math
+import time
+
+import pytest
+
+pytest.importorskip("ayon_core")
+
+from ayon_max.api import lib, pipeline  # noqa: E402
+from ayon_max.api.plugin import MaxCreatorBase  # noqa: E402
+
+from benchmarks import fake_pymxs  # noqa: E402
+from benchmarks.scene import AYON_CONTAINER_ID, get_scene  # noqa: E402
+
+
+rt = fake_pymxs.install()
+
+SMALL_SCENE = 10_000
+LARGE_SCENE = 100_000
+MAX_GROWTH_EXPONENT = 1.4
+REPEATS = 5
+
+SCENE_QUERIES = {
+    "get_containers": pipeline.get_containers,
+    "pipeline.ls": lambda: list(pipeline.ls()),
+    "lsattr": lambda: lib.lsattr("id", AYON_CONTAINER_ID),
+    "get_all_children": lambda: lib.get_all_children(rt.RootNode),
+    "cache_instance_data": lambda: MaxCreatorBase.cache_instance_data({}),
+}
+
+
+def _best_time(func) -> float:
+    durations = []
+    with rt.stubbed_maxscript():
+        # Warm up computes results of the stubbed MaxScript functions
+        func()
+        for _ in range(REPEATS):
+            start = time.perf_counter()
+            func()
+            durations.append(time.perf_counter() - start)
+    return min(durations)
+
+
+@pytest.fixture(scope="module")
+def query_times():
+    """Best times of the scene queries on the small and large scene."""
+    times = {}
+    for node_count in (SMALL_SCENE, LARGE_SCENE):
+        get_scene(rt, node_count)
+        for name, func in SCENE_QUERIES.items():
+            times[(name, node_count)] = _best_time(func)
+    return times
+
+
+@pytest.mark.parametrize("name", list(SCENE_QUERIES))
+def test_scene_query_scales_linearly(query_times, name):
+    small = query_times[(name, SMALL_SCENE)]
+    large = query_times[(name, LARGE_SCENE)]
+    exponent = math.log(large / small) / math.log(LARGE_SCENE / SMALL_SCENE)
+    assert exponent < MAX_GROWTH_EXPONENT, (
+        f"{name} took {small:.4f}s on {SMALL_SCENE} nodes and {large:.4f}s "
+        f"on {LARGE_SCENE} nodes, growth exponent {exponent:.2f}"
+    )
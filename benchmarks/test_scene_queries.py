@@ -0,0 +1,84 @@
+"""Benchmarks of the scene query hot paths of `ayon_max.api`."""
+import pytest
+
+pytest.importorskip("ayon_core")
+
+from ayon_max.api import lib, pipeline  # noqa: E402
+from ayon_max.api.plugin import MaxCreatorBase  # noqa: E402
+from ayon_max.api.lib_renderproducts import RenderProducts  # noqa: E402
+
+from benchmarks import fake_pymxs  # noqa: E402
+from benchmarks.scene import (  # noqa: E402
+    AYON_CONTAINER_ID,
+    FOLDER_NAME,
+    configure_renderer,
+)
+
+
+rt = fake_pymxs.install()
+
+PROJECT_SETTINGS = {
+    "max": {
+        "RenderSettings": {
+            "image_format": "exr",
+            "redshift_render_settings": {"separate_aov_files": True},
+        },
+    },
+}
+
+
+def test_lsattr(run_benchmark):
+    run_benchmark(lambda: lib.lsattr("id", AYON_CONTAINER_ID), "lsattr")
+
+
+def test_read(run_benchmark, current_scene):
+    containers = current_scene.containers
+    run_benchmark(
+        lambda: [lib.read(container) for container in containers], "read")
+
+
+def test_imprint(run_benchmark, current_scene):
+    data = [
+        (container.name, lib.read(container))
+        for container in current_scene.containers
+    ]
+
+    def imprint():
+        for name, container_data in data:
+            lib.imprint(name, container_data)
+
+    run_benchmark(imprint, "imprint")
+
+
+def test_pipeline_ls(run_benchmark):
+    run_benchmark(lambda: list(pipeline.ls()), "pipeline.ls")
+
+
+def test_unique_namespace(run_benchmark):
+    run_benchmark(
+        lambda: lib.unique_namespace(
+            "modelMain_", prefix=f"{FOLDER_NAME}_", suffix="_"),
+        "unique_namespace"
+    )
+
+
+def test_get_all_children(run_benchmark):
+    run_benchmark(
+        lambda: lib.get_all_children(rt.RootNode), "get_all_children")
+
+
+def test_cache_instance_data(run_benchmark):
+    run_benchmark(
+        lambda: MaxCreatorBase.cache_instance_data({}),
+        "cache_instance_data"
+    )
+
+
+@pytest.mark.parametrize(
+    "renderer", ["Redshift_Renderer", "V_Ray_6_Hotfix_3", "Arnold"])
+def test_get_render_products(run_benchmark, renderer):
+    configure_renderer(rt, renderer, render_elements=16, frames="1-1000")
+    run_benchmark(
+        lambda: RenderProducts(PROJECT_SETTINGS).get_render_products(),
+        f"get_render_products[{renderer}]"
+    )
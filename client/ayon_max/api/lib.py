@@ -8,7 +8,7 @@ from pathlib import Path
 from functools import partial
 import pyblish.api
 import re
-from typing import Any, Dict, Union
+from typing import Any, Dict, List, Tuple, Union
 
 from ayon_core.pipeline import (
     Anatomy,
@@ -17,19 +17,16 @@ from ayon_core.pipeline import (
     get_current_task_name,
     get_current_host_name,
     colorspace,
-    registered_host,
     AYON_INSTANCE_ID,
     AVALON_INSTANCE_ID,
 )
 from ayon_core.lib import StringTemplate, get_version_from_path
-from ayon_core.tools.utils import SimplePopup
-from ayon_core.settings import get_project_settings
 from ayon_core.pipeline.context_tools import (
     get_current_task_entity
 )
 from ayon_core.pipeline.template_data import get_template_data_with_names
-from ayon_core.pipeline.create import CreateContext
-from ayon_core.style import load_stylesheet
+from ayon_max.api.lib_hierarchy import get_descendants
+from ayon_max.api.lib_settings import get_current_project_settings
 
 
 try:
@@ -40,8 +37,43 @@ except ImportError:
 
 
 JSON_PREFIX = "JSON::"
+# Environment variable enabling the minimal host profile of batch workers
+HEADLESS_PROFILE_ENV = "AYON_MAX_HEADLESS"
 log = logging.getLogger("ayon_max")
 
+# Node, name, creator identifier and user properties of instance nodes
+# collected in a single pass over the scene objects.
+MS_INSTANCE_NODES = """
+fn ayon_get_instance_nodes instance_ids =
+(
+    local result = #()
+    for n in objects do
+    (
+        local node_id = getUserProp n "id"
+        if node_id != undefined and
+            (findItem instance_ids (node_id as string)) > 0 do
+        (
+            local creator_id = getUserProp n "creator_identifier"
+            if creator_id == undefined do creator_id = ""
+            append result #(
+                n, n.name, creator_id as string, getUserPropBuffer n
+            )
+        )
+    )
+    result
+)
+"""
+
+# Parents all valid nodes to the parent node in a single call.
+MS_PARENT_NODES = """
+fn ayon_parent_nodes nodes parent_node =
+(
+    for n in nodes where isValidNode n and n != parent_node do
+        n.parent = parent_node
+    ok
+)
+"""
+
 
 def _sanitize_template_data(value: Any) -> Any:
     """Function to sanitize template data to avoid
@@ -82,8 +114,19 @@ def get_main_window():
     raise RuntimeError('Count not find 3dsMax main window.')
 
 
-def imprint(node_name: str, data: dict) -> bool:
-    node = rt.GetNodeByName(node_name)
+def imprint(node_name: Union[str, Any], data: dict) -> bool:
+    """Imprint data to user properties of the node.
+
+    Args:
+        node_name (Union[str, rt.Node]): Node or its name.
+        data (dict): Data to imprint.
+
+    Returns:
+        bool: Whether the node exists.
+    """
+    node = node_name
+    if isinstance(node_name, str):
+        node = rt.GetNodeByName(node_name)
     if not node:
         return False
 
@@ -112,26 +155,27 @@ def lsattr(
         list of nodes.
     """
     root = rt.RootNode if root is None else rt.GetNodeByName(root)
+    return get_descendants(
+        root,
+        user_prop=attr,
+        value=str(value) if value else None,
+        include_root=True
+    )
 
-    def output_node(node, nodes):
-        nodes.append(node)
-        for child in node.Children:
-            output_node(child, nodes)
 
-    nodes = []
-    output_node(root, nodes)
-    return [
-        n for n in nodes
-        if rt.GetUserProp(n, attr) == value
-    ] if value else [
-        n for n in nodes
-        if rt.GetUserProp(n, attr)
-    ]
+def parse_user_prop_buffer(props: str) -> dict:
+    """Parse user property buffer of a node.
 
+    Values with `JSON::` prefix are decoded and MaxScript booleans are
+    converted, other values are kept as strings.
 
-def read(container) -> dict:
+    Args:
+        props (str): User property buffer.
+
+    Returns:
+        dict: Parsed user properties.
+    """
     data = {}
-    props = rt.GetUserPropBuffer(container)
     # this shouldn't happen but let's guard against it anyway
     if not props:
         return data
@@ -144,8 +188,7 @@ def read(container) -> dict:
             continue
 
         value = value.strip()
-        if isinstance(value.strip(), str) and \
-                value.startswith(JSON_PREFIX):
+        if value.startswith(JSON_PREFIX):
             with contextlib.suppress(json.JSONDecodeError):
                 value = json.loads(value[len(JSON_PREFIX):])
 
@@ -158,6 +201,52 @@ def read(container) -> dict:
 
         data[key.strip()] = value
 
+    return data
+
+
+def format_user_prop_buffer(data: dict) -> str:
+    """Format data to user property buffer the way `imprint` stores it.
+
+    Args:
+        data (dict): Data to format.
+
+    Returns:
+        str: User property buffer.
+    """
+    lines = []
+    for key, value in data.items():
+        if isinstance(value, (dict, list)):
+            value = f"{JSON_PREFIX}{json.dumps(value)}"
+        elif isinstance(value, bool):
+            value = "true" if value else "false"
+        elif value is None:
+            value = "undefined"
+        lines.append(f"{key} = {value}")
+    return "\r\n".join(lines)
+
+
+def get_instance_nodes() -> List[Tuple[Any, str, str, dict]]:
+    """Get instance nodes with their data in a single MaxScript call.
+
+    Returns:
+        List[Tuple[rt.Node, str, str, dict]]: Instance node, its name,
+            creator identifier and parsed user properties.
+    """
+    get_instance_nodes = rt.Execute(MS_INSTANCE_NODES)
+    return [
+        (node, str(name), str(creator_id), parse_user_prop_buffer(props))
+        for node, name, creator_id, props in get_instance_nodes(
+            [AYON_INSTANCE_ID, AVALON_INSTANCE_ID])
+    ]
+
+
+def read(container) -> dict:
+    props = rt.GetUserPropBuffer(container)
+    # this shouldn't happen but let's guard against it anyway
+    if not props:
+        return {}
+
+    data = parse_user_prop_buffer(props)
     data["instance_node"] = container.Name
 
     return data
@@ -208,16 +297,21 @@ def get_all_children(parent, node_type=None):
     Returns:
         list: list of all children of the parent node
     """
-    def list_children(node):
-        children = []
-        for c in node.Children:
-            children.append(c)
-            children = children + list_children(c)
-        return children
-    child_list = list_children(parent)
+    return get_descendants(parent, super_class=node_type)
+
 
-    return ([x for x in child_list if rt.SuperClassOf(x) == node_type]
-            if node_type else child_list)
+def parent_nodes(nodes, parent):
+    """Parent nodes to the parent node in a single MaxScript call.
+
+    Args:
+        nodes (list): Nodes to parent, invalid nodes are skipped.
+        parent (3dsmax Node): New parent of the nodes.
+    """
+    nodes = [node for node in nodes if node is not None]
+    if not nodes:
+        return
+    rt.Execute(MS_PARENT_NODES)
+    rt.ayon_parent_nodes(nodes, parent)
 
 
 def get_current_renderer():
@@ -296,8 +390,7 @@ def get_default_render_folder(
     """
     render_data = _sanitize_template_data(dict(data))
     if project_setting is None:
-        project_name = get_current_project_name()
-        project_setting = get_project_settings(project_name)
+        project_setting = get_current_project_settings()
 
     work_dir, render_data = get_work_default_directory_and_data(render_data)
     render_data["work"] = work_dir
@@ -353,9 +446,7 @@ def get_multipass_setting(renderer, project_setting=None):
         bool: True if multipass is enabled, False otherwise.
     """
     if project_setting is None:
-        project_setting = get_project_settings(
-            get_current_project_name()
-        )
+        project_setting = get_current_project_settings()
     render_settings = (
         project_setting["max"]["RenderSettings"]
     )
@@ -440,7 +531,7 @@ def get_frame_range(task_entity=None) -> Union[Dict[str, Any], None]:
     }
 
 
-def reset_frame_range(fps: bool = True):
+def reset_frame_range(fps: bool = True, task_entity=None):
     """Set frame range to current folder.
     This is part of 3dsmax documentation:
 
@@ -450,19 +541,25 @@ def reset_frame_range(fps: bool = True):
     frameRate: A System Global variable which lets you get
             and set an Integer value that defines the current
             scene frame rate in frames-per-second.
+
+    Args:
+        fps (bool): Set the frame rate too.
+        task_entity (dict): Task entity, current task entity is fetched
+            when not provided.
     """
+    if task_entity is None:
+        task_entity = get_current_task_entity(fields={"attrib"})
     if fps:
-        rt.frameRate = float(get_fps_for_current_context())
+        rt.frameRate = float(task_entity["attrib"]["fps"])
 
-    frame_range = get_frame_range()
+    frame_range = get_frame_range(task_entity)
 
     set_timeline(
         frame_range["frameStartHandle"], frame_range["frameEndHandle"])
     set_render_frame_range(
         frame_range["frameStartHandle"], frame_range["frameEndHandle"])
 
-    project_name = get_current_project_name()
-    settings = get_project_settings(project_name).get("max")
+    settings = get_current_project_settings().get("max")
     auto_key_default_key_time = settings.get(
         "auto_key_default", {}).get("defualt_key_time")
     rt.maxOps.autoKeyDefaultKeyTime = auto_key_default_key_time
@@ -491,8 +588,7 @@ def validate_unit_scale(project_settings=None):
     if is_headless():
         return
     if project_settings is None:
-        project_name = get_current_project_name()
-        project_settings = get_project_settings(project_name).get("max")
+        project_settings = get_current_project_settings().get("max")
     scene_scale_enabled = project_settings["unit_scale_settings"]["enabled"]
     if not scene_scale_enabled:
         log.info("Using default scale display type.")
@@ -504,6 +600,9 @@ def validate_unit_scale(project_settings=None):
     ):
         return
 
+    from ayon_core.tools.utils import SimplePopup
+    from ayon_core.style import load_stylesheet
+
     parent = get_main_window()
     dialog = SimplePopup(parent=parent)
     dialog.setWindowTitle("Wrong Unit Scale")
@@ -522,8 +621,7 @@ def set_unit_scale(project_settings=None, scene_units=False):
         scene_units (bool, optional): whether to set scene units.
     """
     if project_settings is None:
-        project_name = get_current_project_name()
-        project_settings = get_project_settings(project_name).get("max")
+        project_settings = get_current_project_settings().get("max")
     scale_settings = project_settings["unit_scale_settings"]
     scene_scale_enabled = scale_settings.get("enabled", False)
     if scene_scale_enabled or scene_units:
@@ -552,7 +650,8 @@ def convert_unit_scale():
 def set_context_settings(resolution=True,
                          frame_range=True,
                          scene_units=False,
-                         colorspace=True):
+                         colorspace=True,
+                         task_entity=None):
     """Apply the project settings from the project definition
 
     Settings can be overwritten by an folder if the folder.attrib contains
@@ -562,13 +661,19 @@ def set_context_settings(resolution=True,
         frame range
         resolution
 
+    Args:
+        task_entity (dict): Task entity to take the settings from, current
+            task entity is fetched when not provided.
+
     Returns:
         None
     """
+    if task_entity is None and (resolution or frame_range):
+        task_entity = get_current_task_entity(fields={"attrib"})
     if resolution:
-        reset_scene_resolution()
+        reset_scene_resolution(task_entity)
     if frame_range:
-        reset_frame_range()
+        reset_frame_range(task_entity=task_entity)
     if scene_units:
         set_unit_scale(scene_units=scene_units)
     if colorspace:
@@ -596,6 +701,18 @@ def is_headless():
     return rt.maxops.isInNonInteractiveMode()
 
 
+def is_headless_profile():
+    """Check if host should install only what batch jobs need.
+
+    The profile is used by render jobs and 3dsmaxbatch workers which do
+    not need the menu, scene callbacks or project folder setup.
+    """
+    return (
+        os.getenv(HEADLESS_PROFILE_ENV) == "1"
+        or os.getenv("AYON_RENDER_JOB") == "1"
+    )
+
+
 def set_timeline(frameStart, frameEnd):
     """Set frame range for timeline editor in Max
     """
@@ -631,6 +748,9 @@ def check_colorspace():
         max_config_data = colorspace.get_current_context_imageio_config_preset()
         if max_config_data and color_mgr.Mode != rt.Name("OCIO_Custom"):
             if not is_headless():
+                from ayon_core.tools.utils import SimplePopup
+                from ayon_core.style import load_stylesheet
+
                 dialog = SimplePopup(parent=parent)
                 dialog.setWindowTitle("Warning: Wrong OCIO Mode")
                 dialog.set_message("This scene has wrong OCIO "
@@ -978,17 +1098,19 @@ def get_ayon_data(container_modifier):
         return container_modifier.openPypeData
 
 
-def update_content_on_context_change():
-    """
-    This will update scene content to match new folder on context change
-    """
+def update_content_on_context_change() -> int:
+    """Update instances in the scene to match current context.
 
-    host = registered_host()
-    create_context = CreateContext(host, discover_publish_plugins=False)
-    task_entity = create_context.get_current_task_entity()
+    Only `folderPath`, `task` and the frame range creator attributes
+    which differ from the current context are imprinted to the instance
+    nodes, other user properties are left untouched.
 
+    Returns:
+        int: Number of updated instance nodes.
+    """
+    task_entity = get_current_task_entity(fields={"name", "attrib"})
     instance_values = {
-        "folderPath": create_context.get_current_folder_path(),
+        "folderPath": get_current_folder_path(),
         "task": task_entity["name"],
     }
     creator_attribute_values = {
@@ -998,32 +1120,35 @@ def update_content_on_context_change():
         "handleEnd": float(task_entity["attrib"]["handleEnd"]),
     }
 
-    has_changes = False
-    for instance in create_context.instances:
-        for key, value in instance_values.items():
-            if key not in instance or instance[key] == value:
-                continue
+    updated_count = 0
+    for node, name, _, data in get_instance_nodes():
+        changes = {
+            key: value
+            for key, value in instance_values.items()
+            if key in data and data[key] != value
+        }
 
-            # Update instance value
-            print(f"Updating {instance.product_name} {key} to: {value}")
-            instance[key] = value
-            has_changes = True
-
-        creator_attributes = instance.creator_attributes
-        for key, value in creator_attribute_values.items():
-            if (
-                    key not in creator_attributes
-                    or creator_attributes[key] == value
-            ):
-                continue
+        creator_attributes = data.get("creator_attributes")
+        if isinstance(creator_attributes, dict):
+            changed_attributes = {
+                key: value
+                for key, value in creator_attribute_values.items()
+                if key in creator_attributes
+                and creator_attributes[key] != value
+            }
+            if changed_attributes:
+                creator_attributes.update(changed_attributes)
+                changes["creator_attributes"] = creator_attributes
+
+        if not changes:
+            continue
 
-            # Update instance creator attribute value
-            print(f"Updating {instance.product_name} {key} to: {value}")
-            creator_attributes[key] = value
-            has_changes = True
+        log.debug(f"Updating {name}: {', '.join(changes)}")
+        imprint(node, changes)
+        updated_count += 1
 
-    if has_changes:
-        create_context.save_changes()
+    log.info(f"Updated {updated_count} instance(s) to current context.")
+    return updated_count
 
 
 def is_general_default_output_regex_matched(filename) -> bool:
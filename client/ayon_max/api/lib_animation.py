@@ -0,0 +1,98 @@
+# -*- coding: utf-8 -*-
+"""Library of functions querying animation of nodes in bulk."""
+from __future__ import annotations
+from typing import Any, List
+
+try:
+    from pymxs import runtime as rt
+
+except ImportError:
+    rt = None
+
+
+# Default depth of the sub-anim tree searched for keys.
+ANIMATION_SCAN_DEPTH = 8
+
+# Walks transform controllers, modifiers and base object parameters of
+# all nodes and returns handles of the nodes with any keys.
+MS_ANIMATED_NODE_HANDLES = """
+fn ayon_anim_has_keys anim depth max_depth =
+(
+    local found = false
+    if anim != undefined and depth <= max_depth do
+    (
+        if isProperty anim #controller do
+        (
+            local ctrl = anim.controller
+            found = ctrl != undefined and (numKeys ctrl) > 0
+        )
+        if not found and isProperty anim #numSubs do
+        (
+            local sub = depth + 1
+            for i = 1 to anim.numSubs while not found do
+                found = ayon_anim_has_keys (getSubAnim anim i) sub max_depth
+        )
+    )
+    found
+)
+
+fn ayon_get_animated_node_handles nodes max_depth =
+(
+    local handles = #()
+    for n in nodes where isValidNode n do
+    (
+        local animated = n.isAnimated
+        if not animated do
+            animated = ayon_anim_has_keys n[#transform] 1 max_depth
+        if not animated do
+        (
+            for m in n.modifiers while not animated do
+                animated = ayon_anim_has_keys m 1 max_depth
+        )
+        if not animated do
+            animated = ayon_anim_has_keys n.baseObject 1 max_depth
+        if animated do append handles n.handle
+    )
+    handles
+)
+"""
+
+
+def get_animated_node_handles(
+    nodes: List[Any], max_depth: int = ANIMATION_SCAN_DEPTH
+) -> List[int]:
+    """Get handles of the animated nodes in a single MaxScript call.
+
+    Node is animated when it has keys on its transform controllers,
+    on its modifiers or on parameters of its base object.
+
+    Args:
+        nodes (List[rt.Node]): Nodes to check.
+        max_depth (int): Depth of the sub-anim tree searched for keys.
+
+    Returns:
+        List[int]: Handles of the animated nodes.
+    """
+    if not nodes:
+        return []
+    get_handles = rt.Execute(MS_ANIMATED_NODE_HANDLES)
+    handles = get_handles(list(nodes), max_depth)
+    return [int(handle) for handle in handles]
+
+
+def get_animated_nodes(
+    nodes: List[Any], max_depth: int = ANIMATION_SCAN_DEPTH
+) -> List[Any]:
+    """Get animated nodes.
+
+    Args:
+        nodes (List[rt.Node]): Nodes to check.
+        max_depth (int): Depth of the sub-anim tree searched for keys.
+
+    Returns:
+        List[rt.Node]: Animated nodes.
+    """
+    return [
+        rt.maxOps.getNodeByHandle(handle)
+        for handle in get_animated_node_handles(nodes, max_depth)
+    ]
@@ -0,0 +1,90 @@
+# -*- coding: utf-8 -*-
+"""Library of functions traversing node hierarchies iteratively."""
+from __future__ import annotations
+from typing import Any, List, Optional
+
+try:
+    from pymxs import runtime as rt
+
+except ImportError:
+    rt = None
+
+
+# Walks the hierarchy depth first with an explicit stack and returns the
+# nodes matching the filters, in the same order as a recursive walk.
+# Values of the user property are returned as strings for the nodes, so
+# they can be compared case-sensitively, MaxScript `==` is not.
+MS_GET_DESCENDANTS = """
+fn ayon_get_descendants root_node with_root super_cls cls_name prop any_value =
+(
+    local result = #()
+    local values = #()
+    local stack = #(root_node)
+    while stack.count > 0 do
+    (
+        local n = stack[stack.count]
+        deleteItem stack stack.count
+        local matched = with_root or n != root_node
+        if matched and super_cls != undefined do
+            matched = (superClassOf n) == super_cls
+        if matched and cls_name != undefined do
+            matched = ((classOf n.baseObject) as string) == cls_name
+        local prop_value = undefined
+        if matched and prop != undefined do
+        (
+            prop_value = getUserProp n prop
+            matched = prop_value != undefined
+            if matched and any_value do
+                matched = prop_value != false and prop_value != ""
+        )
+        if matched do
+        (
+            append result n
+            if prop != undefined do append values (prop_value as string)
+        )
+        local children = n.children
+        for i = children.count to 1 by -1 do append stack children[i]
+    )
+    #(result, values)
+)
+"""
+
+
+def get_descendants(
+    root: Any,
+    super_class: Optional[Any] = None,
+    class_name: Optional[str] = None,
+    user_prop: Optional[str] = None,
+    value: Optional[str] = None,
+    include_root: bool = False,
+) -> List[Any]:
+    """Get descendants of the node matching the filters.
+
+    The hierarchy is walked and filtered in a single MaxScript call, the
+    user property value is compared case-sensitively in Python.
+
+    Args:
+        root (rt.Node): Root node of the hierarchy.
+        super_class (Optional[rt.MAXSuperClass]): Superclass of the nodes,
+            e.g. `rt.GeometryClass`.
+        class_name (Optional[str]): Class name of the node base object,
+            e.g. "AlembicObject".
+        user_prop (Optional[str]): Name of user property the nodes have.
+        value (Optional[str]): Value of the user property, any non empty
+            value matches when not provided.
+        include_root (bool): Include the root node.
+
+    Returns:
+        List[rt.Node]: Matching nodes in depth first order.
+    """
+    get_descendants_fn = rt.Execute(MS_GET_DESCENDANTS)
+    nodes, values = get_descendants_fn(
+        root, include_root, super_class, class_name, user_prop,
+        value is None
+    )
+    if user_prop is None or value is None:
+        return list(nodes)
+    return [
+        node for node, prop_value in zip(nodes, values)
+        if prop_value == value
+    ]
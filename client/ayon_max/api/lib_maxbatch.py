@@ -0,0 +1,284 @@
+# -*- coding: utf-8 -*-
+"""Library of functions to run 3dsmaxbatch jobs."""
+from __future__ import annotations
+import os
+import sys
+import queue
+import logging
+import platform
+import threading
+import subprocess
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional
+
+try:
+    import psutil
+
+except ImportError:
+    psutil = None
+
+from ayon_max.api.lib import HEADLESS_PROFILE_ENV
+
+
+log = logging.getLogger("ayon_max")
+
+# Interval in seconds the memory watchdog checks the job processes.
+MEMORY_POLL_INTERVAL = 1.0
+
+
+def get_maxbatch_executable() -> str:
+    """Get path to 3dsmaxbatch executable next to current 3dsmax.
+
+    The executable can be overridden with `AYON_MAX_BATCH_EXECUTABLE`
+    environment variable, e.g. to run the jobs with a fake executable.
+
+    Returns:
+        str: Path to 3dsmaxbatch executable.
+    """
+    maxbatch_exe = os.getenv("AYON_MAX_BATCH_EXECUTABLE")
+    if maxbatch_exe:
+        return maxbatch_exe
+
+    maxbatch_exe = os.path.join(
+        os.path.dirname(sys.executable), "3dsmaxbatch")
+    maxbatch_exe = maxbatch_exe.replace("\\", "/")
+    if platform.system().lower() == "windows":
+        maxbatch_exe += ".exe"
+        maxbatch_exe = os.path.normpath(maxbatch_exe)
+    return maxbatch_exe
+
+
+def get_maxbatch_environment() -> Dict[str, str]:
+    """Get environment of 3dsmaxbatch processes.
+
+    The processes install the host with the headless profile, so they
+    skip the menu, scene callbacks and project folder setup.
+
+    Returns:
+        Dict[str, str]: Environment variables.
+    """
+    env = os.environ.copy()
+    env[HEADLESS_PROFILE_ENV] = "1"
+    return env
+
+
+class MaxBatchJob(object):
+    """Single 3dsmaxbatch process running a python script on a scene.
+
+    Args:
+        name (str): Name of the job used for logging, e.g. camera name.
+        script_path (str): Path to the python script to run.
+        scene_file (str): Path to the scene file to open.
+    """
+
+    def __init__(self, name: str, script_path: str, scene_file: str):
+        self.name = name
+        self.script_path = script_path.replace("\\", "/")
+        self.scene_file = scene_file.replace("\\", "/")
+        self.returncode = None
+
+    def get_args(self, executable: str) -> List[str]:
+        """Get command line arguments of the job.
+
+        Args:
+            executable (str): Path to 3dsmaxbatch executable.
+
+        Returns:
+            List[str]: Command line arguments.
+        """
+        return [executable, self.script_path, "-sceneFile", self.scene_file]
+
+
+def _get_job_cores(
+    slot: int, cores_per_job: int, cpu_count: int
+) -> List[int]:
+    """Get CPU cores reserved for the worker slot.
+
+    Cores are assigned to the slots in consecutive blocks so jobs running
+    at the same time never share cores unless there are not enough cores.
+    """
+    start = (slot * cores_per_job) % cpu_count
+    return [(start + offset) % cpu_count for offset in range(cores_per_job)]
+
+
+def _set_process_affinity(
+    process: subprocess.Popen, cores: List[int], logger: logging.Logger
+):
+    """Pin process to given CPU cores."""
+    if psutil is None:
+        logger.warning(
+            "Setting core affinity requires 'psutil'. "
+            "Running job without core affinity."
+        )
+        return
+    try:
+        psutil.Process(process.pid).cpu_affinity(cores)
+    except (psutil.NoSuchProcess, psutil.AccessDenied) as exc:
+        logger.warning(
+            f"Failed to set core affinity of process {process.pid}: {exc}")
+
+
+def _watch_memory(
+    job: MaxBatchJob,
+    process: subprocess.Popen,
+    memory_limit_mb: int,
+    logger: logging.Logger
+):
+    """Kill the process when its memory exceeds the limit."""
+    limit = memory_limit_mb * 1024 * 1024
+    try:
+        ps_process = psutil.Process(process.pid)
+    except psutil.Error:
+        return
+
+    while process.poll() is None:
+        try:
+            rss = ps_process.memory_info().rss
+            rss += sum(
+                child.memory_info().rss
+                for child in ps_process.children(recursive=True)
+            )
+        except psutil.Error:
+            return
+        if rss > limit:
+            logger.error(
+                f"[{job.name}] Memory limit of {memory_limit_mb} MB "
+                "exceeded. Terminating job."
+            )
+            process.kill()
+            return
+        try:
+            process.wait(timeout=MEMORY_POLL_INTERVAL)
+        except subprocess.TimeoutExpired:
+            continue
+
+
+def _run_job(
+    job: MaxBatchJob,
+    executable: str,
+    cores: Optional[List[int]],
+    memory_limit_mb: int,
+    logger: logging.Logger
+) -> int:
+    """Run the job and stream its output to the logger.
+
+    Returns:
+        int: Return code of the process.
+    """
+    args = job.get_args(executable)
+    logger.info(f"[{job.name}] Running: {' '.join(args)}")
+    kwargs = {}
+    if platform.system().lower() == "windows":
+        kwargs["creationflags"] = subprocess.CREATE_NO_WINDOW
+
+    process = subprocess.Popen(
+        args,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        universal_newlines=True,
+        encoding="utf-8",
+        errors="replace",
+        env=get_maxbatch_environment(),
+        **kwargs
+    )
+    if cores:
+        _set_process_affinity(process, cores, logger)
+
+    watchdog = None
+    if memory_limit_mb and psutil is None:
+        logger.warning(
+            "Memory limit requires 'psutil'. "
+            "Running job without memory limit."
+        )
+    elif memory_limit_mb:
+        watchdog = threading.Thread(
+            target=_watch_memory,
+            args=(job, process, memory_limit_mb, logger),
+            daemon=True
+        )
+        watchdog.start()
+
+    for line in process.stdout:
+        line = line.rstrip()
+        if line:
+            logger.info(f"[{job.name}] {line}")
+    process.wait()
+    if watchdog is not None:
+        watchdog.join()
+
+    job.returncode = process.returncode
+    logger.info(f"[{job.name}] Finished with exit code {process.returncode}")
+    return process.returncode
+
+
+def run_maxbatch_jobs(
+    jobs: List[MaxBatchJob],
+    executable: Optional[str] = None,
+    max_workers: int = 1,
+    cores_per_job: int = 0,
+    memory_limit_mb: int = 0,
+    logger: Optional[logging.Logger] = None,
+) -> Dict[str, int]:
+    """Run 3dsmaxbatch jobs concurrently on a pool of processes.
+
+    Output of each process is streamed to the logger line by line prefixed
+    with the job name.
+
+    Args:
+        jobs (List[MaxBatchJob]): Jobs to run.
+        executable (Optional[str]): Path to 3dsmaxbatch executable.
+            Defaults to `get_maxbatch_executable()`.
+        max_workers (int): Number of processes running at the same time.
+        cores_per_job (int): Number of CPU cores each process is pinned to.
+            Zero disables core affinity.
+        memory_limit_mb (int): Memory limit of each process in megabytes.
+            Zero disables the limit.
+        logger (Optional[logging.Logger]): Logger for the job output.
+
+    Raises:
+        RuntimeError: When any of the jobs failed.
+
+    Returns:
+        Dict[str, int]: Return codes by job name.
+    """
+    if logger is None:
+        logger = log
+    if executable is None:
+        executable = get_maxbatch_executable()
+
+    max_workers = max(1, min(max_workers, len(jobs)))
+    cpu_count = os.cpu_count() or 1
+    cores_per_job = min(cores_per_job, cpu_count)
+
+    slots = queue.Queue()
+    for slot in range(max_workers):
+        slots.put(slot)
+
+    def _run(job):
+        slot = slots.get()
+        try:
+            cores = None
+            if cores_per_job > 0:
+                cores = _get_job_cores(slot, cores_per_job, cpu_count)
+            return _run_job(
+                job, executable, cores, memory_limit_mb, logger
+            )
+        finally:
+            slots.put(slot)
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        returncodes = dict(
+            zip(
+                (job.name for job in jobs),
+                executor.map(_run, jobs)
+            )
+        )
+
+    failed = [
+        name for name, returncode in returncodes.items() if returncode != 0
+    ]
+    if failed:
+        raise RuntimeError(
+            "3dsmaxbatch jobs failed: {}".format(", ".join(failed))
+        )
+    return returncodes
@@ -0,0 +1,119 @@
+# -*- coding: utf-8 -*-
+"""Library of functions querying mesh data of nodes in bulk."""
+from __future__ import annotations
+from typing import Any, List, NamedTuple, Tuple
+
+try:
+    from pymxs import runtime as rt
+
+except ImportError:
+    rt = None
+
+
+# Evaluates the mesh of each node only once and returns its statistics
+# for all nodes in a single call.
+MS_MESH_STATISTICS = """
+fn ayon_get_mesh_statistics nodes =
+(
+    local result = #()
+    for n in nodes do
+    (
+        local superclass = ""
+        local stats = undefined
+        if isValidNode n do
+        (
+            superclass = (superClassOf n) as string
+            if isProperty n #mesh do
+            (
+                local m = n.mesh
+                if m != undefined do
+                (
+                    local tverts = -1
+                    if isProperty m #numTVerts do tverts = m.numTVerts
+                    stats = #(
+                        true, m.numVerts, m.numFaces, tverts,
+                        meshop.getNumMaps m, superclass
+                    )
+                )
+            )
+        )
+        if stats == undefined do
+            stats = #(false, 0, 0, -1, 0, superclass)
+        append result stats
+    )
+    result
+)
+"""
+
+MS_NODE_HANDLES = """
+fn ayon_get_node_handles nodes =
+(
+    for n in nodes collect (if isValidNode n then n.handle else 0)
+)
+"""
+
+MESH_STATISTICS_KEY = "meshStatistics"
+
+
+class MeshStatistics(NamedTuple):
+    """Statistics of the mesh of a node.
+
+    `num_tverts` is -1 when the mesh does not have texture vertices
+    property at all.
+    """
+    is_mesh: bool
+    num_verts: int
+    num_faces: int
+    num_tverts: int
+    num_map_channels: int
+    superclass: str
+
+
+def get_mesh_statistics(nodes: List[Any]) -> List[MeshStatistics]:
+    """Get mesh statistics of the nodes in a single MaxScript call.
+
+    Args:
+        nodes (List[rt.Node]): Nodes to get the mesh statistics for.
+
+    Returns:
+        List[MeshStatistics]: Mesh statistics in order of the nodes.
+    """
+    if not nodes:
+        return []
+    get_statistics = rt.Execute(MS_MESH_STATISTICS)
+    return [
+        MeshStatistics(
+            bool(stats[0]),
+            int(stats[1]),
+            int(stats[2]),
+            int(stats[3]),
+            int(stats[4]),
+            str(stats[5]),
+        )
+        for stats in get_statistics(list(nodes))
+    ]
+
+
+def get_instance_mesh_statistics(instance) -> List[Tuple[Any, MeshStatistics]]:
+    """Get mesh statistics of the instance members.
+
+    The statistics are computed once and cached on the instance by the
+    handles of the members, so all model validators share the same mesh
+    evaluation as long as the members do not change.
+
+    Args:
+        instance (pyblish.api.Instance): Publish instance with members.
+
+    Returns:
+        List[Tuple[rt.Node, MeshStatistics]]: Members with their statistics.
+    """
+    members = instance.data.get("members") or []
+    handles = tuple(
+        rt.Execute(MS_NODE_HANDLES)(list(members)) if members else ()
+    )
+    cached = instance.data.get(MESH_STATISTICS_KEY)
+    if cached is not None and cached[0] == handles:
+        return cached[1]
+    statistics = list(zip(members, get_mesh_statistics(members)))
+    instance.data[MESH_STATISTICS_KEY] = (handles, statistics)
+    return statistics
@@ -4,7 +4,11 @@
 # https://help.autodesk.com/view/ARNOL/ENU/?guid=arnold_for_3ds_max_ax_maxscript_commands_ax_renderview_commands_html
 from __future__ import annotations
 import os
-from typing import Dict, Any
+import re
+import bisect
+import itertools
+from collections.abc import Sequence
+from typing import Dict, Any, Iterator, Optional, Tuple, Union
 
 try:
     from pymxs import runtime as rt
@@ -14,182 +18,322 @@ except ImportError:
 
 
 from ayon_max.api.lib import (
-    get_current_renderer,
     get_multipass_setting,
     reformat_filename,
 )
-from ayon_core.pipeline import get_current_project_name
-from ayon_core.settings import get_project_settings
-from ayon_max.api.lib_rendersettings import is_supported_renderer
+from ayon_max.api.lib_settings import get_current_project_settings
+from ayon_max.api.lib_rendersettings import (
+    RenderElementData,
+    RendererSnapshot,
+    is_supported_renderer,
+)
+
+
+# Frame token used to resolve the filename pattern of a render product
+# once instead of formatting and reformatting the filename for each frame.
+_FRAME_TOKEN = "<FRAME>"
+_FRAME_PADDING = 4
+
+
+def parse_frame_ranges(frames: str) -> Tuple[range, ...]:
+    """Parse custom frames string to frame ranges.
+
+    Args:
+        frames (str): Frames string, e.g. "0,5-10,100-120".
+
+    Returns:
+        Tuple[range, ...]: Frame ranges in order of the frames string.
+    """
+    frame_ranges = []
+    for part in frames.split(","):
+        part = part.strip()
+        if not part:
+            continue
+        match = re.match(r"^(-?\d+)\s*(?:-\s*(-?\d+))?$", part)
+        if not match:
+            raise ValueError(f"Invalid custom frames value: {part}")
+        start = int(match.group(1))
+        end = match.group(2)
+        end = int(end) if end is not None else start
+        if end < start:
+            start, end = end, start
+        frame_ranges.append(range(start, end + 1))
+    return tuple(frame_ranges)
+
+
+def get_render_frame_ranges() -> Tuple[range, ...]:
+    """Get frame ranges rendered with the current render settings.
+
+    Custom frame sequences (`rendTimeType` 4, e.g. `1,3,5-12`) are parsed
+    from `rendPickupFrames`, otherwise `rendStart` to `rendEnd` is used.
+
+    Returns:
+        Tuple[range, ...]: Frame ranges to render.
+    """
+    if rt.rendTimeType == 4:
+        pickup_frames = rt.rendPickupFrames
+        if pickup_frames:
+            return parse_frame_ranges(pickup_frames)
+
+    return (range(int(rt.rendStart), int(rt.rendEnd) + 1),)
+
+
+class RenderProductSequence(Sequence):
+    """Compact expected files of a single render product.
+
+    Holds the path template of the product and its frame ranges. The file
+    paths are expanded lazily on iteration or indexing, so a long sequence
+    does not hold a string for each frame.
+
+    Args:
+        head (str): File path part before the frame number.
+        tail (str): File path part after the frame number.
+        frame_ranges (Tuple[range, ...]): Frame ranges of the sequence.
+        padding (int): Frame number padding.
+    """
+
+    def __init__(
+        self,
+        head: str,
+        tail: str,
+        frame_ranges: Tuple[range, ...],
+        padding: int = _FRAME_PADDING
+    ):
+        self.head = head
+        self.tail = tail
+        self.frame_ranges = tuple(frame_ranges)
+        self.padding = padding
+        self._offsets = list(
+            itertools.accumulate(len(r) for r in self.frame_ranges)
+        )
+
+    @property
+    def template(self) -> str:
+        """Path template with `{frame}` formatting key."""
+        return f"{self.head}{{frame:0{self.padding}d}}{self.tail}"
+
+    @property
+    def frames(self) -> Iterator[int]:
+        """Iterate frames of the sequence."""
+        return itertools.chain.from_iterable(self.frame_ranges)
+
+    def get_filepath(self, frame: int) -> str:
+        """Get file path of the product for the frame.
+
+        Args:
+            frame (int): Frame number.
+
+        Returns:
+            str: File path.
+        """
+        return f"{self.head}{frame:0{self.padding}d}{self.tail}"
+
+    def __len__(self) -> int:
+        return self._offsets[-1] if self._offsets else 0
+
+    def __iter__(self) -> Iterator[str]:
+        for frame in self.frames:
+            yield self.get_filepath(frame)
+
+    def __getitem__(self, index: Union[int, slice]):
+        if isinstance(index, slice):
+            return list(self)[index]
+        length = len(self)
+        if index < 0:
+            index += length
+        if not 0 <= index < length:
+            raise IndexError("RenderProductSequence index out of range")
+        range_index = bisect.bisect_right(self._offsets, index)
+        start = self._offsets[range_index - 1] if range_index else 0
+        return self.get_filepath(
+            self.frame_ranges[range_index][index - start]
+        )
+
+    def __repr__(self) -> str:
+        ranges = ",".join(
+            f"{r.start}-{r.stop - 1}" for r in self.frame_ranges
+        )
+        return f"<RenderProductSequence {self.template} [{ranges}]>"
 
 
 class RenderProducts(object):
     """Class for managing render products in 3ds Max."""
-    def __init__(self, project_settings: Dict[str, Any] = None):
+    def __init__(
+        self,
+        project_settings: Dict[str, Any] = None,
+        snapshot: Optional[RendererSnapshot] = None,
+    ):
         """Initialize the RenderProducts class.
 
         Args:
             project_settings (Dict[str, Any], optional): Project settings
                 dictionary. Defaults to None.
+            snapshot (Optional[RendererSnapshot]): Renderer snapshot to
+                read the render settings from. Captured from the scene
+                on first use when not provided.
         """
         self._project_settings = project_settings
         if not self._project_settings:
-            self._project_settings = get_project_settings(
-                get_current_project_name()
-            )
+            self._project_settings = get_current_project_settings()
+        self._snapshot = snapshot
 
-    def get_render_products(self) -> Dict[str, list[str]]:
+    @property
+    def snapshot(self) -> RendererSnapshot:
+        """Renderer snapshot the render products are resolved from."""
+        if self._snapshot is None:
+            self._snapshot = RendererSnapshot()
+        return self._snapshot
+
+    def get_render_products(self) -> Dict[str, RenderProductSequence]:
         """Get render output file paths for the current scene.
 
         Handles both beauty and AOV extraction with shared setup logic.
         Always includes the beauty pass; optionally includes render elements/AOVs.
+        Custom frame sequences (e.g. `0,5-10,100-120`) are supported.
+
+        Returns:
+            Dict[str, RenderProductSequence]: A dictionary containing render
+                output file paths. Beauty key is "beauty"; AOV keys are named
+                after the render element (e.g., "Cryptomatte", "Alpha").
+        """
+        return self._get_render_products_for_extension(self.image_format())
+
+    def _get_render_products_for_extension(
+        self, extension: str
+    ) -> Dict[str, RenderProductSequence]:
+        """Get beauty and AOV render products for the image extension.
+
+        Args:
+            extension (str): The image extension.
 
         Returns:
-            Dict[str, list[str]]: A dictionary containing render output file paths.
-                Beauty key is "beauty"; AOV keys are named after the render element
-                (e.g., "Cryptomatte", "Alpha").
+            Dict[str, RenderProductSequence]: Render products by AOV name.
         """
-        extension = self.image_format()
-        start_frame = int(rt.rendStart)
-        end_frame = int(rt.rendEnd)
-        # todo: Support Custom Frames sequences 0,5-10,100-120
-        # we can add filtering frames list to get expected frames list
-        # instead of using start and end frame
-        # but if the custom frame disabled, we can still use start and end frame
-        # to get expected frames list
-        render_dict: Dict[str, list[str]] = {}
+        snapshot = self.snapshot
+        renderer_name = snapshot.renderer_name
+        frame_ranges = snapshot.frame_ranges
+        render_dict: Dict[str, RenderProductSequence] = {}
 
         # Always add beauty pass
-        beauty_files = self.get_expected_beauty(start_frame, end_frame, extension)
-        render_dict["beauty"] = beauty_files
+        render_dict["beauty"] = self.get_expected_beauty(
+            extension, frame_ranges=frame_ranges
+        )
 
         # Optionally add AOVs
-        renderer = get_current_renderer()
-        renderer_name = str(renderer).split(":")[0]
         render_elements = self.get_render_element_and_filepath(extension)
-        if render_elements and not self.is_arnold_exr(renderer, extension):
+        if render_elements and not self.is_arnold_exr(
+            snapshot.renderer, extension
+        ):
             for aov_name, aov_filepath in render_elements:
-                aov_expected_files = self.get_expected_files(
+                render_dict[aov_name] = self.get_expected_files(
                     aov_filepath,
-                    start_frame,
-                    end_frame,
                     aov_name,
-                    renderer_name
+                    renderer_name,
+                    frame_ranges=frame_ranges
                 )
-                render_dict[aov_name] = aov_expected_files
         return render_dict
 
     def get_multiple_render_products(
             self, outputs: list[str], cameras: list[str]
-    ) -> Dict[str, list[str]]:
+    ) -> Dict[str, RenderProductSequence]:
         """Get render output file paths for multiple cameras.
 
         Combines beauty and AOV extraction into a single method to eliminate
         duplicate setup code. Always includes beauty passes; optionally includes
         render elements/AOVs.
 
+        The renderer, frame ranges and render elements are resolved once per
+        image extension and the resulting products are shared by cameras.
+
         Args:
             outputs (list[str]): A list of output file paths.
             cameras (list[str]): A list of camera names.
 
         Returns:
-            Dict[str, list[str]]: A dictionary containing render output file
-                paths for each camera (e.g., "camera01_beauty", "camera01_Cryptomatte").
+            Dict[str, RenderProductSequence]: A dictionary containing render
+                output file paths for each camera (e.g., "camera01_beauty",
+                "camera01_Cryptomatte").
         """
-        renderer = get_current_renderer()
-        renderer_name = str(renderer).split(":")[0]
-        render_output_frames: Dict[str, list[str]] = {}
+        render_output_frames: Dict[str, RenderProductSequence] = {}
+        products_by_ext: Dict[str, Dict[str, RenderProductSequence]] = {}
 
         for output, camera in zip(outputs, cameras):
             camera = camera.replace(":", "_")
-            filename, ext = os.path.splitext(output)
-            filename = filename.replace(".", "")
+            _, ext = os.path.splitext(output)
             ext = ext.replace(".", "")
-            start_frame = int(rt.rendStart)
-            end_frame = int(rt.rendEnd)
-
-            # Always add beauty pass
-            beauty_files = self.get_expected_beauty(start_frame, end_frame, ext)
-            render_output_frames[f"{camera}_beauty"] = beauty_files
-
-            # Add AOVs
-            render_elements = self.get_render_element_and_filepath(ext)
-            if render_elements and not self.is_arnold_exr(renderer, ext):
-                for aov_name, aov_filepath in render_elements:
-                    aov_expected_files = self.get_expected_files(
-                        aov_filepath,
-                        start_frame,
-                        end_frame,
-                        aov_name,
-                        renderer_name
-                    )
-                    render_output_frames[f"{camera}_{aov_name}"] = aov_expected_files
+
+            products = products_by_ext.get(ext)
+            if products is None:
+                products = self._get_render_products_for_extension(ext)
+                products_by_ext[ext] = products
+
+            for aov_name, product in products.items():
+                render_output_frames[f"{camera}_{aov_name}"] = product
 
         return render_output_frames
 
     def get_expected_beauty(
-            self, start_frame: int, end_frame: int, extension: str
-    ) -> list[str]:
+            self,
+            extension: str,
+            frame_ranges: Optional[Tuple[range, ...]] = None,
+    ) -> RenderProductSequence:
         """Get expected beauty render output file paths for each frame.
 
         Args:
-            start_frame (int): The starting frame number.
-            end_frame (int): The ending frame number.
             extension (str): The file extension for the output files.
+            frame_ranges (Optional[Tuple[range, ...]]): Frame ranges of the
+                output, the current render frame ranges when not provided.
 
         Returns:
-            list[str]: A list of expected beauty render output file paths.
+            RenderProductSequence: Expected beauty render output file paths.
         """
-        renderer = get_current_renderer()
-        renderer_name = str(renderer).split(":")[0]
+        snapshot = self.snapshot
+        renderer_name = snapshot.renderer_name
         if renderer_name.startswith("V_Ray_"):
-            output_path = self.get_vray_render_output(renderer, extension)
+            output_path = self.get_vray_render_output(snapshot, extension)
         elif renderer_name == "Arnold":
-            output_path = self.get_arnold_render_output(renderer, extension)
+            output_path = self.get_arnold_render_output(snapshot, extension)
         else:
-            output_path = rt.rendOutputFilename
+            output_path = snapshot.render_output
 
         return self.get_expected_files(
             output_path,
-            start_frame,
-            end_frame,
             "",
-            renderer_name
+            renderer_name,
+            frame_ranges=frame_ranges
         )
 
     def get_render_element_outputfilename(
         self,
-        renderer: Any,
-        render_elem: Any,
-        index: int,
+        snapshot: RendererSnapshot,
+        render_element: RenderElementData,
         image_format: str,
         is_multipass: bool
     ) -> str:
         """Get the output filename for a render element.
 
         Args:
-            renderer (Any, rt.Renderers.Current): The renderer instance.
-            render_elem (Any, rt.RenderTarget): The render element instance.
-            index (int): The index of the render element.
+            snapshot (RendererSnapshot): The renderer snapshot.
+            render_element (RenderElementData): The render element.
             image_format (str): The image format.
             is_multipass (bool): Whether it is a multipass render element.
 
         Returns:
             str: The output filename for the render element.
         """
-        renderer_name = str(renderer).split(":")[0]
+        renderer_name = snapshot.renderer_name
         if renderer_name.startswith("V_Ray_"):
             return self.get_vray_render_output(
-                renderer,
+                snapshot,
                 image_format,
                 is_render_element=is_multipass
             )
 
         elif renderer_name.startswith("Arnold"):
-            return self.get_arnold_render_output(renderer, image_format)
+            return self.get_arnold_render_output(snapshot, image_format)
 
         elif is_supported_renderer(renderer_name):
-            return render_elem.GetRenderElementFilename(index)
+            return render_element.filename
 
         else:
             raise RuntimeError(
@@ -199,106 +343,91 @@ class RenderProducts(object):
 
     def get_vray_render_output(
         self,
-        vr_renderer: Any,
+        snapshot: RendererSnapshot,
         image_format: str,
         is_render_element: bool = False
     ) -> str:
         """Get the V-Ray render output filename.
 
         Args:
-            vr_renderer (Any, rt.Renderers.Current): The V-Ray renderer instance.
+            snapshot (RendererSnapshot): The V-Ray renderer snapshot.
             image_format (str): The image format.
             is_render_element (bool, optional): Whether it is a render element. Defaults to False.
 
         Returns:
             str: The V-Ray render output filename.
         """
-        vray_settings = (
-            vr_renderer.V_Ray_settings
-            if "GPU" in str(vr_renderer)
-            else vr_renderer
-        )
         if (
             not is_render_element
             and image_format == "exr"
-            and not vray_settings.output_rawfilename
+            and not snapshot.vray_rawfilename
         ):
-            return getattr(vray_settings, "output_splitfilename", "") or rt.rendOutputFilename
-        output_attr = (
-            "output_rawfilename"
+            return snapshot.vray_splitfilename or snapshot.render_output
+        render_output = (
+            snapshot.vray_rawfilename
             if not is_render_element and image_format == "exr"
-            else "output_splitfilename"
+            else snapshot.vray_splitfilename
         )
-        render_output = getattr(vray_settings, output_attr)
-        return render_output if render_output else rt.rendOutputFilename
+        return render_output if render_output else snapshot.render_output
 
-    def get_arnold_render_output(self, arnold_renderer: Any, extension: str) -> str:
+    def get_arnold_render_output(
+        self, snapshot: RendererSnapshot, extension: str
+    ) -> str:
         """Get the Arnold render output filename.
 
         Args:
-            arnold_renderer (Any, rt.Renderers.Current): The Arnold renderer instance.
+            snapshot (RendererSnapshot): The Arnold renderer snapshot.
             extension (str): The file extension for the output.
 
         Raises:
-            RuntimeError: If the Arnold renderer does not have an
-                AOVManager attribute.
-            RuntimeError: If the Arnold AOVManager does not have
-                a drivers attribute.
             RuntimeError: If the Arnold AOVManager does not have any drivers.
-            RuntimeError: If the Arnold AOVManager does not have an
-                outputPath attribute.
 
         Returns:
             str: The Arnold render output filename.
         """
-        aov_manager = arnold_renderer.AOVManager
-        drivers = aov_manager.drivers
-        if not drivers:
+        if snapshot.arnold_driver is None:
             raise RuntimeError("Arnold AOVManager does not have any drivers.")
 
-        output_dir = aov_manager.outputPath
-        # Getting the first driver
-        driver = drivers[0]
-        return f"{output_dir}/{driver.filenameSuffix}.{extension}"
+        # Using the first driver
+        output_dir = snapshot.arnold_output_path
+        return f"{output_dir}/{snapshot.arnold_filename_suffix}.{extension}"
 
     def get_expected_files(
         self,
         filepath: str,
-        start_frame: int,
-        end_frame: int,
         aov_name: str,
         renderer_name: str,
-    ) -> list[str]:
+        frame_ranges: Optional[Tuple[range, ...]] = None,
+    ) -> RenderProductSequence:
         """Get expected files
 
         Args:
             filepath (str): filepath of the render output.
-            start_frame (int): start frame of the render sequence.
-            end_frame (int): end frame of the render sequence.
             aov_name (str): name of the AOV.
             renderer_name (str): name of the renderer.
+            frame_ranges (Optional[Tuple[range, ...]]): Frame ranges of the
+                render sequence, the current render frame ranges when not
+                provided.
 
         Returns:
-            list[str]: List of expected file paths.
+            RenderProductSequence: Expected file paths.
         """
-        expected_aovs: list[str] = []
+        if frame_ranges is None:
+            frame_ranges = get_render_frame_ranges()
         if not filepath:
-            return expected_aovs
+            return RenderProductSequence("", "", ())
         directory = os.path.dirname(filepath)
         filename = os.path.basename(filepath)
         name, ext = os.path.splitext(filename)
         name = name.lstrip(".")
         aov_name = aov_name.strip()
-        for frame in range(start_frame, end_frame + 1):
-            aov_filename =  f"{name}.{frame:04d}{ext}"
-            expected_aov = os.path.join(directory, aov_filename)
-            if aov_name and renderer_name.startswith("V_Ray_"):
-                aov_filename = f"{name}.{aov_name}.{frame:04d}{ext}"
-            aov_filename = reformat_filename(aov_filename)
-            expected_aov = os.path.join(directory, aov_filename)
-            expected_aovs.append(expected_aov)
-
-        return expected_aovs
+        aov_filename = f"{name}.{_FRAME_TOKEN}{ext}"
+        if aov_name and renderer_name.startswith("V_Ray_"):
+            aov_filename = f"{name}.{aov_name}.{_FRAME_TOKEN}{ext}"
+        aov_filename = reformat_filename(aov_filename)
+        head, tail = os.path.join(directory, aov_filename).split(
+            _FRAME_TOKEN, 1)
+        return RenderProductSequence(head, tail, frame_ranges)
 
     def get_render_element_and_filepath(
             self, image_format: str
@@ -312,37 +441,34 @@ class RenderProducts(object):
             list[tuple[str, str]]: List of tuples containing render element
                 names and their corresponding file paths.
         """
-        renderer = get_current_renderer()
-        renderer_name = str(renderer).split(":")[0]
+        snapshot = self.snapshot
+        renderer_name = snapshot.renderer_name
         expected_elements: list[tuple[str, str]] = []
-        render_elem = rt.maxOps.GetCurRenderElementMgr()
-        render_elem_num = render_elem.NumRenderElements()
         is_multipass = get_multipass_setting(
             renderer_name, self._project_settings
         )
-        if render_elem_num < 1:
+        if not snapshot.render_elements:
             return expected_elements
         # get render elements from the renders
-        for index in range(render_elem_num):
-            renderlayer = render_elem.GetRenderElement(index)
+        for render_element in snapshot.render_elements:
             if self.get_render_element_by_multipass(
-                renderer_name, renderlayer, is_multipass, image_format
+                renderer_name, render_element, is_multipass, image_format
             ):
-                renderpass = str(renderlayer.elementname)
                 renderlayer_filepath = self.get_render_element_outputfilename(
-                    renderer,
-                    render_elem,
-                    index,
+                    snapshot,
+                    render_element,
                     image_format,
                     is_multipass
                 )
-                expected_elements.append((renderpass, str(renderlayer_filepath)))
+                expected_elements.append(
+                    (render_element.name, str(renderlayer_filepath)))
 
         if renderer_name.startswith("V_Ray_"):
-            additional_render_elements = self._get_vray_additional_outputs(renderer, is_multipass)
+            additional_render_elements = self._get_vray_additional_outputs(
+                snapshot, is_multipass)
             for render_element in additional_render_elements:
                 filepath = self.get_vray_render_output(
-                    renderer, image_format, is_render_element=True
+                    snapshot, image_format, is_render_element=True
                 )
                 expected_elements.append((render_element, str(filepath)))
 
@@ -351,14 +477,14 @@ class RenderProducts(object):
     def get_render_element_by_multipass(
             self,
             renderer_name: str,
-            renderlayer: Any,
+            renderlayer: RenderElementData,
             multipass: bool,
             image_format: str) -> bool:
         """Get render element name based on multipass setting.
 
         Args:
             renderer_name (str): The name of the renderer.
-            renderlayer (Any, rt.RenderTarget): The render layer instance.
+            renderlayer (RenderElementData): The render element.
             multipass (bool): Whether multipass is enabled.
             image_format (str): The image format of the render output.
 
@@ -373,16 +499,18 @@ class RenderProducts(object):
         # always write it out as a separate file, regardless of whether
         # 'separate AOVs' is enabled or not
         if renderer_name == "Redshift_Renderer" and image_format == "exr":
-            if "Cryptomatte" in renderlayer.elementname:
+            if "Cryptomatte" in renderlayer.name:
                 return renderlayer.enabled
 
         return renderlayer.enabled and multipass
 
-    def _get_vray_additional_outputs(self, renderer: Any, is_multipass: bool) -> list[str]:
+    def _get_vray_additional_outputs(
+        self, snapshot: RendererSnapshot, is_multipass: bool
+    ) -> list[str]:
         """Get additional V-Ray outputs like Alpha and RGB_color.
 
         Args:
-            renderer (Any, rt.Renderers.Current): V-Ray renderer instance
+            snapshot (RendererSnapshot): V-Ray renderer snapshot
             is_multipass (bool): Whether multipass is enabled
 
         Returns:
@@ -391,9 +519,9 @@ class RenderProducts(object):
         render_name = []
         if not is_multipass:
             return render_name
-        if hasattr(renderer, 'output_splitAlpha') and renderer.output_splitAlpha:
+        if snapshot.vray_split_alpha:
             render_name.append("Alpha")
-        if hasattr(renderer, 'output_splitRGB') and renderer.output_splitRGB:
+        if snapshot.vray_split_rgb:
             render_name.append("RGB_color")
 
         return render_name
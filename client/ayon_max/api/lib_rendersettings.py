@@ -1,4 +1,5 @@
 import os
+from typing import Any, NamedTuple, Optional, Tuple
 
 
 try:
@@ -9,8 +10,6 @@ except ImportError:
 
 
 from ayon_core.lib import Logger
-from ayon_core.settings import get_project_settings
-from ayon_core.pipeline import get_current_project_name
 from ayon_core.pipeline.context_tools import get_current_folder_entity
 
 from ayon_max.api.lib import (
@@ -20,6 +19,7 @@ from ayon_max.api.lib import (
     get_multipass_setting,
     get_vray_settings,
 )
+from ayon_max.api.lib_settings import get_current_project_settings
 
 
 # Note that V-Ray is handled as a special case
@@ -49,6 +49,127 @@ def get_arnold_driver_for_image_format(image_format: str):
     return ARNOLD_DRIVERS.get(image_format)
 
 
+# Key of the renderer snapshot cached on the publish context
+RENDERER_SNAPSHOT_KEY = "maxRendererSnapshot"
+
+
+class RenderElementData(NamedTuple):
+    """Render element properties read by `RendererSnapshot`."""
+    index: int
+    name: str
+    enabled: bool
+    filename: str
+
+
+class RendererSnapshot(object):
+    """Renderer, render element and output settings of the current scene.
+
+    All properties relevant for render products and render settings
+    validation are read in one pass, so collectors and validators do not
+    query the renderer and render element manager through pymxs again.
+
+    The snapshot is not updated when the scene changes, use
+    `invalidate_renderer_snapshot` after writing any render settings.
+    """
+
+    def __init__(self):
+        from ayon_max.api.lib_renderproducts import get_render_frame_ranges
+
+        renderer = get_current_renderer()
+        renderer_name = str(renderer).split(":")[0]
+        self.renderer: Any = renderer
+        self.renderer_name: str = renderer_name
+        self.render_output: str = rt.rendOutputFilename
+        self.frame_ranges: Tuple[range, ...] = get_render_frame_ranges()
+
+        render_elements = []
+        render_elem = rt.maxOps.GetCurRenderElementMgr()
+        for index in range(render_elem.NumRenderElements()):
+            renderlayer = render_elem.GetRenderElement(index)
+            render_elements.append(RenderElementData(
+                index,
+                str(renderlayer.elementname),
+                bool(renderlayer.enabled),
+                str(render_elem.GetRenderElementFilename(index) or ""),
+            ))
+        self.render_elements: Tuple[RenderElementData, ...] = tuple(
+            render_elements)
+
+        # V-Ray
+        self.vray_settings: Any = None
+        self.vray_rawfilename: str = ""
+        self.vray_splitfilename: str = ""
+        self.vray_splitgbuffer: bool = False
+        self.vray_split_alpha: bool = False
+        self.vray_split_rgb: bool = False
+        if renderer_name.startswith("V_Ray_"):
+            vr_settings = get_vray_settings(renderer_name, renderer)
+            self.vray_settings = vr_settings
+            self.vray_rawfilename = vr_settings.output_rawfilename or ""
+            self.vray_splitfilename = (
+                getattr(vr_settings, "output_splitfilename", "") or "")
+            self.vray_splitgbuffer = vr_settings.output_splitgbuffer
+            self.vray_split_alpha = bool(
+                getattr(renderer, "output_splitAlpha", False))
+            self.vray_split_rgb = bool(
+                getattr(renderer, "output_splitRGB", False))
+
+        # Arnold
+        self.arnold_output_path: str = ""
+        self.arnold_driver: Any = None
+        self.arnold_driver_class: Any = None
+        self.arnold_multipart: bool = False
+        self.arnold_filename_suffix: str = ""
+        if renderer_name.startswith("Arnold"):
+            aov_manager = renderer.AOVManager
+            self.arnold_output_path = aov_manager.outputPath
+            drivers = aov_manager.drivers
+            if drivers:
+                driver = drivers[0]
+                self.arnold_driver = driver
+                self.arnold_driver_class = rt.ClassOf(driver)
+                self.arnold_multipart = driver.multipart
+                self.arnold_filename_suffix = driver.filenameSuffix
+
+        # Redshift
+        self.redshift_separate_aov_files: bool = False
+        self.redshift_exr_multipart: bool = False
+        if renderer_name == "Redshift_Renderer":
+            self.redshift_separate_aov_files = renderer.separateAovFiles
+            self.redshift_exr_multipart = renderer.OutputExrMultipart
+
+
+def get_renderer_snapshot(context: Optional[Any] = None) -> RendererSnapshot:
+    """Get renderer snapshot cached on the publish context.
+
+    Args:
+        context (Optional[pyblish.api.Context]): Publish context to cache
+            the snapshot on. A new snapshot is created when not provided.
+
+    Returns:
+        RendererSnapshot: Renderer snapshot of the current scene.
+    """
+    if context is None:
+        return RendererSnapshot()
+    snapshot = context.data.get(RENDERER_SNAPSHOT_KEY)
+    if snapshot is None:
+        snapshot = RendererSnapshot()
+        context.data[RENDERER_SNAPSHOT_KEY] = snapshot
+    return snapshot
+
+
+def invalidate_renderer_snapshot(context: Any):
+    """Drop renderer snapshot cached on the publish context.
+
+    Must be called after render settings of the scene were changed,
+    e.g. by a repair action.
+
+    Args:
+        context (pyblish.api.Context): Publish context.
+    """
+    context.data.pop(RENDERER_SNAPSHOT_KEY, None)
+
+
 class RenderSettings(object):
 
     log = Logger.get_logger("RenderSettings")
@@ -67,9 +188,7 @@ class RenderSettings(object):
 
         self._project_settings = project_settings
         if not self._project_settings:
-            self._project_settings = get_project_settings(
-                get_current_project_name()
-            )
+            self._project_settings = get_current_project_settings()
         self._data = data if data else {}
 
     def set_render_camera(self, selection):
@@ -0,0 +1,141 @@
+# -*- coding: utf-8 -*-
+"""Session cache of project settings and the task entity.
+
+Settings and the task entity are fetched once and reused until they expire
+or until the cache is invalidated, e.g. on task change. On startup they
+are taken from the snapshot written by the pre-launch hook, if it matches
+the current context. The returned values are shared, callers must not
+modify them.
+
+The cached task entity is meant for the launch path only. User actions
+and validators fetch the task entity, so they see its latest values.
+"""
+from __future__ import annotations
+import time
+from typing import Any, Dict, Optional, Tuple
+
+from ayon_core.pipeline import (
+    get_current_project_name,
+    get_current_folder_path,
+    get_current_task_name,
+)
+from ayon_core.pipeline.context_tools import get_current_task_entity
+from ayon_core.settings import get_project_settings
+
+from ayon_max.context_snapshot import read_context_snapshot
+
+
+# Seconds after which cached settings are fetched again
+SETTINGS_TTL = 300.0
+
+_cache: Dict[str, Tuple[float, Dict[str, Any]]] = {}
+_entity_cache: Dict[Tuple[str, ...], Tuple[float, Dict[str, Any]]] = {}
+_snapshot_loaded = False
+
+
+def _load_context_snapshot():
+    """Fill the caches from the launch context snapshot, only once."""
+    global _snapshot_loaded
+    if _snapshot_loaded:
+        return
+    _snapshot_loaded = True
+
+    project_name = get_current_project_name()
+    folder_path = get_current_folder_path()
+    task_name = get_current_task_name()
+    snapshot = read_context_snapshot(project_name, folder_path, task_name)
+    if snapshot is None:
+        return
+
+    now = time.monotonic()
+    _cache[project_name] = (now, snapshot["project_settings"])
+    if snapshot.get("task_entity"):
+        _entity_cache[("task", project_name, folder_path, task_name)] = (
+            now, snapshot["task_entity"])
+
+
+def _get_cached(cache: Dict, key) -> Optional[Dict[str, Any]]:
+    cached = cache.get(key)
+    if cached is not None and time.monotonic() - cached[0] < SETTINGS_TTL:
+        return cached[1]
+    return None
+
+
+def get_current_project_settings(
+    project_name: Optional[str] = None
+) -> Dict[str, Any]:
+    """Get project settings from the session cache.
+
+    Args:
+        project_name (Optional[str]): Project name, current project
+            is used when not provided.
+
+    Returns:
+        Dict[str, Any]: Project settings, must not be modified.
+    """
+    _load_context_snapshot()
+    if project_name is None:
+        project_name = get_current_project_name()
+    project_settings = _get_cached(_cache, project_name)
+    if project_settings is None:
+        project_settings = get_project_settings(project_name)
+        _cache[project_name] = (time.monotonic(), project_settings)
+    return project_settings
+
+
+def get_current_max_settings(
+    project_name: Optional[str] = None
+) -> Dict[str, Any]:
+    """Get `max` addon settings from the session cache.
+
+    Args:
+        project_name (Optional[str]): Project name, current project
+            is used when not provided.
+
+    Returns:
+        Dict[str, Any]: Settings of the addon, must not be modified.
+    """
+    return get_current_project_settings(project_name)["max"]
+
+
+def get_cached_task_entity() -> Optional[Dict[str, Any]]:
+    """Get task entity of the current context from the session cache.
+
+    The entity can be up to `SETTINGS_TTL` seconds old, use it only on
+    the launch path.
+
+    Returns:
+        Optional[Dict[str, Any]]: Task entity, must not be modified.
+    """
+    _load_context_snapshot()
+    key = (
+        "task",
+        get_current_project_name(),
+        get_current_folder_path(),
+        get_current_task_name(),
+    )
+    task_entity = _get_cached(_entity_cache, key)
+    if task_entity is None:
+        task_entity = get_current_task_entity()
+        if task_entity is not None:
+            _entity_cache[key] = (time.monotonic(), task_entity)
+    return task_entity
+
+
+def invalidate_project_settings(project_name: Optional[str] = None):
+    """Drop cached settings so they are fetched on next use.
+
+    Args:
+        project_name (Optional[str]): Project to drop the settings of,
+            settings of all projects are dropped when not provided.
+    """
+    if project_name is None:
+        _cache.clear()
+    else:
+        _cache.pop(project_name, None)
+
+
+def invalidate_session_cache():
+    """Drop all cached settings and task entities."""
+    _cache.clear()
+    _entity_cache.clear()
@@ -11,19 +11,8 @@ except ImportError:
     rt = None
 
 
-from ayon_core.tools.utils import host_tools
-from ayon_core.settings import get_project_settings
-from ayon_core.pipeline import get_current_project_name
-from ayon_core.pipeline.workfile import save_next_version
 from ayon_max.api import lib
-from .workfile_template_builder import (
-    create_first_workfile_from_template,
-    build_workfile_template,
-    update_workfile_template,
-    open_template,
-    create_placeholder,
-    update_placeholder
-)
+from ayon_max.api.lib_settings import get_current_project_settings
 
 
 class AYONMenu(object):
@@ -31,8 +20,11 @@ class AYONMenu(object):
 
     This is using "hack" to inject itself before "Help" menu of 3dsmax.
     For some reason `postLoadingMenus` event doesn't fire, and main menu
-    if probably re-initialized by menu templates, se we wait for at least
-    1 event Qt event loop before trying to insert.
+    if probably re-initialized by menu templates, so the menu is inserted
+    once the Qt event loop processed the events queued by the startup.
+
+    The QMenu is created only once. When the workspace changes and the
+    main menubar is re-created, the same menu is attached again.
 
     """
 
@@ -40,26 +32,58 @@ class AYONMenu(object):
         super().__init__()
         self.main_widget = self.get_main_widget()
         self.menu = None
+        self._context_action = None
+        self._template_builder_menu = None
+
+        # Single shot on the next event loop iteration, menu templates
+        # are already applied to the menubar at that point
+        QtCore.QTimer.singleShot(0, self._on_ready)
 
-        timer = QtCore.QTimer()
-        # set number of event loops to wait - increased to ensure menu bar
-        # is fully initialized and not overwritten by other tools
-        timer.setInterval(1)
-        timer.timeout.connect(self._on_timer)
-        timer.start()
+    def _on_ready(self):
+        if self.menu is None:
+            self._build_ayon_menu()
+        else:
+            self.attach()
 
-        self._timer = timer
-        self._counter = 0
-        self._max_retries = 10  # Number of event loops to wait
+    def attach(self):
+        """Attach existing AYON menu to the main menubar.
+
+        Used after workspace change which re-creates the main menubar.
+        The menu is built if it was not yet.
+        """
+        if self.menu is None:
+            self._build_ayon_menu()
+            return
 
-    def _on_timer(self):
-        if self._counter < self._max_retries:
-            self._counter += 1
+        menu_bar = self.get_main_menubar()
+        try:
+            menu_action = self.menu.menuAction()
+        except RuntimeError:
+            # Underlying Qt object was deleted with the previous menubar
+            self.menu = None
+            self._build_ayon_menu()
             return
+        if menu_action not in menu_bar.actions():
+            self._insert_menu(menu_bar, self.menu)
+
+    def is_attached(self) -> bool:
+        """Check AYON menu is present in the main menubar.
 
-        self._counter = 0
-        self._timer.stop()
-        self._build_ayon_menu()
+        Returns:
+            bool: Whether the menu action is in the main menubar.
+        """
+        if self.menu is None:
+            return False
+        try:
+            menu_action = self.menu.menuAction()
+        except RuntimeError:
+            return False
+        return menu_action in self.get_main_menubar().actions()
+
+    def update_context_label(self):
+        """Update label of the context action to current context."""
+        if self._context_action is not None:
+            self._context_action.setText(f"{lib.get_context_label()}")
 
     @staticmethod
     def get_main_widget():
@@ -96,23 +120,32 @@ class AYONMenu(object):
                 # we already have AYON menu
                 self.menu = item
                 return item
+        tab_menu_label = os.environ.get("AYON_MENU_LABEL") or "AYON"
+        ay_menu = QtWidgets.QMenu("&{}".format(tab_menu_label))
+        self._insert_menu(menu_bar, ay_menu, before)
+
+        self.menu = ay_menu
+        return ay_menu
+
+    @staticmethod
+    def _insert_menu(
+            menu_bar: QtWidgets.QMenuBar,
+            menu: QtWidgets.QMenu,
+            before: str = "&Help"):
+        """Insert menu to the menubar."""
         # Find the position to insert before (Help menu by default)
         help_action = None
-        for item in menu_items:
+        for item in menu_bar.findChildren(
+                QtWidgets.QMenu, options=QtCore.Qt.FindDirectChildrenOnly):
             if before in item.title():
                 help_action = item.menuAction()
                 break
-        tab_menu_label = os.environ.get("AYON_MENU_LABEL") or "AYON"
-        ay_menu = QtWidgets.QMenu("&{}".format(tab_menu_label))
         # Insert menu before Help, or at the end if Help is not found
-        if int(lib.get_max_version()) < 2026:
-            menu_bar.insertMenu(help_action, ay_menu)
+        if int(lib.get_max_version()) < 2026 and help_action is not None:
+            menu_bar.insertMenu(help_action, menu)
         else:
             # Fallback: append at the end if Help menu not found
-            menu_bar.addMenu(ay_menu)
-
-        self.menu = ay_menu
-        return ay_menu
+            menu_bar.addMenu(menu)
 
     def _build_ayon_menu(self) -> QtWidgets.QAction:
         """Build items in AYON menu."""
@@ -122,9 +155,9 @@ class AYONMenu(object):
         context_action = QtWidgets.QAction(f"{context_label}", ayon_menu)
         context_action.setEnabled(False)
         ayon_menu.addAction(context_action)
+        self._context_action = context_action
 
-        project_name = get_current_project_name()
-        project_settings = get_project_settings(project_name)
+        project_settings = get_current_project_settings()
         if project_settings["core"]["tools"]["ayon_menu"].get(
             "version_up_current_workfile"):
             version_up_action = QtWidgets.QAction("Version Up Workfile", ayon_menu)
@@ -177,7 +210,18 @@ class AYONMenu(object):
 
         ayon_menu.addSeparator()
         template_builder = ayon_menu.addMenu("Template Builder")
+        # Actions are created on first hover of the submenu
+        template_builder.aboutToShow.connect(
+            self._build_template_builder_menu)
+        self._template_builder_menu = template_builder
+
+        return ayon_menu
 
+    def _build_template_builder_menu(self):
+        """Build items of the Template Builder submenu."""
+        template_builder = self._template_builder_menu
+        template_builder.aboutToShow.disconnect(
+            self._build_template_builder_menu)
         template_builder.addSeparator()
         create_first_workfile_template_action = QtWidgets.QAction(
             "Create First Workfile from Template", template_builder)
@@ -215,26 +259,34 @@ class AYONMenu(object):
             self.update_placeholders_callback)
         template_builder.addAction(update_placeholders_action)
 
-        return ayon_menu
-
     def load_callback(self):
         """Callback to show Loader tool."""
+        from ayon_core.tools.utils import host_tools
+
         host_tools.show_loader(parent=self.main_widget)
 
     def publish_callback(self):
         """Callback to show Publisher tool."""
+        from ayon_core.tools.utils import host_tools
+
         host_tools.show_publisher(parent=self.main_widget)
 
     def manage_callback(self):
         """Callback to show Scene Manager/Inventory tool."""
+        from ayon_core.tools.utils import host_tools
+
         host_tools.show_scene_inventory(parent=self.main_widget)
 
     def library_callback(self):
         """Callback to show Library Loader tool."""
+        from ayon_core.tools.utils import host_tools
+
         host_tools.show_library_loader(parent=self.main_widget)
 
     def workfiles_callback(self):
         """Callback to show Workfiles tool."""
+        from ayon_core.tools.utils import host_tools
+
         host_tools.show_workfiles(parent=self.main_widget)
 
     def resolution_callback(self):
@@ -255,28 +307,44 @@ class AYONMenu(object):
 
     def version_up_callback(self):
         """Callback to version up current workfile."""
+        from ayon_core.pipeline.workfile import save_next_version
+
         return save_next_version()
 
     def create_first_workfile_template_callback(self):
         """Callback to create the first workfile from template."""
+        from .workfile_template_builder import (
+            create_first_workfile_from_template
+        )
+
         create_first_workfile_from_template()
 
     def build_workfile_template_callback(self):
         """Callback to build workfile from template."""
+        from .workfile_template_builder import build_workfile_template
+
         build_workfile_template()
 
     def update_workfile_template_callback(self):
         """Callback to update workfile from template."""
+        from .workfile_template_builder import update_workfile_template
+
         update_workfile_template()
 
     def import_template_callback(self):
         """Callback to import workfile template."""
+        from .workfile_template_builder import open_template
+
         open_template()
 
     def create_placeholders_callback(self):
         """Callback to create workfile placeholders."""
+        from .workfile_template_builder import create_placeholder
+
         create_placeholder()
 
     def update_placeholders_callback(self):
         """Callback to update workfile placeholders."""
+        from .workfile_template_builder import update_placeholder
+
         update_placeholder()
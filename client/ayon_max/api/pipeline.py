@@ -1,7 +1,9 @@
 # -*- coding: utf-8 -*-
 """Pipeline tools for AYON 3ds max integration."""
 import os
+import time
 import logging
+import contextlib
 from operator import attrgetter
 
 import json
@@ -20,11 +22,14 @@ from ayon_core.pipeline import (
     register_workfile_build_plugin_path,
     AVALON_CONTAINER_ID,
     AYON_CONTAINER_ID,
-    get_current_project_name
 )
-from ayon_max.api.menu import AYONMenu
-from ayon_core.settings import get_project_settings
-from ayon_max.api import lib
+from ayon_max.api import (
+    lib,
+    lib_settings,
+    profiling,
+    publish_timing,
+    validation_cache,
+)
 from ayon_max.api.plugin import MS_CUSTOM_ATTRIB
 from ayon_max import MAX_HOST_DIR
 
@@ -55,6 +60,9 @@ class MaxHost(HostBase, IWorkfileHost, ILoadHost, IPublishHost):
         super(MaxHost, self).__init__()
         self._op_events = {}
         self._has_been_setup = False
+        self._project_set = False
+        # Durations of startup phases in seconds
+        self.startup_timings = {}
 
     def get_app_information(self):
         from ayon_core.host import ApplicationInformation
@@ -79,24 +87,65 @@ class MaxHost(HostBase, IWorkfileHost, ILoadHost, IPublishHost):
         )
 
     def install(self):
-        pyblish.api.register_host("max")
-
-        pyblish.api.register_plugin_path(PUBLISH_PATH)
-        register_loader_plugin_path(LOAD_PATH)
-        register_creator_plugin_path(CREATE_PATH)
-        register_workfile_build_plugin_path(WORKFILE_BUILD_PATH)
-
-        _set_project()
-        _set_autobackup_dir()
+        with self._startup_phase("profiling"):
+            profiling.install()
+
+        with self._startup_phase("plugin paths"):
+            pyblish.api.register_host("max")
+
+            pyblish.api.register_plugin_path(PUBLISH_PATH)
+            publish_timing.install()
+            register_loader_plugin_path(LOAD_PATH)
+            register_creator_plugin_path(CREATE_PATH)
+            register_workfile_build_plugin_path(WORKFILE_BUILD_PATH)
+
+        if lib.is_headless_profile():
+            # Render and batch workers only open, process and save scenes
+            self._has_been_setup = True
+            self._log_startup_timings("AYON host installed (headless)")
+            return
 
-        register_event_callback("init", on_init)
-        register_event_callback("new", on_new)
-        register_event_callback("workfile.open.before", on_before_open)
-        register_event_callback("workfile.open.after", on_after_open)
-        register_event_callback("before.save", before_save)
-        register_event_callback("taskChanged", self.on_task_changed)
-        self._has_been_setup = True
-        self._register_callbacks()
+        headless = lib.is_headless()
+        # Project folder of interactive session is set up once Max
+        # finished starting, see `on_init`
+        if headless:
+            with self._startup_phase("project"):
+                _set_project()
+                self._project_set = True
+        with self._startup_phase("autobackup"):
+            _set_autobackup_dir()
+
+        with self._startup_phase("callbacks"):
+            register_event_callback("init", on_init)
+            register_event_callback("new", on_new)
+            register_event_callback("workfile.open.before", on_before_open)
+            register_event_callback("workfile.open.after", on_after_open)
+            register_event_callback("before.save", before_save)
+            register_event_callback("taskChanged", self.on_task_changed)
+            self._has_been_setup = True
+            self._register_callbacks()
+        if not headless:
+            with self._startup_phase("validation cache"):
+                validation_cache.update_from_settings(
+                    lib_settings.get_current_project_settings())
+        self._log_startup_timings("AYON host installed")
+
+    @contextlib.contextmanager
+    def _startup_phase(self, name):
+        """Measure duration of a startup phase."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.startup_timings[name] = time.perf_counter() - start
+
+    def _log_startup_timings(self, label):
+        timings = ", ".join(
+            f"{name} {duration:.3f}s"
+            for name, duration in self.startup_timings.items()
+        )
+        total = sum(self.startup_timings.values())
+        log.info(f"{label} in {total:.3f}s ({timings})")
 
     def workfile_has_unsaved_changes(self):
         return rt.getSaveRequired()
@@ -145,21 +194,46 @@ class MaxHost(HostBase, IWorkfileHost, ILoadHost, IPublishHost):
         if lib.get_max_version() < 2026:
             rt.callbacks.addScript(
                 rt.Name('postWorkspaceChange'),
-                self._deferred_menu_creation,
+                self._on_workspace_change,
                 id=rt.name("AyonCallbacks"))
 
         rt.NodeEventCallback(
             nameChanged=lib.update_modifier_node_names)
 
     def on_init(self):
+        if not self._project_set:
+            with self._startup_phase("project"):
+                _set_project()
+                self._project_set = True
         if not self.menu:
-            self._deferred_menu_creation()
-        _on_scene_init()
+            with self._startup_phase("menu"):
+                self._deferred_menu_creation()
+        with self._startup_phase("init"):
+            _on_scene_init()
+        self._log_startup_timings("AYON startup finished")
 
     def _deferred_menu_creation(self):
+        from ayon_max.api.menu import AYONMenu
+
         self.log.info("Building menu ...")
         self.menu = AYONMenu()
 
+    def _on_workspace_change(self):
+        """Attach the existing menu to the re-created main menubar."""
+        from qtpy import QtCore
+
+        if self.menu is None:
+            self._deferred_menu_creation()
+            return
+        # Menubar is re-created once the callback returns, attach the menu
+        # on the next event loop iteration
+        QtCore.QTimer.singleShot(0, self._attach_menu)
+
+    def _attach_menu(self):
+        self.menu.attach()
+        if not self.menu.is_attached():
+            self.log.warning("AYON menu is missing in the main menubar.")
+
     @staticmethod
     def create_context_node():
         """Helper for creating context holding node."""
@@ -206,15 +280,15 @@ attributes "AYONContext"
         return json.loads(context)
 
     def on_task_changed(self):
+        lib_settings.invalidate_session_cache()
         if lib.is_headless():
             return
 
-        ayon_menu = self.menu.menu
-        if ayon_menu is not None:
-            actions = ayon_menu.actions()
-            context_action = actions[0]
-            context_label = lib.get_context_label()
-            context_action.setText(f"{context_label}")
+        validation_cache.update_from_settings(
+            lib_settings.get_current_project_settings())
+
+        if self.menu is not None:
+            self.menu.update_context_label()
 
 
 def _on_scene_init(*args):
@@ -280,11 +354,13 @@ def on_init():
     last_workfile = os.getenv("AYON_LAST_WORKFILE")
     if os.getenv("AVALON_OPEN_LAST_WORKFILE") != "1"  \
         or not os.path.exists(last_workfile):
-            lib.set_context_settings()
+            lib.set_context_settings(
+                task_entity=lib_settings.get_cached_task_entity())
 
 
 def on_new():
-    lib.set_context_settings()
+    lib.set_context_settings(
+        task_entity=lib_settings.get_cached_task_entity())
 
 
 def on_save():
@@ -314,6 +390,7 @@ def containerise(name: str, nodes: list, context,
     import_custom_attribute_data(container, nodes)
     if not lib.imprint(container_name, data):
         raise RuntimeError(f"imprinting of {container_name} failed.")
+    profiling.on_load()
     return container
 
 
@@ -351,12 +428,12 @@ def containerise_texture(name: str, context: dict,
     container = rt.container(name=container_name)
     if not lib.imprint(container_name, data):
         raise RuntimeError(f"imprinting of {container_name} failed.")
+    profiling.on_load()
     return container
 
 
 def _set_project():
-    project_name = get_current_project_name()
-    project_settings = get_project_settings(project_name)
+    project_settings = lib_settings.get_current_project_settings()
     enable_project_creation = project_settings["max"].get("enabled_project_creation")
     if not enable_project_creation:
         log.debug("Project creation disabled. Skipping project creation.")
@@ -12,11 +12,39 @@ from ayon_core.pipeline import (
     CreatedInstance,
     Creator,
     CreatorError,
-    AYON_INSTANCE_ID,
-    AVALON_INSTANCE_ID,
 )
 
-from .lib import imprint, lsattr, read, get_tyflow_export_operators
+from .lib import (
+    imprint,
+    format_user_prop_buffer,
+    get_instance_nodes,
+    get_tyflow_export_operators,
+)
+
+# Creates instance nodes with AYON data modifier, members and user
+# properties of all instances in a single call.
+MS_CREATE_INSTANCE_NODES = """
+fn ayon_create_instance_nodes names members_list buffers attrs =
+(
+    local nodes = #()
+    for i = 1 to names.count do
+    (
+        local node = Container name:names[i]
+        addModifier node (EmptyModifier())
+        local modifier = node.modifiers[1]
+        modifier.name = "AYON Data"
+        custAttributes.add modifier attrs
+        local members = members_list[i]
+        modifier.AYONData.all_handles = for m in members collect (
+            NodeTransformMonitor node:m
+        )
+        modifier.AYONData.sel_list = for m in members collect (m as string)
+        setUserPropBuffer node buffers[i]
+        append nodes node
+    )
+    nodes
+)
+"""
 
 MS_CUSTOM_ATTRIB = """attributes "AYONData"
 (
@@ -270,28 +298,55 @@ class MaxCreatorBase(object):
 
     @staticmethod
     def cache_instance_data(shared_data):
+        """Cache instance nodes and their data to shared data.
+
+        Instance nodes are collected in a single MaxScript call, so
+        creators can create their instances without querying the scene.
+
+        Cached keys:
+            max_cached_instances: Instance node names by creator
+                identifier.
+            max_cached_legacy_instances: Legacy instance node names by
+                creator identifier.
+            max_cached_instance_data: Parsed user properties of the
+                instance nodes by node name.
+        """
         if shared_data.get("max_cached_instances") is not None:
             return shared_data
 
-        shared_data["max_cached_instances"] = {}
-        shared_data["max_cached_legacy_instances"] = {}
-
-        cached_instances = []
-        for id_type in [AYON_INSTANCE_ID, AVALON_INSTANCE_ID]:
-            cached_instances.extend(lsattr("id", id_type))
-
-        for i in cached_instances:
-            creator_id = rt.GetUserProp(i, "creator_identifier")
+        cached_instances = {}
+        cached_legacy_instances = {}
+        instance_data = {}
+        for _, name, creator_id, data in get_instance_nodes():
             if "openpype" in creator_id:
                 # Legacy creator instance
-                shared_data["max_cached_legacy_instances"].setdefault(
-                    creator_id, []).append(i.name)
+                cached_legacy_instances.setdefault(
+                    creator_id, []).append(name)
             else:
-                shared_data["max_cached_instances"].setdefault(
-                    creator_id, []).append(i.name)
+                cached_instances.setdefault(creator_id, []).append(name)
+
+            data["instance_node"] = name
+            instance_data[name] = data
 
+        shared_data["max_cached_instances"] = cached_instances
+        shared_data["max_cached_legacy_instances"] = cached_legacy_instances
+        shared_data["max_cached_instance_data"] = instance_data
         return shared_data
 
+    def get_cached_instances_data(self):
+        """Get cached data of instance nodes of this creator.
+
+        Returns:
+            List[dict]: Data of instance nodes in the scene.
+        """
+        shared_data = self.cache_instance_data(self.collection_shared_data)
+        instance_data = shared_data["max_cached_instance_data"]
+        return [
+            instance_data[name]
+            for name in shared_data["max_cached_instances"].get(
+                self.identifier, [])
+        ]
+
     @staticmethod
     def create_instance_node(node):
         """Create instance node.
@@ -389,11 +444,108 @@ class MaxCreator(Creator, MaxCreatorBase):
 
         return instance
 
+    def create_bulk(self, variants, members, instance_data=None):
+        """Create multiple instances at once.
+
+        Instance nodes, their members and data are created in a single
+        MaxScript call and the instances are added to the create context
+        in bulk. Instances are created as by `create` with selection, so
+        creators overriding `create` or `create_instance_node` cannot use
+        it.
+
+        Args:
+            variants (List[str]): Variants of the instances, product names
+                are created from them.
+            members (List[List[rt.Node]]): Member nodes of each instance.
+            instance_data (Optional[dict]): Data shared by the instances,
+                current folder and task are used when not provided.
+
+        Returns:
+            List[CreatedInstance]: Created instances.
+        """
+        creator_cls = type(self)
+        if (
+            creator_cls.create is not MaxCreator.create
+            or creator_cls.create_instance_node
+            is not MaxCreatorBase.create_instance_node
+        ):
+            raise CreatorError(
+                f"{creator_cls.__name__} overrides instance creation,"
+                " instances cannot be created in bulk.")
+        if len(variants) != len(members):
+            raise CreatorError(
+                "Number of variants and member sets does not match.")
+
+        create_context = self.create_context
+        if instance_data is None:
+            instance_data = {
+                "folderPath": create_context.get_current_folder_path(),
+                "task": create_context.get_current_task_name(),
+            }
+        folder_path = instance_data["folderPath"]
+        task_name = instance_data.get("task")
+        project_name = create_context.get_current_project_name()
+        folder_entity = create_context.get_folder_entity(folder_path)
+        task_entity = None
+        if task_name:
+            task_entity = create_context.get_task_entity(
+                folder_path, task_name)
+        product_names = [
+            self.get_product_name(
+                project_name=project_name,
+                project_entity=create_context.get_current_project_entity(),
+                folder_entity=folder_entity,
+                task_entity=task_entity,
+                variant=variant,
+                host_name=create_context.host_name,
+            )
+            for variant in variants
+        ]
+        if len(set(product_names)) != len(product_names):
+            raise CreatorError("Product names are not unique.")
+        for product_name in product_names:
+            if rt.getNodeByName(product_name):
+                raise CreatorError(
+                    f"'{product_name}' is already created..")
+
+        product_type = instance_data.get("productType")
+        if not product_type:
+            product_type = self.product_base_type
+
+        instances = []
+        for variant, product_name in zip(variants, product_names):
+            data = dict(instance_data)
+            data["variant"] = variant
+            data["instance_node"] = product_name
+            instances.append(CreatedInstance(
+                product_type=product_type,
+                product_base_type=self.product_base_type,
+                product_name=product_name,
+                data=data,
+                creator=self,
+            ))
+
+        create_instance_nodes = rt.Execute(MS_CREATE_INSTANCE_NODES)
+        create_instance_nodes(
+            product_names,
+            [list(nodes) for nodes in members],
+            [
+                format_user_prop_buffer(instance.data_to_store())
+                for instance in instances
+            ],
+            rt.Execute(MS_CUSTOM_ATTRIB),
+        )
+
+        with create_context.bulk_add_instances():
+            for instance in instances:
+                self._add_instance_to_context(instance)
+
+        return instances
+
     def collect_instances(self):
-        self.cache_instance_data(self.collection_shared_data)
-        for instance in self.collection_shared_data["max_cached_instances"].get(self.identifier, []):  # noqa
+        for instance_data in self.get_cached_instances_data():
             created_instance = CreatedInstance.from_existing(
-                read(rt.GetNodeByName(instance)), self
+                instance_data, self
             )
             self._add_instance_to_context(created_instance)
 
@@ -476,10 +628,9 @@ class MaxCacheCreator(Creator, MaxTyFlowDataCreatorBase):
         return instance
 
     def collect_instances(self):
-        self.cache_instance_data(self.collection_shared_data)
-        for instance in self.collection_shared_data["max_cached_instances"].get(self.identifier, []):  # noqa
+        for instance_data in self.get_cached_instances_data():
             created_instance = CreatedInstance.from_existing(
-                read(rt.GetNodeByName(instance)), self
+                instance_data, self
             )
             self._add_instance_to_context(created_instance)
 
@@ -0,0 +1,361 @@
+# -*- coding: utf-8 -*-
+"""Opt-in instrumentation of calls through the pymxs bridge.
+
+Set `AYON_MAX_PYMXS_PROFILE=1` to wrap `rt` of `ayon_max` modules and
+plugins with a proxy counting calls and latency per MaxScript function
+and per calling plugin. `pymxs.runtime` itself is left untouched, so code
+outside of `ayon_max` is not affected.
+
+Reports are written after workfile open, after each load and on 3ds Max
+shutdown, and by the publish integrator, as JSON and as collapsed stacks,
+which can be rendered by flamegraph tools, to `AYON_MAX_PYMXS_PROFILE_DIR`
+or to the temp directory.
+"""
+from __future__ import annotations
+import os
+import sys
+import json
+import time
+import logging
+import tempfile
+from collections import defaultdict
+from typing import Any, Dict, List, Optional
+
+import pyblish.api
+from ayon_core.lib import register_event_callback
+from ayon_core.pipeline.load import LoaderPlugin
+
+from ayon_max import MAX_HOST_DIR
+
+
+log = logging.getLogger("ayon_max")
+
+PROFILE_ENV = "AYON_MAX_PYMXS_PROFILE"
+PROFILE_DIR_ENV = "AYON_MAX_PYMXS_PROFILE_DIR"
+
+PLUGINS_DIR = os.path.join(MAX_HOST_DIR, "plugins")
+
+CALLBACK_ID = "AyonPymxsProfile"
+
+# Labels of reports written on host events
+EVENT_REPORTS = {
+    "workfile.open.after": "workfile_open",
+}
+
+# MaxScript classes of runtime values which are functions
+FUNCTION_CLASSES = {
+    "Primitive",
+    "MAXScriptFunction",
+    "Generic",
+    "MappedGeneric",
+    "MappedPrimitive",
+    "NodeGeneric",
+    "MappedNodeGeneric",
+}
+
+_profiler = None
+_proxy = None
+
+
+class _Stat(object):
+    __slots__ = ("calls", "total", "max")
+
+    def __init__(self):
+        self.calls = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def add(self, duration: float):
+        self.calls += 1
+        self.total += duration
+        if duration > self.max:
+            self.max = duration
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "calls": self.calls,
+            "total": self.total,
+            "max": self.max,
+        }
+
+
+class PymxsProfiler(object):
+    """Call statistics of the pymxs runtime."""
+
+    def __init__(self):
+        self.functions: Dict[str, _Stat] = defaultdict(_Stat)
+        self.callers: Dict[str, Dict[str, _Stat]] = defaultdict(
+            lambda: defaultdict(_Stat))
+        self.stacks: Dict[str, float] = defaultdict(float)
+        self.started = time.time()
+
+    @property
+    def call_count(self) -> int:
+        """Number of calls recorded since the profiler was reset."""
+        return sum(stat.calls for stat in self.functions.values())
+
+    def record(self, name: str, duration: float, with_stack: bool = True):
+        """Record a call or attribute access of the runtime.
+
+        Args:
+            name (str): Name of the runtime function or attribute.
+            duration (float): Duration in seconds.
+            with_stack (bool): Attribute the call to its calling plugin
+                and stack, which requires walking the Python stack.
+        """
+        self.functions[name].add(duration)
+        if not with_stack:
+            return
+        stack = _get_ayon_stack()
+        caller = _get_caller(stack)
+        self.callers[caller][name].add(duration)
+        frames = [f"{frame.f_globals.get('__name__')}:{frame.f_code.co_name}"
+                  for frame in reversed(stack)]
+        frames.append(f"rt.{name}")
+        self.stacks[";".join(frames)] += duration
+
+    def reset(self):
+        self.functions.clear()
+        self.callers.clear()
+        self.stacks.clear()
+        self.started = time.time()
+
+    def to_dict(self, label: str) -> Dict[str, Any]:
+        return {
+            "label": label,
+            "started": self.started,
+            "finished": time.time(),
+            "functions": {
+                name: stat.to_dict()
+                for name, stat in sorted(
+                    self.functions.items(),
+                    key=lambda item: item[1].total,
+                    reverse=True
+                )
+            },
+            "callers": {
+                caller: {
+                    name: stat.to_dict() for name, stat in stats.items()
+                }
+                for caller, stats in self.callers.items()
+            },
+        }
+
+    def to_collapsed_stacks(self) -> str:
+        """Get stacks in collapsed format with durations in microseconds."""
+        return "\n".join(
+            f"{stack} {int(duration * 1e6)}"
+            for stack, duration in sorted(self.stacks.items())
+        )
+
+
+def _get_ayon_stack() -> List[Any]:
+    """Get frames of `ayon_max` code calling the runtime, innermost first."""
+    stack = []
+    frame = sys._getframe(3)
+    while frame is not None:
+        if frame.f_code.co_filename.startswith(MAX_HOST_DIR):
+            stack.append(frame)
+        frame = frame.f_back
+    return stack
+
+
+def _get_caller(stack: List[Any]) -> str:
+    """Get label of the outermost plugin in the stack."""
+    for frame in reversed(stack):
+        if not frame.f_code.co_filename.startswith(PLUGINS_DIR):
+            continue
+        owner = frame.f_locals.get("self") or frame.f_locals.get("cls")
+        if owner is not None:
+            if not isinstance(owner, type):
+                owner = owner.__class__
+            return owner.__name__
+        return frame.f_globals.get("__name__", "")
+    if stack:
+        return stack[-1].f_globals.get("__name__", "")
+    return "<unknown>"
+
+
+class _ProfiledFunction(object):
+    """Runtime function recording its calls."""
+
+    def __init__(self, name: str, function: Any, profiler: PymxsProfiler):
+        self._name = name
+        self._function = function
+        self._profiler = profiler
+
+    def __call__(self, *args, **kwargs):
+        start = time.perf_counter()
+        try:
+            return self._function(*args, **kwargs)
+        finally:
+            self._profiler.record(self._name, time.perf_counter() - start)
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._function, name)
+
+
+class ProfiledRuntime(object):
+    """Proxy of `pymxs.runtime` recording calls and attribute access.
+
+    Only calls of runtime functions are attributed to their callers,
+    attribute access is counted without walking the stack.
+    """
+
+    def __init__(self, runtime: Any, profiler: PymxsProfiler):
+        object.__setattr__(self, "_runtime", runtime)
+        object.__setattr__(self, "_profiler", profiler)
+        object.__setattr__(self, "_is_function", {})
+
+    def __getattr__(self, name: str) -> Any:
+        runtime = self._runtime
+        start = time.perf_counter()
+        value = getattr(runtime, name)
+        self._profiler.record(
+            f"get:{name}", time.perf_counter() - start, with_stack=False)
+
+        is_function = self._is_function.get(name)
+        if is_function is None:
+            is_function = (
+                callable(value)
+                and str(runtime.classOf(value)) in FUNCTION_CLASSES
+            )
+            self._is_function[name] = is_function
+        if is_function:
+            return _ProfiledFunction(name, value, self._profiler)
+        return value
+
+    def __setattr__(self, name: str, value: Any):
+        start = time.perf_counter()
+        setattr(self._runtime, name, value)
+        self._profiler.record(
+            f"set:{name}", time.perf_counter() - start, with_stack=False)
+
+
+def is_enabled() -> bool:
+    """Whether pymxs profiling is requested for the session."""
+    return os.getenv(PROFILE_ENV, "").lower() in {"1", "true", "yes"}
+
+
+def get_profiler() -> Optional[PymxsProfiler]:
+    """Get profiler of the session, None when profiling is not installed."""
+    return _profiler
+
+
+def _get_loader_namespaces() -> List[Dict[str, Any]]:
+    """Get globals of the discovered loader plugins.
+
+    Loader plugins are discovered by `ayon_core` without being added
+    to `sys.modules`, their globals are reached through their classes.
+    """
+    namespaces = []
+    classes = [LoaderPlugin]
+    while classes:
+        cls = classes.pop()
+        classes.extend(cls.__subclasses__())
+        for attr in vars(cls).values():
+            namespace = getattr(attr, "__globals__", None)
+            if namespace is not None:
+                namespaces.append(namespace)
+                break
+    return namespaces
+
+
+def _wrap_modules(*args):
+    """Replace `rt` of loaded `ayon_max` modules and plugins with the proxy.
+
+    Publish plugins are loaded on each discovery, so this also runs as
+    a pyblish discovery filter, leaving the discovered plugins as they are.
+    """
+    import pymxs
+
+    runtime = pymxs.runtime
+    namespaces = [vars(module) for module in list(sys.modules.values())]
+    namespaces.extend(_get_loader_namespaces())
+    for namespace in namespaces:
+        filepath = namespace.get("__file__")
+        if not filepath or not filepath.startswith(MAX_HOST_DIR):
+            continue
+        if namespace.get("rt") is runtime:
+            namespace["rt"] = _proxy
+
+
+def _on_host_event(event):
+    dump_report(EVENT_REPORTS[event.topic])
+
+
+def _on_shutdown():
+    dump_report("session")
+
+
+def install():
+    """Wrap `rt` of `ayon_max` modules with the profiling proxy.
+
+    Reports of the calls are written on host events listed in
+    `EVENT_REPORTS`, after each load and on 3ds Max shutdown.
+    """
+    global _profiler, _proxy
+    if _profiler is not None or not is_enabled():
+        return
+
+    from pymxs import runtime
+
+    _profiler = PymxsProfiler()
+    _proxy = ProfiledRuntime(runtime, _profiler)
+    _wrap_modules()
+    pyblish.api.register_discovery_filter(_wrap_modules)
+
+    for topic in EVENT_REPORTS:
+        register_event_callback(topic, _on_host_event)
+    runtime.callbacks.removeScripts(id=runtime.name(CALLBACK_ID))
+    runtime.callbacks.addScript(
+        runtime.Name("preSystemShutdown"),
+        _on_shutdown,
+        id=runtime.name(CALLBACK_ID)
+    )
+    log.info("pymxs profiling enabled.")
+
+
+def on_load():
+    """Write the report of a loaded container.
+
+    Loader plugins are wrapped here as well, so calls of a loader are
+    recorded from its next load on, the first load after its discovery
+    records only calls of the `ayon_max` api.
+    """
+    if _profiler is None:
+        return
+    _wrap_modules()
+    dump_report("load")
+
+
+def dump_report(label: str) -> Optional[str]:
+    """Write the report of recorded calls and reset the statistics.
+
+    Args:
+        label (str): Label of the profiled operation, e.g. "publish".
+
+    Returns:
+        Optional[str]: Path to the JSON report, None when profiling
+            is not installed or no calls were recorded.
+    """
+    if _profiler is None or not _profiler.functions:
+        return None
+
+    output_dir = os.getenv(PROFILE_DIR_ENV) or tempfile.gettempdir()
+    os.makedirs(output_dir, exist_ok=True)
+    timestamp = time.strftime("%Y%m%d_%H%M%S")
+    basename = os.path.join(output_dir, f"ayon_max_pymxs_{label}_{timestamp}")
+
+    report_path = f"{basename}.json"
+    with open(report_path, "w") as f:
+        json.dump(_profiler.to_dict(label), f, indent=4)
+    with open(f"{basename}.folded", "w") as f:
+        f.write(_profiler.to_collapsed_stacks())
+
+    log.info(
+        f"pymxs profile of {label}: {_profiler.call_count} call(s), "
+        f"report written to {report_path}"
+    )
+    _profiler.reset()
+    return report_path
@@ -0,0 +1,165 @@
+# -*- coding: utf-8 -*-
+"""Timing of `ayon_max` publish plugins.
+
+Every processed plugin of `ayon_max` is recorded to the publish context
+with its wall time, number of pymxs calls and bytes written to the
+staging directories of its instance.
+
+Pyblish results do not hold the context. Instance plugins are recorded
+to the context of their instance, context plugins to the context
+collected by `CollectPublishTiming` at the start of the publish.
+"""
+from __future__ import annotations
+import os
+import sys
+from typing import Any, Dict, List, Optional
+
+import pyblish.api
+
+from ayon_max import MAX_HOST_DIR
+from ayon_max.api import profiling
+
+
+# Key of the timing records in the publish context data
+PUBLISH_TIMING_KEY = "maxPublishTiming"
+# Key of the last measured staging size in the instance data
+STAGING_BYTES_KEY = "maxStagingBytes"
+
+_last_call_count = 0
+_current_context = None
+
+
+def _is_max_plugin(plugin) -> bool:
+    # Discovered plugins have the path of their file as module name
+    path = plugin.__module__
+    module = sys.modules.get(path)
+    if module is not None:
+        path = getattr(module, "__file__", None) or ""
+    return os.path.normpath(path).startswith(MAX_HOST_DIR)
+
+
+def _is_extractor(plugin) -> bool:
+    return (
+        pyblish.api.ExtractorOrder - 0.5
+        <= plugin.order
+        < pyblish.api.IntegratorOrder - 0.5
+    )
+
+
+def _get_pymxs_call_delta() -> Optional[int]:
+    """Get pymxs calls made since the previous call, None if not profiled."""
+    global _last_call_count
+    profiler = profiling.get_profiler()
+    if profiler is None:
+        return None
+    call_count = profiler.call_count
+    # Statistics are reset when a profile report is written
+    delta = call_count - _last_call_count
+    if delta < 0:
+        delta = call_count
+    _last_call_count = call_count
+    return delta
+
+
+def get_staging_bytes(instance) -> int:
+    """Get size of files in the staging directories of the instance.
+
+    Args:
+        instance (pyblish.api.Instance): Publish instance.
+
+    Returns:
+        int: Size in bytes of the files, subdirectories are not included.
+    """
+    directories = set()
+    staging_dir = instance.data.get("stagingDir")
+    if staging_dir:
+        directories.add(os.path.normpath(staging_dir))
+    for repre in instance.data.get("representations") or []:
+        repre_dir = repre.get("stagingDir")
+        if repre_dir:
+            directories.add(os.path.normpath(repre_dir))
+
+    size = 0
+    for directory in directories:
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if entry.is_file():
+                        size += entry.stat().st_size
+        except OSError:
+            continue
+    return size
+
+
+def _get_staging_delta(plugin, instance) -> Optional[int]:
+    if instance is None or not _is_extractor(plugin):
+        return None
+    staging_bytes = get_staging_bytes(instance)
+    delta = staging_bytes - instance.data.get(STAGING_BYTES_KEY, 0)
+    instance.data[STAGING_BYTES_KEY] = staging_bytes
+    return delta
+
+
+def on_plugin_processed(result: Dict[str, Any]):
+    """Record timing of a processed `ayon_max` plugin.
+
+    Registered as pyblish `pluginProcessed` callback.
+
+    Args:
+        result (Dict[str, Any]): Result of the processed plugin.
+    """
+    plugin = result["plugin"]
+    instance = result.get("instance")
+    if instance is not None:
+        context = instance.context
+    else:
+        context = _current_context
+    # Consume pymxs calls of other plugins too, so they are not
+    # accounted to the next `ayon_max` plugin
+    pymxs_calls = _get_pymxs_call_delta()
+    if context is None or result.get("action") or not _is_max_plugin(plugin):
+        return
+
+    context.data.setdefault(PUBLISH_TIMING_KEY, []).append({
+        "plugin": plugin.__name__,
+        "label": getattr(plugin, "label", None) or plugin.__name__,
+        "order": plugin.order,
+        "instance": instance.name if instance is not None else None,
+        "duration": (result.get("duration") or 0.0) / 1000.0,
+        "pymxs_calls": pymxs_calls,
+        "staging_bytes": _get_staging_delta(plugin, instance),
+        "success": bool(result.get("success")),
+    })
+
+
+def set_current_context(context):
+    """Set publish context the context plugins are recorded to.
+
+    Args:
+        context (pyblish.api.Context): Publish context.
+    """
+    global _current_context
+    _current_context = context
+
+
+def get_timing_records(context) -> List[Dict[str, Any]]:
+    """Get timing records of the processed `ayon_max` plugins.
+
+    Args:
+        context (pyblish.api.Context): Publish context.
+
+    Returns:
+        List[Dict[str, Any]]: Records in processing order.
+    """
+    return list(context.data.get(PUBLISH_TIMING_KEY) or [])
+
+
+def install():
+    """Register the plugin timing callback."""
+    global _last_call_count
+    callbacks = pyblish.api.registered_callbacks().get("pluginProcessed")
+    if callbacks and on_plugin_processed in callbacks:
+        return
+    pyblish.api.register_callback("pluginProcessed", on_plugin_processed)
+    profiler = profiling.get_profiler()
+    _last_call_count = profiler.call_count if profiler is not None else 0
@@ -5,12 +5,11 @@ import pyblish.api
 from pymxs import runtime as rt
 
 
-from ayon_max.api.lib import (
-    get_current_renderer,
-    is_general_default_output_regex_matched,
-
+from ayon_max.api.lib import is_general_default_output_regex_matched
+from ayon_max.api.lib_rendersettings import (
+    get_renderer_snapshot,
+    is_supported_renderer,
 )
-from ayon_max.api.lib_rendersettings import is_supported_renderer
 
 
 class ValidateRenderSettingsBase(object):
@@ -34,10 +33,11 @@ class ValidateRenderSettingsBase(object):
         Returns:
             tuple[rt.Renderers.current, str]: The current renderer and its name.
         """
-        renderer = get_current_renderer()
+        snapshot = get_renderer_snapshot(instance.context)
+        renderer = snapshot.renderer
         renderer_name = instance.data.get("renderer")
         if not renderer_name:
-            renderer_name = str(renderer).split(":")[0]
+            renderer_name = snapshot.renderer_name
         return renderer, renderer_name
 
     @classmethod
@@ -135,6 +135,7 @@ class ValidateRenderSettingsBase(object):
         multicam: bool = False,
         cameras: Optional[list[str]] = None,
         sync_current_workfile: bool = True,
+        render_output: Optional[str] = None,
     ) -> list[tuple[str, str]]:
         """Get the invalid render output settings.
 
@@ -147,21 +148,25 @@ class ValidateRenderSettingsBase(object):
                 to validate. Defaults to None.
             sync_current_workfile (bool, optional): Whether to validate against the current
                 workfile name pattern. Defaults to True.
+            render_output (Optional[str], optional): The render output
+                filename to validate. Defaults to `rt.rendOutputFilename`.
 
         Returns:
             list[tuple[str, str]]: A list of tuples containing the error type
                 and the invalid filepath.
         """
         invalid = []
-        beauty_dir = os.path.dirname(rt.rendOutputFilename)
+        if render_output is None:
+            render_output = rt.rendOutputFilename
+        beauty_dir = os.path.dirname(render_output)
         if sync_current_workfile and workfile_pattern not in beauty_dir:
             msg = (
-                f"Invalid render output filename {rt.rendOutputFilename}. "
+                f"Invalid render output filename {render_output}. "
                 f"Filename should contain the workfile name pattern: {workfile_pattern}."
             )
             invalid.append((msg, beauty_dir))
 
-        beauty_fname = os.path.basename(rt.rendOutputFilename)
+        beauty_fname = os.path.basename(render_output)
         if multicam and cameras:
             for camera in cameras:
                 if camera not in beauty_fname:
@@ -0,0 +1,232 @@
+# -*- coding: utf-8 -*-
+"""Session cache of validation results of node based validators.
+
+Node changes are tracked with a `NodeEventCallback`. Validator decorated
+with `cached_validation` returns its previous result when none of the
+instance members changed since its last run.
+
+The callback is installed only while the cache is enabled in settings.
+Validators of data which does not fire node events, e.g. tyFlow events
+and operators, must not be cached.
+"""
+from __future__ import annotations
+import json
+import functools
+from typing import Dict, NamedTuple, Optional, Tuple
+
+try:
+    from pymxs import runtime as rt
+
+except ImportError:
+    rt = None
+
+from ayon_core.pipeline.publish import PublishValidationError
+
+
+CALLBACK_ID = "AyonValidationCache"
+
+# Tracked node versions are dropped, with all cached results, when more
+# nodes than this changed in the session.
+MAX_TRACKED_NODES = 100_000
+
+# Node events changing the inputs of node based validators.
+# Selection, hide and freeze changes are ignored on purpose.
+NODE_EVENTS = (
+    "added",
+    "deleted",
+    "linkChanged",
+    "layerChanged",
+    "groupChanged",
+    "hierarchyOtherEvent",
+    "modelStructured",
+    "geometryChanged",
+    "topologyChanged",
+    "mappingChanged",
+    "extentionChannelChanged",
+    "modelOtherEvent",
+    "materialStructured",
+    "materialOtherEvent",
+    "controllerStructured",
+    "controllerOtherEvent",
+    "nameChanged",
+    "renderPropertiesChanged",
+    "userPropertiesChanged",
+    "propertiesOtherEvent",
+)
+
+MS_ANIM_HANDLES = """
+fn ayon_get_anim_handles nodes =
+(
+    for n in nodes collect (if isValidNode n then getHandleByAnim n else 0)
+)
+"""
+
+
+class _CacheEntry(NamedTuple):
+    state: Tuple
+    error: Optional[PublishValidationError]
+
+
+class _ValidationCache(object):
+    """Validation results with change counters of the scene nodes."""
+
+    def __init__(self):
+        self.installed = False
+        self.scene_generation = 0
+        self.node_versions: Dict[int, int] = {}
+        self.results: Dict[Tuple[str, str], _CacheEntry] = {}
+        self._callback = None
+        self._get_anim_handles = None
+
+    def get_anim_handles(self, nodes) -> Tuple[int, ...]:
+        if self._get_anim_handles is None:
+            self._get_anim_handles = rt.Execute(MS_ANIM_HANDLES)
+        return tuple(int(handle) for handle in self._get_anim_handles(nodes))
+
+    def on_node_event(self, event, handles):
+        for handle in handles:
+            handle = int(handle)
+            self.node_versions[handle] = self.node_versions.get(handle, 0) + 1
+        if len(self.node_versions) > MAX_TRACKED_NODES:
+            self.on_scene_changed()
+
+    def on_scene_changed(self, *args):
+        self.scene_generation += 1
+        self.node_versions.clear()
+        self.results.clear()
+
+
+_cache = _ValidationCache()
+
+
+def install():
+    """Start tracking scene changes for the validation cache."""
+    if _cache.installed:
+        return
+    kwargs = {event: _cache.on_node_event for event in NODE_EVENTS}
+    # Keep reference, the callback is removed once garbage collected
+    _cache._callback = rt.NodeEventCallback(**kwargs)
+    rt.callbacks.removeScripts(id=rt.name(CALLBACK_ID))
+    for event in ("filePostOpen", "systemPostNew", "systemPostReset"):
+        rt.callbacks.addScript(
+            rt.Name(event),
+            _cache.on_scene_changed,
+            id=rt.name(CALLBACK_ID)
+        )
+    _cache.installed = True
+
+
+def uninstall():
+    """Stop tracking scene changes and drop all cached results."""
+    if not _cache.installed:
+        return
+    rt.callbacks.removeScripts(id=rt.name(CALLBACK_ID))
+    _cache._callback = None
+    _cache.on_scene_changed()
+    _cache.installed = False
+
+
+def clear():
+    """Drop all cached validation results."""
+    _cache.results.clear()
+
+
+def is_enabled_in_settings(project_settings) -> bool:
+    """Check if the validation cache is enabled in project settings.
+
+    Args:
+        project_settings (dict): Project settings.
+
+    Returns:
+        bool: Cache is enabled.
+    """
+    cache_settings = (
+        (project_settings or {}).get("max", {})
+        .get("publish", {})
+        .get("ValidationCache", {})
+    )
+    return bool(cache_settings.get("enabled"))
+
+
+def update_from_settings(project_settings):
+    """Install or uninstall the cache based on project settings.
+
+    Args:
+        project_settings (dict): Project settings.
+    """
+    if is_enabled_in_settings(project_settings):
+        install()
+    else:
+        uninstall()
+
+
+def _is_enabled(plugin, instance) -> bool:
+    if not _cache.installed:
+        return False
+    if not is_enabled_in_settings(
+        instance.context.data.get("project_settings")
+    ):
+        # Cache was turned off since it was installed
+        uninstall()
+        return False
+    is_active = getattr(plugin, "is_active", None)
+    return is_active is None or bool(is_active(instance.data))
+
+
+def _get_state(plugin, instance) -> Tuple:
+    """Get state of validator inputs to compare cached results against."""
+    members = instance.data.get("members") or []
+    handles = _cache.get_anim_handles(list(members)) if members else ()
+    versions = tuple(_cache.node_versions.get(handle, 0) for handle in handles)
+    plugin_settings = (
+        instance.context.data.get("project_settings", {})
+        .get("max", {})
+        .get("publish", {})
+        .get(plugin.__class__.__name__)
+    )
+    return (
+        _cache.scene_generation,
+        handles,
+        versions,
+        instance.data.get("folderPath"),
+        instance.data.get("productName"),
+        json.dumps(plugin_settings, sort_keys=True, default=str),
+    )
+
+
+def cached_validation(process):
+    """Decorate `process` of a node based validator to cache its result.
+
+    The cache is bypassed when it is disabled in settings, when the plugin
+    is not active or when the cache was not installed, e.g. in headless
+    mode.
+    """
+    @functools.wraps(process)
+    def wrapper(plugin, instance, *args, **kwargs):
+        if not _is_enabled(plugin, instance):
+            return process(plugin, instance, *args, **kwargs)
+
+        key = (
+            instance.data.get("instance_id") or instance.name,
+            plugin.__class__.__name__,
+        )
+        state = _get_state(plugin, instance)
+        entry = _cache.results.get(key)
+        if entry is not None and entry.state == state:
+            plugin.log.debug(
+                "Instance members did not change since last validation. "
+                "Using cached result."
+            )
+            if entry.error is not None:
+                raise entry.error
+            return None
+
+        try:
+            result = process(plugin, instance, *args, **kwargs)
+        except PublishValidationError as exc:
+            _cache.results[key] = _CacheEntry(state, exc)
+            raise
+        _cache.results[key] = _CacheEntry(state, None)
+        return result
+
+    return wrapper
@@ -1,6 +1,7 @@
 """3dsmax workfile template builder implementation"""
 import json
 from pathlib import Path
+from typing import Dict, List, NamedTuple, Set
 
 try:
     from pymxs import runtime as rt
@@ -8,7 +9,11 @@ try:
 except ImportError:
     rt = None
 
-from ayon_core.pipeline import registered_host
+from ayon_core.pipeline import (
+    registered_host,
+    AVALON_CONTAINER_ID,
+    AYON_CONTAINER_ID,
+)
 from ayon_core.pipeline.workfile.workfile_template_builder import (
     TemplateAlreadyImported,
     AbstractTemplateBuilder,
@@ -24,15 +29,103 @@ from .lib import (
     imprint,
     read,
     get_main_window,
+    suspended_refresh,
     update_content_on_context_change,
 )
+from .lib_settings import get_current_max_settings
 
 
 PLACEHOLDER_SET = "PLACEHOLDERS_SET"
 
+# Collects placeholder nodes and representations of loaded containers
+# in a single pass over the scene objects.
+MS_TEMPLATE_SCENE_INDEX = """
+fn ayon_get_template_scene_index container_ids =
+(
+    local placeholders = #()
+    local containers = #()
+    for n in objects do
+    (
+        local identifier = getUserProp n "plugin_identifier"
+        if identifier != undefined do
+            append placeholders #(identifier as string, n.name)
+        local node_id = getUserProp n "id"
+        if node_id != undefined do
+        (
+            local repre_id = undefined
+            if (findItem container_ids (node_id as string)) > 0 do
+                repre_id = getUserProp n "representation"
+            if repre_id != undefined do
+                append containers #(n.name, repre_id as string)
+        )
+    )
+    #(placeholders, containers)
+)
+"""
+
+
+class TemplateSceneIndex(NamedTuple):
+    """Placeholders and loaded representations of the scene."""
+    # Placeholder node names by plugin identifier
+    placeholder_nodes: Dict[str, List[str]]
+    # Representation id by container node name
+    representation_ids: Dict[str, str]
+
+    def get_loaded_representation_ids(self) -> Set[str]:
+        return set(self.representation_ids.values())
+
+
+def get_template_scene_index() -> TemplateSceneIndex:
+    """Index placeholders and loaded containers in a single MaxScript call.
+
+    Returns:
+        TemplateSceneIndex: Index of the current scene.
+    """
+    rt.Execute(MS_TEMPLATE_SCENE_INDEX)
+    placeholders, containers = rt.ayon_get_template_scene_index(
+        [AYON_CONTAINER_ID, AVALON_CONTAINER_ID])
+
+    placeholder_nodes = {}
+    for identifier, node_name in placeholders:
+        placeholder_nodes.setdefault(str(identifier), []).append(
+            str(node_name))
+    return TemplateSceneIndex(
+        placeholder_nodes,
+        {
+            str(container_name): str(repre_id)
+            for container_name, repre_id in containers
+        }
+    )
+
 
 class MaxTemplateBuilder(AbstractTemplateBuilder):
     """Concrete implementation of AbstractTemplateBuilder for 3dsmax"""
+
+    @staticmethod
+    def _get_build_settings() -> dict:
+        return get_current_max_settings()["templated_workfile_build"]
+
+    @property
+    def batch_population(self) -> bool:
+        """Placeholders are populated in batch mode.
+
+        Representations of all load placeholders are queried concurrently
+        before the first of them is loaded.
+        """
+        return self._get_build_settings().get("batch_population", False)
+
+    @property
+    def prefetch_workers(self) -> int:
+        """Number of threads querying representations of placeholders."""
+        return max(1, self._get_build_settings().get("prefetch_workers", 1))
+
+    def populate_scene_placeholders(self, *args, **kwargs):
+        """Populate placeholders with the scene redraw suspended."""
+        if not self.batch_population:
+            return super().populate_scene_placeholders(*args, **kwargs)
+        with suspended_refresh():
+            return super().populate_scene_placeholders(*args, **kwargs)
+
     def import_template(self, path):
         """Import template into current scene.
         Block if a template is already loaded.
@@ -90,28 +183,16 @@ class MaxPlaceholderPlugin(PlaceholderPlugin):
     def _create_placeholder_name(self, placeholder_data):
         return self.identifier.replace(".", "_")
 
-    def _collect_scene_placeholders(self):
-        nodes_by_identifier = self.builder.get_shared_populate_data(
-            "placeholder_nodes"
-        )
-        if nodes_by_identifier is None:
-            # Cache placeholder data to shared data
-            nodes = [
-                node for node in rt.Objects
-                if rt.doesUserPropExist(node, "plugin_identifier")
-            ]
-
-            nodes_by_identifier = {}
-            for node in nodes:
-                identifier = rt.getUserProp(node, "plugin_identifier")
-                nodes_by_identifier.setdefault(identifier, []).append(node.name)
-
-            # Set the cache
-            self.builder.set_shared_populate_data(
-                "placeholder_nodes", nodes_by_identifier
-            )
+    def _get_scene_index(self) -> TemplateSceneIndex:
+        """Get index of the scene shared by all placeholder plugins."""
+        scene_index = self.builder.get_shared_populate_data("scene_index")
+        if scene_index is None:
+            scene_index = get_template_scene_index()
+            self.builder.set_shared_populate_data("scene_index", scene_index)
+        return scene_index
 
-        return nodes_by_identifier
+    def _collect_scene_placeholders(self):
+        return self._get_scene_index().placeholder_nodes
 
     def create_placeholder(self, placeholder_data):
 
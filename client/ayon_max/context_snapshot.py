@@ -0,0 +1,93 @@
+"""Snapshot of launch context shared from the launcher with 3ds Max.
+
+The pre-launch hook writes the project settings and task entity already
+resolved by the launcher to a temporary file, so Max does not fetch them
+again from the server on startup. The file is deleted once Max read it.
+"""
+import os
+import json
+import time
+import tempfile
+from typing import Any, Dict, Optional
+
+
+# Environment variable with path to the snapshot of the launch context
+CONTEXT_SNAPSHOT_ENV = "AYON_MAX_CONTEXT_SNAPSHOT"
+CONTEXT_SNAPSHOT_VERSION = 1
+
+
+def write_context_snapshot(
+    project_name: str,
+    folder_path: str,
+    task_name: str,
+    project_settings: Dict[str, Any],
+    task_entity: Optional[Dict[str, Any]] = None,
+) -> str:
+    """Write snapshot of the launch context to a temporary file.
+
+    Args:
+        project_name (str): Project name.
+        folder_path (str): Folder path.
+        task_name (str): Task name.
+        project_settings (Dict[str, Any]): Resolved project settings.
+        task_entity (Optional[Dict[str, Any]]): Task entity.
+
+    Returns:
+        str: Path to the snapshot file.
+    """
+    data = {
+        "version": CONTEXT_SNAPSHOT_VERSION,
+        "created": time.time(),
+        "project_name": project_name,
+        "folder_path": folder_path,
+        "task_name": task_name,
+        "project_settings": project_settings,
+        "task_entity": task_entity,
+    }
+    fd, snapshot_path = tempfile.mkstemp(
+        prefix="ayon_max_context_", suffix=".json")
+    with os.fdopen(fd, "w") as f:
+        json.dump(data, f, separators=(",", ":"), default=str)
+    return snapshot_path
+
+
+def read_context_snapshot(
+    project_name: str,
+    folder_path: Optional[str],
+    task_name: Optional[str],
+) -> Optional[Dict[str, Any]]:
+    """Read snapshot of the launch context if it matches the context.
+
+    The snapshot file is deleted after it is read, it is used only once.
+
+    Args:
+        project_name (str): Current project name.
+        folder_path (Optional[str]): Current folder path.
+        task_name (Optional[str]): Current task name.
+
+    Returns:
+        Optional[Dict[str, Any]]: Snapshot data, None when there is no
+            snapshot or it was written for another context.
+    """
+    snapshot_path = os.getenv(CONTEXT_SNAPSHOT_ENV)
+    if not snapshot_path or not os.path.isfile(snapshot_path):
+        return None
+    try:
+        with open(snapshot_path, "r") as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return None
+    finally:
+        try:
+            os.remove(snapshot_path)
+        except OSError:
+            pass
+
+    if (
+        data.get("version") != CONTEXT_SNAPSHOT_VERSION
+        or data.get("project_name") != project_name
+        or data.get("folder_path") != folder_path
+        or data.get("task_name") != task_name
+    ):
+        return None
+    return data
@@ -0,0 +1,41 @@
+from ayon_applications import PreLaunchHook, LaunchTypes
+from ayon_max.context_snapshot import (
+    CONTEXT_SNAPSHOT_ENV,
+    write_context_snapshot,
+)
+
+
+class PreContextSnapshot(PreLaunchHook):
+    """Write snapshot of settings and task entity to a temporary file.
+
+    3ds Max reads the snapshot on startup instead of fetching the project
+    settings and task entity from the server again, then deletes it.
+
+    Hook `GlobalHostDataHook` must be executed before this hook.
+    """
+    app_groups = {"max"}
+    launch_types = {LaunchTypes.local}
+
+    def execute(self):
+        project_settings = self.data.get("project_settings")
+        folder_entity = self.data.get("folder_entity")
+        task_entity = self.data.get("task_entity")
+        if not all((project_settings, folder_entity, task_entity)):
+            self.log.debug(
+                "Launch context is not complete. Skipping context snapshot.")
+            return
+
+        try:
+            snapshot_path = write_context_snapshot(
+                self.data["project_name"],
+                folder_entity["path"],
+                task_entity["name"],
+                project_settings,
+                task_entity=task_entity,
+            )
+        except OSError:
+            self.log.warning(
+                "Failed to write context snapshot.", exc_info=True)
+            return
+        self.launch_context.env[CONTEXT_SNAPSHOT_ENV] = snapshot_path
+        self.log.debug(f"Context snapshot written to {snapshot_path}")
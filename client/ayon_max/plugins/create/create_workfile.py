@@ -2,7 +2,7 @@
 """Creator plugin for creating workfiles."""
 from ayon_core.pipeline import CreatedInstance, AutoCreator
 from ayon_max.api import plugin
-from ayon_max.api.lib import read, imprint
+from ayon_max.api.lib import imprint
 from pymxs import runtime as rt
 
 
@@ -90,13 +90,9 @@ class CreateWorkfile(plugin.MaxCreatorBase, AutoCreator):
             current_instance["productName"] = product_name
 
     def collect_instances(self):
-        self.cache_instance_data(self.collection_shared_data)
-        cached_instances = self.collection_shared_data["max_cached_instances"]
-        for instance in cached_instances.get(self.identifier, []):
-            if not rt.getNodeByName(instance):
-                continue
+        for instance_data in self.get_cached_instances_data():
             created_instance = CreatedInstance.from_existing(
-                read(rt.GetNodeByName(instance)), self
+                instance_data, self
             )
             self._add_instance_to_context(created_instance)
 
@@ -13,6 +13,7 @@ from ayon_max.api.pipeline import (
     remove_container_data
 )
 from ayon_core.pipeline import load
+from pymxs import runtime as rt
 
 
 class FbxLoader(load.LoaderPlugin):
@@ -28,7 +29,6 @@ class FbxLoader(load.LoaderPlugin):
     color = "white"
 
     def load(self, context, name=None, namespace=None, data=None):
-        from pymxs import runtime as rt
         filepath = self.filepath_from_context(context)
         filepath = os.path.normpath(filepath)
         rt.FBXImporterSetParam("Animation", True)
@@ -56,8 +56,6 @@ class FbxLoader(load.LoaderPlugin):
             namespace, loader=self.__class__.__name__)
 
     def update(self, container, context):
-        from pymxs import runtime as rt
-
         repre_entity = context["representation"]
         path = os.path.normpath(self.filepath_from_context(context))
         node_name = container["instance_node"]
@@ -100,7 +98,5 @@ class FbxLoader(load.LoaderPlugin):
         self.update(container, context)
 
     def remove(self, container):
-        from pymxs import runtime as rt
-
         node = rt.GetNodeByName(container["instance_node"])
         remove_container_data(node)
@@ -12,7 +12,7 @@ from ayon_core.pipeline.colorspace import (
     get_imageio_file_rules,
     get_imageio_file_rules_colorspace_from_filepath,
 )
-from ayon_core.settings import get_project_settings
+from ayon_max.api.lib_settings import get_current_project_settings
 from ayon_max.api.lib import (
     unique_namespace,
     imprint,
@@ -200,7 +200,7 @@ class ImageLoader(load.LoaderPlugin):
         # Assume colorspace from filepath based on project settings
         project_name = context["project"]["name"]
         host_name = get_current_host_name()
-        project_settings = get_project_settings(project_name)
+        project_settings = get_current_project_settings(project_name)
 
         config_data = get_current_context_imageio_config_preset(
             project_settings=project_settings
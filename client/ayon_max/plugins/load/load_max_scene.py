@@ -14,6 +14,7 @@ from ayon_max.api.pipeline import (
     remove_container_data
 )
 from ayon_core.pipeline import load
+from pymxs import runtime as rt
 
 
 class MaterialDupOptionsWindow(QtWidgets.QDialog):
@@ -102,7 +103,6 @@ class MaxSceneLoader(load.LoaderPlugin):
         ]
 
     def load(self, context, name=None, namespace=None, options=None):
-        from pymxs import runtime as rt
         mat_dup_options = options.get("mtldup", self.mtl_dup_default)
         path = self.filepath_from_context(context)
         path = os.path.normpath(path)
@@ -128,8 +128,6 @@ class MaxSceneLoader(load.LoaderPlugin):
             namespace, loader=self.__class__.__name__)
 
     def update(self, container, context):
-        from pymxs import runtime as rt
-
         repre_entity = context["representation"]
         path = os.path.normpath(self.filepath_from_context(context))
         node_name = container["instance_node"]
@@ -186,6 +184,5 @@ class MaxSceneLoader(load.LoaderPlugin):
         self.update(container, context)
 
     def remove(self, container):
-        from pymxs import runtime as rt
         node = rt.GetNodeByName(container["instance_node"])
         remove_container_data(node)
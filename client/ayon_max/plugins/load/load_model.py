@@ -9,6 +9,7 @@ from ayon_max.api import lib
 from ayon_max.api.lib import (
     maintained_selection, unique_namespace
 )
+from pymxs import runtime as rt
 
 
 class ModelAbcLoader(load.LoaderPlugin):
@@ -24,8 +25,6 @@ class ModelAbcLoader(load.LoaderPlugin):
     color = "orange"
 
     def load(self, context, name=None, namespace=None, data=None):
-        from pymxs import runtime as rt
-
         file_path = os.path.normpath(self.filepath_from_context(context))
 
         abc_before = {
@@ -75,8 +74,6 @@ class ModelAbcLoader(load.LoaderPlugin):
         )
 
     def update(self, container, context):
-        from pymxs import runtime as rt
-
         repre_entity = context["representation"]
         path = os.path.normpath(self.filepath_from_context(context))
         node = rt.GetNodeByName(container["instance_node"])
@@ -103,26 +100,12 @@ class ModelAbcLoader(load.LoaderPlugin):
         self.update(container, context)
 
     def remove(self, container):
-        from pymxs import runtime as rt
         node = rt.GetNodeByName(container["instance_node"])
         remove_container_data(node)
 
 
     @staticmethod
     def get_container_children(parent, type_name):
-        from pymxs import runtime as rt
-
-        def list_children(node):
-            children = []
-            for c in node.Children:
-                children.append(c)
-                children += list_children(c)
-            return children
-
-        filtered = []
-        for child in list_children(parent):
-            class_type = str(rt.ClassOf(child.baseObject))
-            if class_type == type_name:
-                filtered.append(child)
-
-        return filtered
+        from ayon_max.api.lib_hierarchy import get_descendants
+
+        return get_descendants(parent, class_name=type_name)
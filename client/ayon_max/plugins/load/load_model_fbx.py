@@ -12,6 +12,7 @@ from ayon_max.api.lib import (
     object_transform_set
 )
 from ayon_max.api.lib import maintained_selection
+from pymxs import runtime as rt
 
 
 class FbxModelLoader(load.LoaderPlugin):
@@ -27,7 +28,6 @@ class FbxModelLoader(load.LoaderPlugin):
     color = "white"
 
     def load(self, context, name=None, namespace=None, data=None):
-        from pymxs import runtime as rt
         filepath = self.filepath_from_context(context)
         filepath = os.path.normpath(filepath)
         rt.FBXImporterSetParam("Animation", False)
@@ -53,8 +53,6 @@ class FbxModelLoader(load.LoaderPlugin):
             namespace, loader=self.__class__.__name__)
 
     def update(self, container, context):
-        from pymxs import runtime as rt
-
         repre_entity = context["representation"]
         path = os.path.normpath(self.filepath_from_context(context))
         node_name = container["instance_node"]
@@ -100,6 +98,5 @@ class FbxModelLoader(load.LoaderPlugin):
         self.update(container, context)
 
     def remove(self, container):
-        from pymxs import runtime as rt
         node = rt.GetNodeByName(container["instance_node"])
         remove_container_data(node)
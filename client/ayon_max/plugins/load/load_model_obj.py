@@ -14,6 +14,7 @@ from ayon_max.api.pipeline import (
     remove_container_data
 )
 from ayon_core.pipeline import load
+from pymxs import runtime as rt
 
 
 class ObjLoader(load.LoaderPlugin):
@@ -29,8 +30,6 @@ class ObjLoader(load.LoaderPlugin):
     color = "white"
 
     def load(self, context, name=None, namespace=None, data=None):
-        from pymxs import runtime as rt
-
         filepath = os.path.normpath(self.filepath_from_context(context))
         self.log.debug("Executing command to import..")
 
@@ -52,8 +51,6 @@ class ObjLoader(load.LoaderPlugin):
             namespace, loader=self.__class__.__name__)
 
     def update(self, container, context):
-        from pymxs import runtime as rt
-
         repre_entity = context["representation"]
         path = os.path.normpath(self.filepath_from_context(context))
         node_name = container["instance_node"]
@@ -90,6 +87,5 @@ class ObjLoader(load.LoaderPlugin):
         self.update(container, context)
 
     def remove(self, container):
-        from pymxs import runtime as rt
         node = rt.GetNodeByName(container["instance_node"])
         remove_container_data(node)
@@ -13,6 +13,7 @@ from ayon_max.api.pipeline import (
     get_previous_loaded_object,
     remove_container_data
 )
+from pymxs import runtime as rt
 
 
 class AbcLoader(load.LoaderPlugin):
@@ -28,8 +29,6 @@ class AbcLoader(load.LoaderPlugin):
     color = "orange"
 
     def load(self, context, name=None, namespace=None, data=None):
-        from pymxs import runtime as rt
-
         file_path = self.filepath_from_context(context)
         file_path = os.path.normpath(file_path)
 
@@ -84,8 +83,6 @@ class AbcLoader(load.LoaderPlugin):
         )
 
     def update(self, container, context):
-        from pymxs import runtime as rt
-
         repre_entity = context["representation"]
         path = os.path.normpath(self.filepath_from_context(context))
         node = rt.GetNodeByName(container["instance_node"])
@@ -112,26 +109,12 @@ class AbcLoader(load.LoaderPlugin):
         self.update(container, context)
 
     def remove(self, container):
-        from pymxs import runtime as rt
         node = rt.GetNodeByName(container["instance_node"])
         remove_container_data(node)
 
 
     @staticmethod
     def get_container_children(parent, type_name):
-        from pymxs import runtime as rt
-
-        def list_children(node):
-            children = []
-            for c in node.Children:
-                children.append(c)
-                children += list_children(c)
-            return children
-
-        filtered = []
-        for child in list_children(parent):
-            class_type = str(rt.classOf(child.baseObject))
-            if class_type == type_name:
-                filtered.append(child)
-
-        return filtered
+        from ayon_max.api.lib_hierarchy import get_descendants
+
+        return get_descendants(parent, class_name=type_name)
@@ -12,6 +12,7 @@ from ayon_max.api.pipeline import (
     remove_container_data
 )
 from ayon_core.pipeline import load
+from pymxs import runtime as rt
 
 
 class PointCloudLoader(load.LoaderPlugin):
@@ -29,7 +30,6 @@ class PointCloudLoader(load.LoaderPlugin):
 
     def load(self, context, name=None, namespace=None, data=None):
         """load point cloud by tyCache"""
-        from pymxs import runtime as rt
         filepath = os.path.normpath(self.filepath_from_context(context))
         obj = rt.tyCache()
         obj.filename = filepath
@@ -48,7 +48,6 @@ class PointCloudLoader(load.LoaderPlugin):
 
     def update(self, container, context):
         """update the container"""
-        from pymxs import runtime as rt
 
         repre_entity = context["representation"]
         path = os.path.normpath(self.filepath_from_context(context))
@@ -71,6 +70,5 @@ class PointCloudLoader(load.LoaderPlugin):
 
     def remove(self, container):
         """remove the container"""
-        from pymxs import runtime as rt
         node = rt.GetNodeByName(container["instance_node"])
         remove_container_data(node)
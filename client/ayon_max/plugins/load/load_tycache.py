@@ -11,6 +11,7 @@ from ayon_max.api.pipeline import (
     remove_container_data
 )
 from ayon_core.pipeline import load
+from pymxs import runtime as rt
 
 
 class TyCacheLoader(load.LoaderPlugin):
@@ -27,7 +28,6 @@ class TyCacheLoader(load.LoaderPlugin):
 
     def load(self, context, name=None, namespace=None, data=None):
         """Load tyCache"""
-        from pymxs import runtime as rt
         filepath = os.path.normpath(self.filepath_from_context(context))
         obj = rt.tyCache()
         obj.filename = filepath
@@ -46,7 +46,6 @@ class TyCacheLoader(load.LoaderPlugin):
 
     def update(self, container, context):
         """update the container"""
-        from pymxs import runtime as rt
 
         repre_entity = context["representation"]
         path = os.path.normpath(self.filepath_from_context(context))
@@ -67,7 +66,6 @@ class TyCacheLoader(load.LoaderPlugin):
 
     def remove(self, container):
         """remove the container"""
-        from pymxs import runtime as rt
         node = rt.GetNodeByName(container["instance_node"])
         remove_container_data(node)
         rt.Delete(node)
@@ -86,7 +84,6 @@ class TySplineCacheLoader(TyCacheLoader):
     color = "green"
 
     def load(self, context, name=None, namespace=None, data=None):
-        from pymxs import runtime as rt
         filepath = os.path.normpath(self.filepath_from_context(context))
         obj = rt.tyCache()
         obj.filename = filepath
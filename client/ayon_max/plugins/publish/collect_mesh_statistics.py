@@ -0,0 +1,22 @@
+# -*- coding: utf-8 -*-
+"""Collect mesh statistics of instance members."""
+import pyblish.api
+from ayon_max.api.lib_mesh import get_instance_mesh_statistics
+
+
+class CollectMeshStatistics(pyblish.api.InstancePlugin):
+    """Collect mesh statistics of the members for the model validators.
+
+    Vertex, face, texture vertex and map channel counts of all members
+    are queried in a single MaxScript pass.
+    """
+
+    order = pyblish.api.CollectorOrder + 0.1
+    label = "Collect Mesh Statistics"
+    families = ["model"]
+    hosts = ["max"]
+
+    def process(self, instance):
+        statistics = get_instance_mesh_statistics(instance)
+        self.log.debug(
+            f"Collected mesh statistics for {len(statistics)} member(s).")
@@ -0,0 +1,19 @@
+# -*- coding: utf-8 -*-
+"""Collect publish context for the timing of context plugins."""
+import pyblish.api
+from ayon_max.api import publish_timing
+
+
+class CollectPublishTiming(pyblish.api.ContextPlugin):
+    """Set the publish context timing of context plugins is recorded to.
+
+    Results of context plugins passed to the `pluginProcessed` callback
+    do not hold the context, unlike instances of instance plugins.
+    """
+
+    order = pyblish.api.CollectorOrder - 0.5
+    label = "Collect Publish Timing"
+    hosts = ["max"]
+
+    def process(self, context):
+        publish_timing.set_current_context(context)
@@ -12,12 +12,17 @@ from ayon_core.pipeline.publish import KnownPublishError
 from ayon_max.api import colorspace
 from ayon_max.api.lib import (
     get_max_version,
-    get_current_renderer,
     get_vray_settings,
     get_multipass_setting,
 )
-from ayon_max.api.lib_rendersettings import RenderSettings
-from ayon_max.api.lib_renderproducts import RenderProducts
+from ayon_max.api.lib_rendersettings import (
+    RenderSettings,
+    get_renderer_snapshot,
+)
+from ayon_max.api.lib_renderproducts import (
+    RenderProducts,
+    RenderProductSequence,
+)
 
 
 def get_cameras_from_node(members) -> list:
@@ -69,11 +74,16 @@ class CollectRender(pyblish.api.InstancePlugin):
                 or instance.data.get("AssetName", "").strip(".")
             )
             instance.data["original_workfile_pattern"] = filename_pattern
-        renderer = get_current_renderer()
-        renderer_name = str(renderer).split(":")[0]
-        renderproducts = RenderProducts(context.data["project_settings"])
+        snapshot = get_renderer_snapshot(context)
+        renderer = snapshot.renderer
+        renderer_name = snapshot.renderer_name
+        renderproducts = RenderProducts(
+            context.data["project_settings"], snapshot=snapshot
+        )
         img_format = renderproducts.image_format()
-        files_by_aov: Dict[str, list[str]] = renderproducts.get_render_products()
+        files_by_aov: Dict[str, RenderProductSequence] = (
+            renderproducts.get_render_products()
+        )
 
 
         camera = rt.viewport.GetCamera()
@@ -98,7 +108,8 @@ class CollectRender(pyblish.api.InstancePlugin):
                 context.data["project_settings"]
             )
             render_dir = os.path.dirname(render_output)
-            render_settings = RenderSettings(data=instance.data)
+            render_settings = RenderSettings(
+                context.data["project_settings"], data=instance.data)
             outputs = render_settings.batch_render_layers_by_multi_camera(
                 render_dir, sel_cam
             )
@@ -110,10 +121,14 @@ class CollectRender(pyblish.api.InstancePlugin):
             )
 
         if "expectedFiles" not in instance.data:
-            instance.data["expectedFiles"] = list()
-            instance.data["files"] = list()
-            instance.data["expectedFiles"].append(files_by_aov)
-            instance.data["files"].append(files_by_aov)
+            # Instance data must stay JSON serializable, so the sequences
+            # are expanded to file path lists here.
+            expected_files = {
+                aov_name: list(sequence)
+                for aov_name, sequence in files_by_aov.items()
+            }
+            instance.data["expectedFiles"] = [expected_files]
+            instance.data["files"] = [expected_files]
         # OCIO config not support in
         # most of the 3dsmax renderers
         # so this is currently hard coded
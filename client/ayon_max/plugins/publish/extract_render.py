@@ -1,6 +1,16 @@
 from __future__ import annotations
+import os
+import json
+import hashlib
+from typing import Dict, List, Optional
+
 from ayon_core.pipeline import publish
 from ayon_core.pipeline.publish import KnownPublishError
+from ayon_max.api.lib_renderproducts import (
+    RenderProducts,
+    get_render_frame_ranges,
+)
+from ayon_max.api.lib_rendersettings import get_renderer_snapshot
 
 
 try:
@@ -11,11 +21,84 @@ except ImportError:
     rt = None
 
 
+class RenderCheckpoint(object):
+    """Progress file recording the frames of a local render already written.
+
+    The checkpoint is bound to the expected files of the render, so a
+    checkpoint written for different render outputs or frame range is
+    ignored instead of skipping frames which were never rendered.
+
+    Args:
+        path (str): Path to the checkpoint file.
+        files_by_aov (Dict[str, List[str]]): Expected files by AOV name.
+    """
+
+    def __init__(self, path: str, files_by_aov: Dict[str, List[str]]):
+        self.path = path
+        self.signature = self._get_signature(files_by_aov)
+        self.frames = set()
+
+    @staticmethod
+    def _get_signature(files_by_aov: Dict[str, List[str]]) -> str:
+        data = json.dumps(
+            {aov: list(files) for aov, files in files_by_aov.items()},
+            sort_keys=True
+        )
+        return hashlib.sha1(data.encode("utf-8")).hexdigest()
+
+    def load(self) -> set:
+        """Load rendered frames from the checkpoint file.
+
+        Returns:
+            set: Frames recorded as rendered. Empty when the checkpoint
+                does not exist or belongs to another render.
+        """
+        self.frames = set()
+        if not os.path.exists(self.path):
+            return self.frames
+        try:
+            with open(self.path, "r") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return self.frames
+
+        if data.get("signature") == self.signature:
+            self.frames = set(data.get("frames", []))
+        return self.frames
+
+    def add(self, frame: int):
+        """Record frame as rendered and write the checkpoint to disk.
+
+        Args:
+            frame (int): Rendered frame.
+        """
+        self.frames.add(frame)
+        data = {
+            "signature": self.signature,
+            "frames": sorted(self.frames),
+        }
+        # Write to temporary file first so an interrupted write never
+        # leaves a corrupted checkpoint behind.
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(data, f)
+        os.replace(tmp_path, self.path)
+
+    def remove(self):
+        """Remove the checkpoint file once the render is complete."""
+        if os.path.exists(self.path):
+            os.remove(self.path)
+
+
 class ExtractLocalRender(publish.Extractor):
     """Extract local render for 3dsmax"""
 
     label = "Extract Local Render"
     families = ["maxrender"]
+    settings_category = "max"
+
+    # Settings
+    resumable = False
 
     def process(self, instance):
         # Skip if explicitly marked for farm
@@ -37,7 +120,20 @@ class ExtractLocalRender(publish.Extractor):
                 if camera else rt.viewport.GetCamera()
             )
 
-            for frame in range(int(rt.rendStart), int(rt.rendEnd) + 1):
+            frames = [
+                frame
+                for frame_range in get_render_frame_ranges()
+                for frame in frame_range
+            ]
+            checkpoint = None
+            if self.resumable:
+                checkpoint = self._get_checkpoint(instance, frames)
+                if checkpoint is not None:
+                    frames = self._get_frames_to_render(
+                        instance, frames, checkpoint
+                    )
+
+            for frame in frames:
                 _, cancelled = rt.render(
                     frame=frame,
                     vfb=False,
@@ -47,9 +143,106 @@ class ExtractLocalRender(publish.Extractor):
                 if cancelled:
                     raise KnownPublishError(f"Render cancelled at frame {frame}.")
 
-                self.log.debug("Local render extraction completed.")
+                if checkpoint is not None:
+                    checkpoint.add(frame)
+
+            if checkpoint is not None:
+                checkpoint.remove()
+            self.log.debug("Local render extraction completed.")
         else:
             self.log.debug(
                 "Local render extraction for multi-camera is already "
                 "performed during multi-camera scene extraction."
             )
+
+    def _get_files_by_aov(self, instance) -> Dict[str, List[str]]:
+        """Get expected files by AOV for the instance.
+
+        Uses the expected files collected by `CollectRender` and falls back
+        to the render products of the current scene.
+        """
+        expected_files = instance.data.get("expectedFiles")
+        if expected_files:
+            return expected_files[0]
+        project_settings = instance.context.data["project_settings"]
+        snapshot = get_renderer_snapshot(instance.context)
+        return RenderProducts(
+            project_settings, snapshot=snapshot
+        ).get_render_products()
+
+    def _get_checkpoint(
+        self, instance, frames: List[int]
+    ) -> Optional[RenderCheckpoint]:
+        """Get render checkpoint stored next to the beauty output.
+
+        Args:
+            instance (pyblish.api.Instance): Render instance.
+            frames (List[int]): Frames of the render.
+
+        Returns:
+            Optional[RenderCheckpoint]: Checkpoint, None when the expected
+                files can't be mapped to the rendered frames.
+        """
+        files_by_aov = self._get_files_by_aov(instance)
+        beauty_files = files_by_aov.get("beauty")
+        if not beauty_files or any(
+            len(files) != len(frames) for files in files_by_aov.values()
+        ):
+            self.log.warning(
+                "Expected files do not match the render frame range. "
+                "Rendering all frames."
+            )
+            return None
+
+        output_dir = os.path.dirname(beauty_files[0])
+        os.makedirs(output_dir, exist_ok=True)
+        checkpoint_path = os.path.join(
+            output_dir, f".{instance.name}.render_checkpoint.json"
+        )
+        checkpoint = RenderCheckpoint(checkpoint_path, files_by_aov)
+        checkpoint.load()
+        return checkpoint
+
+    def _get_frames_to_render(
+        self,
+        instance,
+        frames: List[int],
+        checkpoint: RenderCheckpoint
+    ) -> List[int]:
+        """Get frames which are not fully written for every AOV yet.
+
+        A frame is skipped only when the checkpoint recorded it as rendered
+        and all its AOV files exist on disk and are not empty.
+
+        Args:
+            instance (pyblish.api.Instance): Render instance.
+            frames (List[int]): Frames of the render.
+            checkpoint (RenderCheckpoint): Loaded render checkpoint.
+
+        Returns:
+            List[int]: Frames to render.
+        """
+        files_by_aov = self._get_files_by_aov(instance)
+        frames_to_render = []
+        for index, frame in enumerate(frames):
+            if frame in checkpoint.frames and all(
+                _is_written(files[index]) for files in files_by_aov.values()
+            ):
+                continue
+            frames_to_render.append(frame)
+
+        skipped = len(frames) - len(frames_to_render)
+        if skipped:
+            self.log.info(
+                f"Resuming local render, skipping {skipped} frame(s) "
+                "already written for every AOV."
+            )
+        return frames_to_render
+
+
+def _is_written(filepath: str) -> bool:
+    """Return whether file exists on disk and is not empty."""
+    try:
+        return os.path.getsize(filepath) > 0
+    except OSError:
+        return False
@@ -0,0 +1,80 @@
+# -*- coding: utf-8 -*-
+"""Report timing of ayon_max publish plugins."""
+import os
+import json
+import time
+
+import pyblish.api
+from ayon_max.api import publish_timing
+
+
+class IntegratePublishTiming(pyblish.api.ContextPlugin):
+    """Report wall time, pymxs calls and staging bytes of publish plugins.
+
+    The slowest plugins are logged to the publish report and all records
+    are stored in `maxPublishTimingReport` of the context data. When
+    enabled, the report is appended to a JSON file next to the workfile
+    to analyze trends over multiple publishes.
+    """
+
+    order = pyblish.api.IntegratorOrder + 10
+    label = "Publish Timing Report"
+    hosts = ["max"]
+    settings_category = "max"
+
+    # Settings
+    report_count = 10
+    write_json = False
+
+    def process(self, context):
+        records = publish_timing.get_timing_records(context)
+        if not records:
+            self.log.debug("No timing of ayon_max plugins was recorded.")
+            return
+
+        report = {
+            "published": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "workfile": context.data.get("currentFile"),
+            "duration": sum(record["duration"] for record in records),
+            "plugins": records,
+        }
+        context.data["maxPublishTimingReport"] = report
+
+        slowest = sorted(
+            records, key=lambda record: record["duration"], reverse=True
+        )[:self.report_count]
+        lines = [f"Publish plugins took {report['duration']:.2f}s, slowest:"]
+        for record in slowest:
+            line = f"  {record['duration']:8.3f}s  {record['label']}"
+            if record["instance"]:
+                line += f" [{record['instance']}]"
+            if record["pymxs_calls"] is not None:
+                line += f", {record['pymxs_calls']} pymxs call(s)"
+            if record["staging_bytes"]:
+                line += f", {record['staging_bytes']} bytes written"
+            lines.append(line)
+        self.log.info("\n".join(lines))
+
+        if self.write_json:
+            self.write_report(context, report)
+
+    def write_report(self, context, report):
+        current_file = context.data.get("currentFile")
+        if not current_file or not os.path.exists(current_file):
+            self.log.debug("Workfile is not saved, skipping timing JSON.")
+            return
+
+        report_path = (
+            f"{os.path.splitext(current_file)[0]}_publish_timing.json")
+        reports = []
+        if os.path.exists(report_path):
+            try:
+                with open(report_path, "r") as f:
+                    reports = json.load(f)
+            except (OSError, ValueError):
+                self.log.warning(
+                    f"Invalid timing report {report_path}, overwriting it.")
+        reports.append(report)
+        with open(report_path, "w") as f:
+            json.dump(reports, f, indent=4)
+        self.log.debug(f"Publish timing written to {report_path}")
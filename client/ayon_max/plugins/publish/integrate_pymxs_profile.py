@@ -0,0 +1,25 @@
+# -*- coding: utf-8 -*-
+"""Write report of pymxs calls made during publishing."""
+import pyblish.api
+from ayon_max.api import profiling
+
+
+class IntegratePymxsProfile(pyblish.api.ContextPlugin):
+    """Write pymxs call statistics when profiling is enabled.
+
+    Profiling is enabled with `AYON_MAX_PYMXS_PROFILE` environment
+    variable, the report contains calls recorded since the last report.
+    """
+
+    order = pyblish.api.IntegratorOrder + 10
+    label = "pymxs Profile Report"
+    hosts = ["max"]
+
+    def process(self, context):
+        if profiling.get_profiler() is None:
+            self.log.debug("pymxs profiling is not enabled.")
+            return
+        report_path = profiling.dump_report("publish")
+        if report_path:
+            context.data["pymxsProfileReport"] = report_path
+            self.log.info(f"pymxs profile report: {report_path}")
@@ -1,7 +1,5 @@
 import pyblish.api
 import os
-import sys
-import platform
 import tempfile
 
 
@@ -9,18 +7,66 @@ from pymxs import runtime as rt
 from ayon_core.lib import run_subprocess
 from ayon_max.api.lib_rendersettings import RenderSettings
 from ayon_max.api.lib_renderproducts import RenderProducts
+from ayon_max.api.lib_maxbatch import (
+    MaxBatchJob,
+    get_maxbatch_environment,
+    get_maxbatch_executable,
+    run_maxbatch_jobs,
+)
+
+
+CAMERA_SCRIPT = """
+from pymxs import runtime as rt
+import os
+filename = "{filename}"
+new_filepath = "{new_filepath}"
+new_output = "{new_output}"
+camera = "{camera}"
+farm = {farm}
+camera_name = camera.replace(":", "_")
+target_camera_node = rt.getNodeByName(camera)
+rt.viewport.setCamera(target_camera_node)
+rt.rendOutputFilename = new_output
+directory = os.path.dirname(rt.rendOutputFilename)
+directory = os.path.join(directory, filename)
+if not os.path.exists(directory):
+    os.mkdir(directory)
+render_elem = rt.maxOps.GetCurRenderElementMgr()
+render_elem_num = render_elem.NumRenderElements()
+if render_elem_num > 0:
+    ext = "{ext}"
+    for i in range(render_elem_num):
+        renderlayer_name = render_elem.GetRenderElement(i)
+        target, renderpass = str(renderlayer_name).split(":")
+        aov_name =  f"{{directory}}_{{camera_name}}_{{renderpass}}..{ext}"
+        render_elem.SetRenderElementFileName(i, aov_name)
+rt.saveMaxFile(new_filepath)
+if not farm:
+    for frame in range(int(rt.rendStart), int(rt.rendEnd) + 1):
+        rt.render(outputFile=rt.rendOutputFilename, frame=frame, vfb=False)
+"""
 
 
 class SaveScenesForCamera(pyblish.api.InstancePlugin):
     """Save scene files for multiple cameras without
     editing the original scene before deadline submission
 
+    With `parallel_render` enabled each camera runs in its own
+    3dsmaxbatch process and the processes run concurrently.
+
     """
 
     label = "Save Scene files for cameras"
     order = pyblish.api.ExtractorOrder - 0.48
     hosts = ["max"]
     families = ["maxrender"]
+    settings_category = "max"
+
+    # Settings
+    parallel_render = False
+    max_workers = 2
+    cores_per_job = 0
+    memory_limit_mb = 0
 
     def process(self, instance):
         if not instance.data.get("multiCamera"):
@@ -34,13 +80,18 @@ class SaveScenesForCamera(pyblish.api.InstancePlugin):
         camera_scene_files = []
         scripts = []
         filename, ext = os.path.splitext(current_filename)
-        fmt = RenderProducts().image_format()
+        project_settings = instance.context.data["project_settings"]
+        fmt = RenderProducts(project_settings).image_format()
         cameras = instance.data.get("cameras")
         if not cameras:
             return
         new_folder = f"{current_folder}_{filename}"
         os.makedirs(new_folder, exist_ok=True)
-        render_settings = RenderSettings(data=instance.data)
+        # Save the workfile once, the batch render output and the render
+        # elements of each camera are applied inside the batch job.
+        rt.saveMaxFile(current_filepath)
+        render_settings = RenderSettings(
+            project_settings, data=instance.data)
         for camera in cameras:
             new_output = render_settings.get_batch_render_output(camera)       # noqa
             new_output = new_output.replace("\\", "/")
@@ -49,72 +100,81 @@ class SaveScenesForCamera(pyblish.api.InstancePlugin):
             new_filepath = os.path.join(new_folder, new_filename)
             new_filepath = new_filepath.replace("\\", "/")
             camera_scene_files.append(new_filepath)
-            render_settings.batch_render_elements(camera)
-            rt.rendOutputFilename = new_output
-            rt.saveMaxFile(current_filepath)
-            script = ("""
-from pymxs import runtime as rt
-import os
-filename = "{filename}"
-new_filepath = "{new_filepath}"
-new_output = "{new_output}"
-camera = "{camera}"
-farm = {farm}
-camera_name = camera.replace(":", "_")
-target_camera_node = rt.getNodeByName(camera)
-rt.viewport.setCamera(target_camera_node)
-rt.rendOutputFilename = new_output
-directory = os.path.dirname(rt.rendOutputFilename)
-directory = os.path.join(directory, filename)
-if not os.path.exists(directory):
-    os.mkdir(directory)
-render_elem = rt.maxOps.GetCurRenderElementMgr()
-render_elem_num = render_elem.NumRenderElements()
-if render_elem_num > 0:
-    ext = "{ext}"
-    for i in range(render_elem_num):
-        renderlayer_name = render_elem.GetRenderElement(i)
-        target, renderpass = str(renderlayer_name).split(":")
-        aov_name =  f"{{directory}}_{{camera_name}}_{{renderpass}}..{ext}"
-        render_elem.SetRenderElementFileName(i, aov_name)
-rt.saveMaxFile(new_filepath)
-if not farm:
-    for frame in range(int(rt.rendStart), int(rt.rendEnd) + 1):
-        rt.render(outputFile=rt.rendOutputFilename, frame=frame, vfb=False)
-        """).format(filename=instance.name,
-                    new_filepath=new_filepath,
-                    new_output=new_output,
-                    camera=camera,
-                    ext=fmt,
-                    farm=instance.data.get("farm"))
+            script = CAMERA_SCRIPT.format(
+                filename=instance.name,
+                new_filepath=new_filepath,
+                new_output=new_output,
+                camera=camera,
+                ext=fmt,
+                farm=instance.data.get("farm"))
             scripts.append(script)
-        maxbatch_exe = os.path.join(
-            os.path.dirname(sys.executable), "3dsmaxbatch")
-        maxbatch_exe = maxbatch_exe.replace("\\", "/")
-        if platform.system().lower() == "windows":
-            maxbatch_exe += ".exe"
-            maxbatch_exe = os.path.normpath(maxbatch_exe)
+
+        current_filepath = current_filepath.replace("\\", "/")
         with tempfile.TemporaryDirectory() as tmp_dir_name:
-            tmp_script_path = os.path.join(
-                tmp_dir_name, "extract_scene_files.py")
-            self.log.info("Using script file: {}".format(tmp_script_path))
-
-            with open(tmp_script_path, "wt") as tmp:
-                for script in scripts:
-                    tmp.write(script + "\n")
-
-            full_script = "\n".join(scripts)
-            self.log.debug(f"Failed running script {tmp_script_path}:\n{full_script}")
-            current_filepath = current_filepath.replace("\\", "/")
-            tmp_script_path = tmp_script_path.replace("\\", "/")
-            run_subprocess([maxbatch_exe, tmp_script_path,
-                            "-sceneFile", current_filepath],
-                            logger=self.log)
+            if self.parallel_render:
+                self.run_parallel(
+                    tmp_dir_name, cameras, scripts, current_filepath)
+            else:
+                self.run_sequential(tmp_dir_name, scripts, current_filepath)
 
         for camera_scene in camera_scene_files:
             if not os.path.exists(camera_scene):
                 full_script = "\n".join(scripts)
-                self.log.debug(f"Failed running script {tmp_script_path}:\n{full_script}")
+                self.log.debug(f"Failed running script:\n{full_script}")
                 self.log.error("Camera scene files not existed yet!")
                 raise RuntimeError("MaxBatch.exe doesn't run as expected")
             self.log.debug(f"Found Camera scene:{camera_scene}")
+
+    def run_sequential(self, tmp_dir_name, scripts, scene_filepath):
+        """Run all camera scripts in a single 3dsmaxbatch process.
+
+        Args:
+            tmp_dir_name (str): Directory to write the script file to.
+            scripts (list[str]): Python scripts for each camera.
+            scene_filepath (str): Scene file the scripts are running on.
+        """
+        maxbatch_exe = get_maxbatch_executable()
+        tmp_script_path = os.path.join(
+            tmp_dir_name, "extract_scene_files.py")
+        self.log.info("Using script file: {}".format(tmp_script_path))
+
+        with open(tmp_script_path, "wt") as tmp:
+            for script in scripts:
+                tmp.write(script + "\n")
+
+        full_script = "\n".join(scripts)
+        self.log.debug(f"Failed running script {tmp_script_path}:\n{full_script}")
+        tmp_script_path = tmp_script_path.replace("\\", "/")
+        run_subprocess([maxbatch_exe, tmp_script_path,
+                        "-sceneFile", scene_filepath],
+                        env=get_maxbatch_environment(),
+                        logger=self.log)
+
+    def run_parallel(self, tmp_dir_name, cameras, scripts, scene_filepath):
+        """Run each camera script in its own 3dsmaxbatch process.
+
+        Args:
+            tmp_dir_name (str): Directory to write the script files to.
+            cameras (list[str]): Camera names.
+            scripts (list[str]): Python scripts for each camera.
+            scene_filepath (str): Scene file the scripts are running on.
+        """
+        jobs = []
+        for camera, script in zip(cameras, scripts):
+            camera_name = camera.replace(":", "_")
+            script_path = os.path.join(
+                tmp_dir_name, f"extract_scene_file_{camera_name}.py")
+            with open(script_path, "wt") as tmp:
+                tmp.write(script + "\n")
+            jobs.append(MaxBatchJob(camera_name, script_path, scene_filepath))
+
+        self.log.info(
+            f"Running {len(jobs)} camera job(s) on up to "
+            f"{self.max_workers} 3dsmaxbatch process(es).")
+        run_maxbatch_jobs(
+            jobs,
+            max_workers=self.max_workers,
+            cores_per_job=self.cores_per_job,
+            memory_limit_mb=self.memory_limit_mb,
+            logger=self.log,
+        )
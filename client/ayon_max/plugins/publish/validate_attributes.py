@@ -1,6 +1,8 @@
 # -*- coding: utf-8 -*-
 """Validator for Attributes."""
 import json
+import math
+import hashlib
 
 from pyblish.api import ContextPlugin, ValidatorOrder
 from pymxs import runtime as rt
@@ -12,28 +14,129 @@ from ayon_core.pipeline.publish import (
 )
 
 
-def has_property(object_name, property_name):
-    """Return whether an object has a property with given name"""
-    return rt.Execute(f'isProperty {object_name} "{property_name}"')
+# Compiled check and repair functions by hash of the attributes settings
+_COMPILED_FUNCTIONS = {}
 
+MS_ATTRIBUTE_MATCHES = """
+fn ayon_attribute_matches actual expected =
+(
+    if classOf expected == Array then
+        (actual as string) == (expected as string)
+    else
+        actual == expected
+)
+"""
 
-def is_matching_value(object_name, property_name, value):
-    """Return whether an existing property matches value `value"""
-    property_value = rt.Execute(f"{object_name}.{property_name}")
 
-    # Wrap property value if value is a string valued attributes
-    # starting with a `#`
-    if (
-        isinstance(value, str) and
-        value.startswith("#") and
-        not value.endswith(")")
-    ):
-        # prefix value with `#`
-        # not applicable for #() array value type
-        # and only applicable for enum i.e. #bob, #sally
-        property_value = f"#{property_value}"
+def to_maxscript_value(value):
+    """Convert settings value to MaxScript literal.
 
-    return property_value == value
+    Strings starting with `#` are used as they are, e.g. enum values
+    like `#RS_GIENGINE_BRUTE_FORCE` or arrays like `#(1, 2)`.
+    """
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if isinstance(value, int):
+        return str(value)
+    if isinstance(value, float):
+        if not math.isfinite(value):
+            raise ValueError(f"Unsupported attribute value: {value}")
+        return f"{value:.10f}"
+    if value is None:
+        return "undefined"
+    if isinstance(value, str):
+        if value.startswith("#"):
+            return value
+        value = value.replace("\\", "\\\\").replace('"', '\\"')
+        return f'"{value}"'
+    if isinstance(value, (list, tuple)):
+        items = ", ".join(to_maxscript_value(item) for item in value)
+        return f"#({items})"
+    raise ValueError(f"Unsupported attribute value: {value}")
+
+
+def compile_attribute_functions(attributes):
+    """Compile check and repair MaxScript functions for the attributes.
+
+    The check function returns all mismatches as an array of
+    `#(object_name, property_name, is_missing)`, the repair function
+    sets all mismatching existing properties to their required values.
+
+    Compiled functions are cached by hash of the attributes.
+
+    Args:
+        attributes (dict): Required property values by object name.
+
+    Returns:
+        tuple: Check and repair MaxScript functions.
+    """
+    data = json.dumps(attributes, sort_keys=True)
+    key = hashlib.sha1(data.encode("utf-8")).hexdigest()
+    functions = _COMPILED_FUNCTIONS.get(key)
+    if functions is not None:
+        return functions
+
+    check_lines = []
+    repair_lines = []
+    for object_name, required_properties in attributes.items():
+        object_name_str = to_maxscript_value(object_name)
+        check_lines.append(
+            f"obj = try ({object_name}) catch (undefined)\n"
+            "if not isValidValue obj then\n"
+            f"    append skipped {object_name_str}\n"
+            "else\n"
+            "("
+        )
+        repair_lines.append(
+            f"obj = try ({object_name}) catch (undefined)\n"
+            "if isValidValue obj do\n"
+            "("
+        )
+        for property_name, value in required_properties.items():
+            property_name_str = to_maxscript_value(property_name)
+            ms_value = to_maxscript_value(value)
+            check_lines.append(
+                f"    if not isProperty obj {property_name_str} then\n"
+                f"        append invalid #({object_name_str}, "
+                f"{property_name_str}, true)\n"
+                "    else if not (ayon_attribute_matches "
+                f"obj.{property_name} {ms_value}) do\n"
+                f"        append invalid #({object_name_str}, "
+                f"{property_name_str}, false)"
+            )
+            repair_lines.append(
+                f"    if isProperty obj {property_name_str} and "
+                f"not (ayon_attribute_matches obj.{property_name} "
+                f"{ms_value}) do\n"
+                f"        obj.{property_name} = {ms_value}"
+            )
+        check_lines.append(")")
+        repair_lines.append(")")
+
+    check_body = "\n".join(check_lines)
+    repair_body = "\n".join(repair_lines)
+    script = (
+        f"{MS_ATTRIBUTE_MATCHES}\n"
+        f"fn ayon_check_attributes_{key} =\n"
+        "(\n"
+        "local obj\n"
+        "local invalid = #()\n"
+        "local skipped = #()\n"
+        f"{check_body}\n"
+        "#(invalid, skipped)\n"
+        ")\n"
+        f"fn ayon_repair_attributes_{key} =\n"
+        "(\n"
+        "local obj\n"
+        f"{repair_body}\n"
+        "ok\n"
+        ")\n"
+        f"#(ayon_check_attributes_{key}, ayon_repair_attributes_{key})"
+    )
+    check_fn, repair_fn = rt.Execute(script)
+    functions = (check_fn, repair_fn)
+    _COMPILED_FUNCTIONS[key] = functions
+    return functions
 
 
 class ValidateAttributes(OptionalPyblishPluginMixin,
@@ -75,27 +178,28 @@ class ValidateAttributes(OptionalPyblishPluginMixin,
         )
         if not attributes:
             return
+        check_fn, _ = compile_attribute_functions(attributes)
+        result, skipped = check_fn()
+        for object_name in skipped:
+            # Skip checking if the node does not
+            # exist in MaxWrapper Class
+            cls.log.debug(f"Unable to find '{object_name}'."
+                          " Skipping validation of attributes.")
+
         invalid = []
-        for object_name, required_properties in attributes.items():
-            if not rt.Execute(f"isValidValue {object_name}"):
-                # Skip checking if the node does not
-                # exist in MaxWrapper Class
-                cls.log.debug(f"Unable to find '{object_name}'."
-                              " Skipping validation of attributes.")
-                continue
-
-            for property_name, value in required_properties.items():
-                if not has_property(object_name, property_name):
-                    cls.log.error(
-                        "Non-existing property: "
-                        f"{object_name}.{property_name}")
-                    invalid.append((object_name, property_name))
-
-                if not is_matching_value(object_name, property_name, value):
-                    cls.log.error(
-                        f"Invalid value for: {object_name}.{property_name}"
-                        f" should be: {value}")
-                    invalid.append((object_name, property_name))
+        for object_name, property_name, is_missing in result:
+            object_name = str(object_name)
+            property_name = str(property_name)
+            if is_missing:
+                cls.log.error(
+                    "Non-existing property: "
+                    f"{object_name}.{property_name}")
+            else:
+                value = attributes[object_name][property_name]
+                cls.log.error(
+                    f"Invalid value for: {object_name}.{property_name}"
+                    f" should be: {value}")
+            invalid.append((object_name, property_name))
 
         return invalid
 
@@ -128,16 +232,7 @@ class ValidateAttributes(OptionalPyblishPluginMixin,
             ["ValidateAttributes"]
             ["attributes"]
         )
-        invalid_attributes = cls.get_invalid(context)
-        for attrs in invalid_attributes:
-            prop, attr = attrs
-            value = attributes[prop][attr]
-            if isinstance(value, str) and not value.startswith("#"):
-                attribute_fix = '{}.{}="{}"'.format(
-                    prop, attr, value
-                )
-            else:
-                attribute_fix = "{}.{}={}".format(
-                    prop, attr, value
-                )
-            rt.Execute(attribute_fix)
+        if not attributes:
+            return
+        _, repair_fn = compile_attribute_functions(attributes)
+        repair_fn()
@@ -2,6 +2,7 @@
 import pyblish.api
 
 from ayon_core.pipeline import PublishValidationError
+from pymxs import runtime as rt
 
 
 class ValidateCameraContent(pyblish.api.InstancePlugin):
@@ -24,8 +25,6 @@ class ValidateCameraContent(pyblish.api.InstancePlugin):
 
     def get_invalid(self, instance):
         """Get invalid nodes that are not cameras or valid containers."""
-        from pymxs import runtime as rt
-
         container = instance.data["instance_node"]
         self.log.info(f"Validating camera content for {container}")
 
@@ -33,14 +32,14 @@ class ValidateCameraContent(pyblish.api.InstancePlugin):
         members = instance.data["members"]
 
         for member in members:
-            if self._is_valid_member(member, rt):
+            if self._is_valid_member(member):
                 continue
             invalid.append(member)
 
         return invalid
 
     @staticmethod
-    def _is_valid_member(node, rt):
+    def _is_valid_member(node):
         """Check if a node is a valid camera or container with only cameras."""
         # Direct camera check
         if rt.classof(node) in rt.Camera.classes:
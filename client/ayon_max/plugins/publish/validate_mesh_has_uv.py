@@ -1,12 +1,13 @@
 
 import pyblish.api
 from ayon_max.api.action import SelectInvalidAction
+from ayon_max.api.lib_mesh import get_instance_mesh_statistics
 from ayon_core.pipeline.publish import (
     ValidateMeshOrder,
     OptionalPyblishPluginMixin,
     PublishValidationError
 )
-from pymxs import runtime as rt
+from ayon_max.api.validation_cache import cached_validation
 
 
 class ValidateMeshHasUVs(pyblish.api.InstancePlugin,
@@ -34,15 +35,14 @@ class ValidateMeshHasUVs(pyblish.api.InstancePlugin,
 
     @classmethod
     def get_invalid(cls, instance):
-        meshes = [member for member in instance.data["members"]
-                  if rt.isProperty(member, "mesh")]
         invalid = [
-            member for member in meshes
-            if rt.isProperty(member.mesh, "numTVerts")
-            and member.mesh.numTVerts == 0
+            member
+            for member, stats in get_instance_mesh_statistics(instance)
+            if stats.is_mesh and stats.num_tverts == 0
         ]
         return invalid
 
+    @cached_validation
     def process(self, instance):
         if not self.is_active(instance.data):
             return
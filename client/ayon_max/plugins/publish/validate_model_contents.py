@@ -1,8 +1,13 @@
 # -*- coding: utf-8 -*-
 import pyblish.api
-from pymxs import runtime as rt
 
 from ayon_core.pipeline import PublishValidationError
+from ayon_max.api.lib_mesh import get_instance_mesh_statistics
+from ayon_max.api.validation_cache import cached_validation
+
+
+# Superclasses of nodes not allowed in model instance
+INVALID_SUPERCLASSES = {"camera", "light", "shape"}
 
 
 class ValidateModelContent(pyblish.api.InstancePlugin):
@@ -17,6 +22,7 @@ class ValidateModelContent(pyblish.api.InstancePlugin):
     hosts = ["max"]
     label = "Model Contents"
 
+    @cached_validation
     def process(self, instance):
         invalid = self.get_invalid(instance)
         if invalid:
@@ -32,13 +38,8 @@ class ValidateModelContent(pyblish.api.InstancePlugin):
         container = instance.data["instance_node"]
         self.log.info(f"Validating model content for {container}")
 
-        selection_list = instance.data["members"]
-        for sel in selection_list:
-            if rt.ClassOf(sel) in rt.Camera.classes:
-                invalid.append(sel)
-            if rt.ClassOf(sel) in rt.Light.classes:
-                invalid.append(sel)
-            if rt.ClassOf(sel) in rt.Shape.classes:
+        for sel, stats in get_instance_mesh_statistics(instance):
+            if stats.superclass in INVALID_SUPERCLASSES:
                 invalid.append(sel)
 
         return invalid
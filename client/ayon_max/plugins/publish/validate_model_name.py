@@ -11,6 +11,7 @@ from ayon_core.pipeline.publish import (
     PublishXmlValidationError,
     ValidateContentsOrder
 )
+from ayon_max.api.validation_cache import cached_validation
 
 class ValidateModelName(pyblish.api.InstancePlugin,
                         OptionalPyblishPluginMixin):
@@ -47,6 +48,7 @@ class ValidateModelName(pyblish.api.InstancePlugin,
     # cache
     regex_compiled = None
 
+    @cached_validation
     def process(self, instance):
         if not self.is_active(instance.data):
             return
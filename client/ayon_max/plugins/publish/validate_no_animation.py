@@ -1,35 +1,20 @@
 # -*- coding: utf-8 -*-
 import pyblish.api
-from pymxs import runtime as rt
 from ayon_core.pipeline import (
     PublishValidationError,
     OptionalPyblishPluginMixin
 )
 from ayon_max.api.action import SelectInvalidAction
-
-
-def get_invalid_keys(obj):
-    """function to check on whether there is keyframe in
-
-    Args:
-        obj (str): object needed to check if there is a keyframe
-
-    Returns:
-        bool: whether invalid object(s) exist
-    """
-    for transform in ["Position", "Rotation", "Scale"]:
-        num_of_key = rt.NumKeys(rt.getPropertyController(
-            obj.controller, transform))
-        if num_of_key > 0:
-            return True
-    return False
+from ayon_max.api.lib_animation import get_animated_nodes
+from ayon_max.api.validation_cache import cached_validation
 
 
 class ValidateNoAnimation(pyblish.api.InstancePlugin,
                           OptionalPyblishPluginMixin):
     """Validates No Animation
 
-    Ensure no keyframes on nodes in the Instance
+    Ensure no keyframes on nodes in the Instance, including keys on
+    modifiers and base object parameters.
     """
 
     order = pyblish.api.ValidatorOrder
@@ -41,6 +26,7 @@ class ValidateNoAnimation(pyblish.api.InstancePlugin,
 
     settings_category = "max"
 
+    @cached_validation
     def process(self, instance):
         if not self.is_active(instance.data):
             return
@@ -63,7 +49,4 @@ class ValidateNoAnimation(pyblish.api.InstancePlugin,
         Returns:
             list: list of invalid objects
         """
-        invalid = [invalid for invalid in instance.data["members"]
-                   if invalid.isAnimated or get_invalid_keys(invalid)]
-
-        return invalid
+        return get_animated_nodes(instance.data["members"])
@@ -1,5 +1,8 @@
 import os
+import time
 import itertools
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 
 from ayon_core.pipeline.publish import (
     PublishValidationError,
@@ -10,15 +13,72 @@ import pyblish.api
 import clique
 
 
+def _scan_directory(directory, filenames, check_empty_files, log):
+    """Check files exist in the directory by listing it only once.
+
+    Filenames are matched by their `os.path.normcase` form, so the case
+    of the expected files does not matter on case-insensitive platforms.
+    All files are reported missing when the directory cannot be listed.
+
+    Args:
+        directory (str): Directory to list.
+        filenames (set[str]): Filenames expected in the directory.
+        check_empty_files (bool): Also report zero-byte files.
+        log (logging.Logger): Logger reporting unreadable directories.
+
+    Returns:
+        tuple[list[str], list[str], float]: Missing paths, empty paths
+            and duration of the scan in seconds.
+    """
+    start = time.perf_counter()
+    expected = {os.path.normcase(fname): fname for fname in filenames}
+    found = set()
+    empty_paths = []
+    try:
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                key = os.path.normcase(entry.name)
+                if key not in expected:
+                    continue
+                found.add(key)
+                if not check_empty_files:
+                    continue
+                try:
+                    size = entry.stat().st_size
+                except OSError:
+                    size = 0
+                if size == 0:
+                    empty_paths.append(entry.path)
+    except OSError as exc:
+        log.warning(f"Unable to list {directory}: {exc}")
+        found.clear()
+        empty_paths = []
+
+    missing_paths = [
+        os.path.join(directory, expected[key])
+        for key in sorted(expected.keys() - found)
+    ]
+    return missing_paths, empty_paths, time.perf_counter() - start
+
+
 class ValidateRenderLocalHasExistingFrames(pyblish.api.InstancePlugin):
-    """Validate all files for the representations exist on disk."""
+    """Validate all files for the representations exist on disk.
+
+    Each staging directory is listed once and the expected files are
+    checked against the listing, instead of querying every file.
+    """
 
     order = ValidateContentsOrder
     families = ["render.local_no_render"]
     label = "Validate Existing Frames"
+    settings_category = "max"
+
+    # Settings
+    max_workers = 1
+    check_empty_files = False
 
     def process(self, instance):
-        missing_paths = []
+        filenames_by_dir = defaultdict(set)
         for repre in instance.data.get("representations", []):
             files = repre.get("files")
             if isinstance(files, str):
@@ -26,19 +86,51 @@ class ValidateRenderLocalHasExistingFrames(pyblish.api.InstancePlugin):
 
             staging_dir = repre["stagingDir"]
             for fname in files:
-                path = os.path.join(staging_dir, fname)
-                if not os.path.exists(path):
-                    missing_paths.append(path)
+                path = os.path.normpath(os.path.join(staging_dir, fname))
+                directory, fname = os.path.split(path)
+                filenames_by_dir[directory].add(fname)
+
+        directories = list(filenames_by_dir)
+        max_workers = max(1, min(self.max_workers, len(directories)))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            results = list(executor.map(
+                lambda directory: _scan_directory(
+                    directory,
+                    filenames_by_dir[directory],
+                    self.check_empty_files,
+                    self.log
+                ),
+                directories
+            ))
+
+        missing_paths = []
+        empty_paths = []
+        for directory, (missing, empty, duration) in zip(
+            directories, results
+        ):
+            self.log.debug(
+                f"Scanned {directory} for "
+                f"{len(filenames_by_dir[directory])} file(s) "
+                f"in {duration:.3f}s"
+            )
+            missing_paths.extend(missing)
+            empty_paths.extend(empty)
+
+        if empty_paths:
+            collections, remainder = clique.assemble(empty_paths)
+            for path in itertools.chain(collections, remainder):
+                self.log.warning(f"Empty files: {path}")
 
         if missing_paths:
             collections, remainder = clique.assemble(missing_paths)
             for path in itertools.chain(collections, remainder):
                 self.log.warning(f"Missing files: {path}")
 
+        if missing_paths or empty_paths:
             raise PublishValidationError(
                 title="Missing existing frames",
                 message=(
-                    "Render has missing files. Please make sure to render the "
-                    "missing frames or pick another render target."
+                    "Render has missing or empty files. Please make sure to "
+                    "render the missing frames or pick another render target."
                 )
             )
@@ -21,6 +21,8 @@ from ayon_max.api.validate_plugins import ValidateRenderSettingsBase
 from ayon_max.api.lib_rendersettings import (
     RenderSettings,
     get_arnold_driver_for_image_format,
+    get_renderer_snapshot,
+    invalidate_renderer_snapshot,
 )
 
 
@@ -171,18 +173,20 @@ class ValidateGenericRenderSetting(pyblish.api.InstancePlugin,
                 type and the invalid setting.
         """
         invalid = []
+        snapshot = get_renderer_snapshot(instance.context)
         image_format = instance.data["imageFormat"]
         if renderer_name == "Redshift_Renderer":
             multipass_enabled = get_multipass_setting(
                 renderer_name,
                 project_settings,
             )
-            if renderer.separateAovFiles != multipass_enabled:
+            separate_aov_files = snapshot.redshift_separate_aov_files
+            if separate_aov_files != multipass_enabled:
                 invalid.append((
                     "Invalid Redshift multipass setting",
-                    f"Expected: {multipass_enabled}, Found: {renderer.separateAovFiles}",
+                    f"Expected: {multipass_enabled}, Found: {separate_aov_files}",
                 ))
-            if image_format == "exr" and not renderer.OutputExrMultipart:
+            if image_format == "exr" and not snapshot.redshift_exr_multipart:
                 invalid.append((
                     "Invalid Redshift render setting",
                     "EXR image format should have OutputExrMultipart enabled for AOVs.",
@@ -198,20 +202,15 @@ class ValidateGenericRenderSetting(pyblish.api.InstancePlugin,
                 multicam=multicam,
                 cameras=cameras,
                 sync_current_workfile=sync_current_workfile,
+                render_output=snapshot.render_output,
             )
         )
 
-        render_elem = rt.maxOps.GetCurRenderElementMgr()
-        render_elem_num = render_elem.NumRenderElements()
-        if render_elem_num < 1:
-            return invalid
-
-        for index in range(render_elem_num):
-            renderlayer = render_elem.GetRenderElement(index)
-            if not renderlayer.enabled:
+        for render_element in snapshot.render_elements:
+            if not render_element.enabled:
                 continue
 
-            render_element_filename = render_elem.GetRenderElementFilename(index)
+            render_element_filename = render_element.filename
             invalid.extend(
                 cls.get_invalid_render_element_directory(
                     os.path.dirname(render_element_filename),
@@ -249,9 +248,11 @@ class ValidateGenericRenderSetting(pyblish.api.InstancePlugin,
                 data=instance.data
             )
             render_settings.render_output()
+            invalidate_renderer_snapshot(instance.context)
             return
 
         cls.repair_generic_render_settings(instance, renderer_name, renderer)
+        invalidate_renderer_snapshot(instance.context)
 
     @classmethod
     def repair_generic_render_settings(
@@ -407,8 +408,8 @@ class ValidateArnoldRenderSetting(ValidateGenericRenderSetting):
                 and invalid values.
         """
         invalid = []
-        aov_manager = renderer.AOVManager
-        output_path = aov_manager.outputPath
+        snapshot = get_renderer_snapshot(instance.context)
+        output_path = snapshot.arnold_output_path
         image_format = instance.data["imageFormat"]
         sync_current_workfile = instance.data.get(
             "sync_current_workfile_name",
@@ -419,6 +420,7 @@ class ValidateArnoldRenderSetting(ValidateGenericRenderSetting):
                 image_format,
                 workfile_pattern,
                 sync_current_workfile=sync_current_workfile,
+                render_output=snapshot.render_output,
             )
         )
         if sync_current_workfile and workfile_pattern not in output_path:
@@ -429,10 +431,9 @@ class ValidateArnoldRenderSetting(ValidateGenericRenderSetting):
             cls.log.error(msg)
             invalid.append((msg, output_path))
 
-        aov_drivers = aov_manager.drivers
-        driver = aov_drivers[0]
+        driver = snapshot.arnold_driver
         arnold_driver = get_arnold_driver_for_image_format(image_format)
-        if rt.ClassOf(driver) != arnold_driver:
+        if snapshot.arnold_driver_class != arnold_driver:
             msg = (
                 f"Invalid Arnold driver for image format {image_format}.\n"
                 f"Should be: {arnold_driver}"
@@ -441,16 +442,17 @@ class ValidateArnoldRenderSetting(ValidateGenericRenderSetting):
             invalid.append((msg, driver))
 
         multipass_enabled = get_multipass_setting(renderer_name, project_settings)
-        if driver.multipart != multipass_enabled:
+        if snapshot.arnold_multipart != multipass_enabled:
             invalid.append((
                 "Invalid Arnold multipass setting",
-                f"Expected: {multipass_enabled}, Found: {driver.multipart}",
+                f"Expected: {multipass_enabled}, Found: {snapshot.arnold_multipart}",
             ))
-        if not driver.filenameSuffix.endswith("."):
+        filename_suffix = snapshot.arnold_filename_suffix
+        if not filename_suffix.endswith("."):
             invalid.append((
                 "Invalid Arnold AOV driver filename",
                 "Arnold AOV driver filename suffix should end with '.', "
-                f"Found: {driver.filenameSuffix}.",
+                f"Found: {filename_suffix}.",
             ))
         return invalid
 
@@ -466,6 +468,7 @@ class ValidateArnoldRenderSetting(ValidateGenericRenderSetting):
             return
 
         cls.repair_arnold_settings(instance, renderer, renderer_name)
+        invalidate_renderer_snapshot(instance.context)
 
     @classmethod
     def repair_arnold_settings(
@@ -687,23 +690,23 @@ class ValidateVrayRenderSetting(ValidateGenericRenderSetting):
                 and invalid values.
         """
         invalid = []
-        vr_settings = get_vray_settings(renderer_name, renderer)
+        snapshot = get_renderer_snapshot(instance.context)
         image_format = instance.data["imageFormat"]
         multipass_enabled = get_multipass_setting(renderer_name, project_settings)
         sync_current_workfile = instance.data.get(
             "sync_current_workfile_name",
             True
         )
-        if multipass_enabled != vr_settings.output_splitgbuffer:
+        if multipass_enabled != snapshot.vray_splitgbuffer:
             invalid.append((
                 "Invalid V-Ray multipass setting",
-                f"Expected: {multipass_enabled}, Found: {vr_settings.output_splitgbuffer}",
+                f"Expected: {multipass_enabled}, Found: {snapshot.vray_splitgbuffer}",
             ))
 
         if image_format == "exr":
             invalid.extend(
                 cls._get_invalid_vray_output(
-                    vr_settings.output_rawfilename,
+                    snapshot.vray_rawfilename,
                     image_format,
                     workfile_pattern,
                     sync_current_workfile_name=sync_current_workfile,
@@ -713,7 +716,7 @@ class ValidateVrayRenderSetting(ValidateGenericRenderSetting):
         if multipass_enabled:
             invalid.extend(
                 cls._get_invalid_vray_output(
-                    vr_settings.output_splitfilename,
+                    snapshot.vray_splitfilename,
                     image_format,
                     workfile_pattern,
                     sync_current_workfile_name=sync_current_workfile,
@@ -725,6 +728,7 @@ class ValidateVrayRenderSetting(ValidateGenericRenderSetting):
                     image_format,
                     workfile_pattern,
                     sync_current_workfile=sync_current_workfile,
+                    render_output=snapshot.render_output,
                 )
             )
 
@@ -746,6 +750,7 @@ class ValidateVrayRenderSetting(ValidateGenericRenderSetting):
             renderer_name,
             vr_settings,
         )
+        invalidate_renderer_snapshot(instance.context)
 
     @classmethod
     def repair_vray_settings(
@@ -1,6 +1,7 @@
 """Placeholder to trigger loader action during workfile build."""
 from __future__ import annotations
-from typing import Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Set
 from pymxs import runtime as rt
 
 from ayon_core.pipeline.workfile.workfile_template_builder import (
@@ -8,8 +9,7 @@ from ayon_core.pipeline.workfile.workfile_template_builder import (
     LoadPlaceholderItem
 )
 
-from ayon_max.api.pipeline import get_containers
-from ayon_max.api.lib import read
+from ayon_max.api.lib import parent_nodes
 from ayon_max.api.workfile_template_builder import (
     MaxPlaceholderPlugin,
 )
@@ -21,6 +21,18 @@ class MaxPlaceholderLoadPlugin(MaxPlaceholderPlugin, PlaceholderLoadMixin):
 
     item_class = LoadPlaceholderItem
 
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # Representations queried ahead by placeholder node name
+        self._prefetched_representations: Dict[str, List[Dict]] = {}
+        self._unfetched_placeholders = []
+        # Placeholder node names which representations were already used
+        self._processed_placeholders: Set[str] = set()
+        # Representation ids of the placeholders by placeholder node name
+        self._representation_ids: Dict[str, Set[str]] = {}
+        # Loaded containers waiting to be parented by placeholder node name
+        self._loaded_containers: Dict[str, List[Any]] = {}
+
     def _create_placeholder_name(self, placeholder_data):
 
         # Split builder type: context_assets, linked_assets, all_assets
@@ -46,28 +58,77 @@ class MaxPlaceholderLoadPlugin(MaxPlaceholderPlugin, PlaceholderLoadMixin):
         return placeholder_name.capitalize()
 
     def _get_loaded_repre_ids(self):
-        loaded_representation_ids = self.builder.get_shared_populate_data(
-            "loaded_representation_ids"
-        )
-        if loaded_representation_ids is None:
+        return self._get_scene_index().get_loaded_representation_ids()
+
+    def collect_placeholders(self):
+        placeholders = super().collect_placeholders()
+        self._unfetched_placeholders = [
+            placeholder for placeholder in placeholders
+            if placeholder.scene_identifier
+            not in self._prefetched_representations
+            and placeholder.scene_identifier
+            not in self._processed_placeholders
+        ]
+        return placeholders
+
+    def _prime_builder_entities(self, placeholders):
+        """Query folder entities cached by the builder on main thread.
+
+        The representation queries read them from the builder, which
+        caches them without locking.
+        """
+        self.builder.current_folder_entity
+        if any(
+            placeholder.data.get("builder_type") == "linked_folders"
+            for placeholder in placeholders
+        ):
+            self.builder.linked_folder_entities
+
+    def _prefetch_representations(self):
+        """Query representations of all collected placeholders at once.
+
+        The queries run concurrently on `prefetch_workers` threads.
+        """
+        placeholders = self._unfetched_placeholders
+        self._unfetched_placeholders = []
+        if not placeholders:
+            return
+
+        self._prime_builder_entities(placeholders)
+        query = super()._get_representations
+
+        def _query(placeholder):
             try:
-                containers = get_containers()
-
-            except ValueError:
-                containers = []
-
-            container_data = {
-                read(container)
-                for container in containers
-            }
-            loaded_representation_ids = {
-                data["representation"]
-                for data in container_data
-            }
-            self.builder.set_shared_populate_data(
-                "loaded_representation_ids", loaded_representation_ids
-            )
-        return loaded_representation_ids
+                return query(placeholder)
+            except Exception:
+                self.log.debug(
+                    "Prefetch of representations failed for"
+                    f" {placeholder.scene_identifier}", exc_info=True)
+                return None
+
+        max_workers = min(self.builder.prefetch_workers, len(placeholders))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            results = executor.map(_query, placeholders)
+            for placeholder, representations in zip(placeholders, results):
+                if representations is not None:
+                    self._prefetched_representations[
+                        placeholder.scene_identifier] = representations
+        self.log.debug(
+            f"Prefetched representations of {len(placeholders)}"
+            " placeholder(s).")
+
+    def _get_representations(self, placeholder):
+        if self.builder.batch_population and self._unfetched_placeholders:
+            self._prefetch_representations()
+        representations = self._prefetched_representations.pop(
+            placeholder.scene_identifier, None)
+        if representations is None:
+            representations = super()._get_representations(placeholder)
+        self._processed_placeholders.add(placeholder.scene_identifier)
+        self._representation_ids[placeholder.scene_identifier] = {
+            representation["id"] for representation in representations
+        }
+        return representations
 
     def populate_placeholder(self, placeholder):
         self.populate_load_placeholder(placeholder)
@@ -75,40 +136,72 @@ class MaxPlaceholderLoadPlugin(MaxPlaceholderPlugin, PlaceholderLoadMixin):
             self.delete_placeholder(placeholder)
 
     def repopulate_placeholder(self, placeholder):
+        # Reload only placeholders whose representations changed since
+        # they were populated or whose containers were deleted
         repre_ids = self._get_loaded_repre_ids()
+        previous_ids = set(placeholder.data.get("representation_ids") or [])
+        if previous_ids:
+            representations = self._get_representations(placeholder)
+            if (
+                self._representation_ids.get(
+                    placeholder.scene_identifier) == previous_ids
+                and previous_ids.issubset(repre_ids)
+            ):
+                self.log.debug(
+                    "Representations of placeholder"
+                    f" {placeholder.scene_identifier} did not change.")
+                return
+            # Reuse the queried representations for the load
+            self._prefetched_representations[
+                placeholder.scene_identifier] = representations
+
         self.populate_load_placeholder(placeholder, repre_ids)
 
     def get_placeholder_options(self, options=None):
         return self.get_load_plugin_options(options)
 
     def load_succeed(self, placeholder, container):
-        self._parent_in_hierarchy(placeholder, container)
+        if not container:
+            return
+        # Containers are parented at once after all representations
+        # of the placeholder are loaded, see `post_placeholder_process`
+        self._loaded_containers.setdefault(
+            placeholder.scene_identifier, []).append(container)
+
+    def post_placeholder_process(self, placeholder, failed):
+        self._parent_in_hierarchy(
+            placeholder,
+            self._loaded_containers.pop(placeholder.scene_identifier, [])
+        )
+        # Remember representations the placeholder was populated with
+        representation_ids = self._representation_ids.pop(
+            placeholder.scene_identifier, None)
+        if representation_ids and not failed:
+            self.imprint(
+                placeholder.scene_identifier,
+                {"representation_ids": sorted(representation_ids)}
+            )
+        super().post_placeholder_process(placeholder, failed)
 
-    def _parent_in_hierarchy(self, placeholder, container):
-        """Parent loaded container to placeholder's parent.
+    def _parent_in_hierarchy(self, placeholder, containers):
+        """Parent loaded containers to placeholder.
 
-        ie : Set loaded content as placeholder's sibling
+        ie : Set loaded content as placeholder's children
 
         Args:
-            container (str): Placeholder loaded container
+            placeholder (PlaceholderItem): Placeholder of the containers.
+            containers (list): Loaded container nodes or their names.
         """
-
-        if not container:
-            return
-
-        loaded_container: Optional[rt.objects] = next(
-            (
-                target_container
-                for target_container in get_containers()
-                if container == target_container.name
-            ),
-            None
-        )
-        if not loaded_container:
+        if not containers:
             return
 
         placeholder_node = rt.getNodeByName(placeholder.scene_identifier)
         if not placeholder_node:
             return
-        if rt.isValidNode(loaded_container):
-            loaded_container.parent = placeholder_node
+
+        container_nodes = [
+            rt.getNodeByName(container)
+            if isinstance(container, str) else container
+            for container in containers
+        ]
+        parent_nodes(container_nodes, placeholder_node)
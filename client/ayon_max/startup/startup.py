@@ -1,5 +1,10 @@
-from ayon_max.api import MaxHost
-from ayon_core.pipeline import install_host
+import time
+
+_import_start = time.perf_counter()
+
+from ayon_max.api import MaxHost  # noqa: E402
+from ayon_core.pipeline import install_host  # noqa: E402
 
 host = MaxHost()
+host.startup_timings["import"] = time.perf_counter() - _import_start
 install_host(host)
@@ -132,7 +132,9 @@ DEFAULT_VALUES = {
         "defualt_key_time": 0
     },
     "templated_workfile_build": {
-        "profiles": []
+        "profiles": [],
+        "batch_population": False,
+        "prefetch_workers": 4
     },
     "RenderSettings": DEFAULT_RENDER_SETTINGS,
     "CreateReview": DEFAULT_CREATE_REVIEW_SETTINGS,
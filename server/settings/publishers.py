@@ -87,16 +87,95 @@ class BasicValidateModel(BaseSettingsModel):
     active: bool = SettingsField(title="Active")
 
 
+class SaveScenesForCameraModel(BaseSettingsModel):
+    parallel_render: bool = SettingsField(
+        title="Run cameras in parallel",
+        description=(
+            "Run one 3dsmaxbatch process per camera instead of a single "
+            "process for all cameras."
+        )
+    )
+    max_workers: int = SettingsField(
+        2, title="Max parallel processes", ge=1
+    )
+    cores_per_job: int = SettingsField(
+        0,
+        title="CPU cores per process",
+        description="Pin each process to given number of cores. 0 disables.",
+        ge=0
+    )
+    memory_limit_mb: int = SettingsField(
+        0,
+        title="Memory limit per process (MB)",
+        description="Terminate process exceeding the limit. 0 disables.",
+        ge=0
+    )
+
+
+class ExtractLocalRenderModel(BaseSettingsModel):
+    resumable: bool = SettingsField(
+        title="Resume interrupted renders",
+        description=(
+            "Skip frames which were already written for every AOV "
+            "by a previous interrupted local render."
+        )
+    )
+
+
+class ValidateRenderLocalHasExistingFramesModel(BaseSettingsModel):
+    max_workers: int = SettingsField(
+        1,
+        title="Max parallel directory scans",
+        description="Scan staging directories on multiple threads.",
+        ge=1
+    )
+    check_empty_files: bool = SettingsField(
+        title="Check empty files",
+        description="Report zero-byte frames as invalid."
+    )
+
+
+class ValidationCacheModel(BaseSettingsModel):
+    enabled: bool = SettingsField(
+        title="Enabled",
+        description=(
+            "Reuse results of node based validators when none of the "
+            "instance members changed since their last run in the session. "
+            "Node changes are tracked only while enabled."
+        )
+    )
+
+
+class IntegratePublishTimingModel(BaseSettingsModel):
+    report_count: int = SettingsField(
+        10,
+        title="Reported plugins",
+        description="Number of the slowest plugins logged to the report.",
+        ge=1
+    )
+    write_json: bool = SettingsField(
+        title="Write JSON next to workfile",
+        description=(
+            "Append the timing of each publish to "
+            "'<workfile>_publish_timing.json'."
+        )
+    )
+
+
 class PublishersModel(BaseSettingsModel):
     CollectRender: CollectRenderModel = SettingsField(
         default_factory=CollectRenderModel,
         title="Collect Render",
         section="Collectors"
     )
+    ValidationCache: ValidationCacheModel = SettingsField(
+        default_factory=ValidationCacheModel,
+        title="Validation Cache",
+        section="Validators"
+    )
     ValidateInstanceInContext: BasicValidateModel = SettingsField(
         default_factory=BasicValidateModel,
-        title="Validate Instance In Context",
-        section="Validators"
+        title="Validate Instance In Context"
     )
     ValidateFrameRange: BasicValidateModel = SettingsField(
         default_factory=BasicValidateModel,
@@ -138,6 +217,12 @@ class PublishersModel(BaseSettingsModel):
         default_factory=BasicValidateModel,
         title="Validate Render Passes"
     )
+    ValidateRenderLocalHasExistingFrames: (
+        ValidateRenderLocalHasExistingFramesModel
+    ) = SettingsField(
+        default_factory=ValidateRenderLocalHasExistingFramesModel,
+        title="Validate Existing Frames"
+    )
     ExtractModelObj: BasicValidateModel = SettingsField(
         default_factory=BasicValidateModel,
         title="Extract OBJ",
@@ -159,6 +244,19 @@ class PublishersModel(BaseSettingsModel):
         default_factory=BasicValidateModel,
         title="Extract Max Scene (Raw)"
     )
+    SaveScenesForCamera: SaveScenesForCameraModel = SettingsField(
+        default_factory=SaveScenesForCameraModel,
+        title="Save Scene Files For Cameras"
+    )
+    ExtractLocalRender: ExtractLocalRenderModel = SettingsField(
+        default_factory=ExtractLocalRenderModel,
+        title="Extract Local Render"
+    )
+    IntegratePublishTiming: IntegratePublishTimingModel = SettingsField(
+        default_factory=IntegratePublishTimingModel,
+        title="Publish Timing Report",
+        section="Integrators"
+    )
 
 
 DEFAULT_PUBLISH_SETTINGS = {
@@ -166,6 +264,9 @@ DEFAULT_PUBLISH_SETTINGS = {
         "sync_workfile_version": False,
         "sync_current_workfile_name": True
     },
+    "ValidationCache": {
+        "enabled": False
+    },
     "ValidateInstanceInContext": {
         "enabled": True,
         "optional": True,
@@ -221,6 +322,10 @@ DEFAULT_PUBLISH_SETTINGS = {
         "optional": False,
         "active": True
     },
+    "ValidateRenderLocalHasExistingFrames": {
+        "max_workers": 1,
+        "check_empty_files": False
+    },
     "ExtractModelObj": {
         "enabled": True,
         "optional": True,
@@ -245,5 +350,18 @@ DEFAULT_PUBLISH_SETTINGS = {
         "enabled": True,
         "optional": True,
         "active": True
+    },
+    "SaveScenesForCamera": {
+        "parallel_render": False,
+        "max_workers": 2,
+        "cores_per_job": 0,
+        "memory_limit_mb": 0
+    },
+    "ExtractLocalRender": {
+        "resumable": False
+    },
+    "IntegratePublishTiming": {
+        "report_count": 10,
+        "write_json": False
     }
 }
@@ -43,3 +43,23 @@ class TemplatedWorkfileBuildModel(BaseSettingsModel):
     profiles: list[TemplatedWorkfileProfileModel] = SettingsField(
         default_factory=list
     )
+    batch_population: bool = SettingsField(
+        False,
+        title="Batch placeholder population",
+        description=(
+            "Query representations of all load placeholders concurrently"
+            " before loading them with the scene redraw suspended."
+        ),
+        section="Performance",
+    )
+    prefetch_workers: int = SettingsField(
+        4,
+        title="Representation query workers",
+        description=(
+            "Number of threads querying representations of load"
+            " placeholders when batch population is enabled."
+        ),
+        ge=1,
+        le=32,
+        section="Performance",
+    )
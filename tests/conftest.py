@@ -0,0 +1,27 @@
+"""Fixtures of the `ayon_max` tests.
+
+The tests run without 3ds Max, `pymxs` is replaced by the fake runtime
+of the benchmarks before any test module imports `ayon_max`.
+"""
+import os
+import sys
+
+import pytest
+
+from benchmarks import fake_pymxs
+
+
+CLIENT_DIR = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "client")
+if CLIENT_DIR not in sys.path:
+    sys.path.insert(0, CLIENT_DIR)
+
+rt = fake_pymxs.install()
+
+
+@pytest.fixture
+def max_scene():
+    """Empty scene of the fake runtime."""
+    rt.resetMaxFile()
+    yield rt
+    rt.resetMaxFile()
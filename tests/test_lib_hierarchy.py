@@ -0,0 +1,78 @@
+"""Tests of the Python side of `ayon_max.api.lib_hierarchy`.
+
+MaxScript of the traversal is replaced by a spy returning canned nodes
+and values, so the order of the walk in 3ds Max is not covered here.
+The module is loaded from its file, it does not need `ayon_core`.
+"""
+import os
+import importlib.util
+
+import pytest
+
+
+LIB_HIERARCHY_PATH = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+    "client", "ayon_max", "api", "lib_hierarchy.py")
+
+
+def _load_lib_hierarchy():
+    spec = importlib.util.spec_from_file_location(
+        "lib_hierarchy", LIB_HIERARCHY_PATH)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+class SpyRuntime(object):
+    """Runtime recording arguments of the descendants function."""
+
+    def __init__(self, nodes, values):
+        self.nodes = nodes
+        self.values = values
+        self.calls = []
+
+    def Execute(self, script):
+        assert "fn ayon_get_descendants" in script
+        return self.get_descendants
+
+    def get_descendants(self, *args):
+        self.calls.append(args)
+        return self.nodes, self.values
+
+
+@pytest.fixture
+def lib_hierarchy(monkeypatch):
+    module = _load_lib_hierarchy()
+    runtime = SpyRuntime(
+        ["root", "lower", "upper", "empty"],
+        ["", "ayon.load.container", "AYON.LOAD.CONTAINER", ""]
+    )
+    monkeypatch.setattr(module, "rt", runtime)
+    return module
+
+
+def test_get_descendants_arguments(lib_hierarchy):
+    lib_hierarchy.get_descendants(
+        "root", super_class="GeometryClass", class_name="Box")
+    lib_hierarchy.get_descendants(
+        "root", user_prop="id", value="ayon.load.container",
+        include_root=True)
+
+    assert lib_hierarchy.rt.calls == [
+        ("root", False, "GeometryClass", "Box", None, True),
+        ("root", True, None, None, "id", False),
+    ]
+
+
+def test_get_descendants_without_value(lib_hierarchy):
+    nodes = lib_hierarchy.get_descendants("root", user_prop="id")
+
+    assert isinstance(nodes, list)
+    assert nodes == lib_hierarchy.rt.nodes
+
+
+def test_get_descendants_value_is_case_sensitive(lib_hierarchy):
+    nodes = lib_hierarchy.get_descendants(
+        "root", user_prop="id", value="ayon.load.container")
+
+    assert nodes == ["lower"]
@@ -0,0 +1,93 @@
+"""Tests of running 3dsmaxbatch jobs with a fake batch executable."""
+import os
+import sys
+import platform
+
+import pytest
+
+pytest.importorskip("ayon_core")
+
+from ayon_max.api import lib_maxbatch  # noqa: E402
+
+
+# Stands in for 3dsmaxbatch, the job script contains the exit code
+STUB_SCRIPT = """
+import os
+import sys
+import time
+
+script_path, scene_file = sys.argv[1], sys.argv[3]
+with open(script_path) as f:
+    exit_code = int(f.read().strip())
+start = time.time()
+time.sleep(0.5)
+with open(script_path + ".log", "w") as f:
+    f.write(f"{start} {time.time()} {os.getenv('AYON_MAX_HEADLESS')}")
+print(f"Processed {scene_file}")
+sys.exit(exit_code)
+"""
+
+
+@pytest.fixture
+def fake_maxbatch(tmp_path, monkeypatch):
+    stub_path = tmp_path / "fake_maxbatch.py"
+    stub_path.write_text(STUB_SCRIPT)
+    if platform.system().lower() == "windows":
+        executable = tmp_path / "3dsmaxbatch.cmd"
+        executable.write_text(f'@"{sys.executable}" "{stub_path}" %*\n')
+    else:
+        executable = tmp_path / "3dsmaxbatch"
+        executable.write_text(
+            f'#!/bin/sh\nexec "{sys.executable}" "{stub_path}" "$@"\n')
+        executable.chmod(0o755)
+    monkeypatch.setenv("AYON_MAX_BATCH_EXECUTABLE", str(executable))
+    return executable
+
+
+def _create_jobs(directory, exit_codes):
+    jobs = []
+    for index, exit_code in enumerate(exit_codes):
+        script_path = directory / f"camera{index}.py"
+        script_path.write_text(str(exit_code))
+        jobs.append(lib_maxbatch.MaxBatchJob(
+            f"camera{index}",
+            str(script_path),
+            str(directory / "scene.max")
+        ))
+    return jobs
+
+
+def _read_job_log(job):
+    with open(f"{job.script_path}.log") as f:
+        start, end, headless = f.read().split()
+    return float(start), float(end), headless
+
+
+def test_executable_from_environment(fake_maxbatch):
+    assert lib_maxbatch.get_maxbatch_executable() == str(fake_maxbatch)
+
+
+def test_jobs_run_in_parallel(fake_maxbatch, tmp_path):
+    jobs = _create_jobs(tmp_path, [0, 0, 0, 0])
+
+    returncodes = lib_maxbatch.run_maxbatch_jobs(jobs, max_workers=2)
+
+    assert returncodes == {job.name: 0 for job in jobs}
+    logs = [_read_job_log(job) for job in jobs]
+    assert all(headless == "1" for _, _, headless in logs)
+    # Number of jobs running when each of the jobs started
+    concurrency = [
+        sum(1 for start, end, _ in logs if start <= job_start < end)
+        for job_start, _, _ in logs
+    ]
+    assert max(concurrency) == 2
+
+
+def test_failed_job_raises(fake_maxbatch, tmp_path):
+    jobs = _create_jobs(tmp_path, [0, 3])
+
+    with pytest.raises(RuntimeError, match="camera1"):
+        lib_maxbatch.run_maxbatch_jobs(jobs, max_workers=2)
+
+    assert [job.returncode for job in jobs] == [0, 3]
+    assert os.path.exists(f"{jobs[0].script_path}.log")
@@ -0,0 +1,128 @@
+"""Tests of the base creator of `ayon_max`."""
+import contextlib
+
+import pytest
+
+pytest.importorskip("ayon_core")
+
+from ayon_core.pipeline import CreatorError  # noqa: E402
+
+from ayon_max.api import lib, plugin  # noqa: E402
+
+
+class FakeCreatedInstance(object):
+    """Created instance storing its data like `CreatedInstance`."""
+
+    def __init__(
+        self, product_type, product_name, data, creator,
+        product_base_type=None
+    ):
+        self.product_name = product_name
+        self.data = dict(data)
+        self.data.update({
+            "productType": product_type,
+            "productBaseType": product_base_type,
+            "productName": product_name,
+            "creator_identifier": creator.identifier,
+        })
+
+    def data_to_store(self):
+        return dict(self.data)
+
+
+class FakeCreateContext(object):
+    host_name = "max"
+
+    def __init__(self):
+        self.instances = []
+        self.bulk_calls = 0
+
+    def get_current_project_name(self):
+        return "test_project"
+
+    def get_current_project_entity(self):
+        return {"name": "test_project"}
+
+    def get_current_folder_path(self):
+        return "/shots/sh010"
+
+    def get_current_task_name(self):
+        return "modeling"
+
+    def get_folder_entity(self, folder_path):
+        return {"path": folder_path}
+
+    def get_task_entity(self, folder_path, task_name):
+        return {"name": task_name}
+
+    @contextlib.contextmanager
+    def bulk_add_instances(self):
+        self.bulk_calls += 1
+        yield
+
+    def creator_adds_instance(self, instance):
+        self.instances.append(instance)
+
+
+class BulkModelCreator(plugin.MaxCreator):
+    identifier = "io.ayon.creators.max.bulk_model"
+    label = "Bulk Model"
+    product_type = "model"
+    product_base_type = "model"
+
+    def get_product_name(self, variant, **kwargs):
+        return f"{self.product_base_type}{variant}"
+
+
+class CustomModelCreator(BulkModelCreator):
+    def create(self, product_name, instance_data, pre_create_data):
+        return super().create(product_name, instance_data, pre_create_data)
+
+
+def _make_creator(creator_cls):
+    creator = object.__new__(creator_cls)
+    creator.create_context = FakeCreateContext()
+    return creator
+
+
+@pytest.fixture
+def created_instance(monkeypatch):
+    monkeypatch.setattr(plugin, "CreatedInstance", FakeCreatedInstance)
+
+
+def test_create_bulk(max_scene, created_instance):
+    rt = max_scene
+    boxes = [rt.Box(name=f"box{index}") for index in range(3)]
+    creator = _make_creator(BulkModelCreator)
+
+    instances = creator.create_bulk(
+        ["Main", "Hero"], [boxes[:1], boxes[1:]])
+
+    assert [instance.product_name for instance in instances] == [
+        "modelMain", "modelHero"]
+    assert creator.create_context.instances == instances
+    assert creator.create_context.bulk_calls == 1
+    for variant, members in (("Main", boxes[:1]), ("Hero", boxes[1:])):
+        node = rt.getNodeByName(f"model{variant}")
+        data = lib.read(node)
+        assert data["variant"] == variant
+        assert data["folderPath"] == "/shots/sh010"
+        assert data["task"] == "modeling"
+        ayon_data = node.modifiers[0].AYONData
+        assert list(ayon_data.sel_list) == [str(box) for box in members]
+
+
+def test_create_bulk_existing_product(max_scene, created_instance):
+    max_scene.Container(name="modelMain")
+    creator = _make_creator(BulkModelCreator)
+
+    with pytest.raises(CreatorError):
+        creator.create_bulk(["Main"], [[]])
+
+
+def test_create_bulk_overridden_create(max_scene, created_instance):
+    creator = _make_creator(CustomModelCreator)
+
+    with pytest.raises(CreatorError):
+        creator.create_bulk(["Main"], [[]])
+    assert max_scene.getNodeByName("modelMain") is None
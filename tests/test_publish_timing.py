@@ -0,0 +1,88 @@
+"""Tests of the timing of `ayon_max` publish plugins."""
+import os
+import sys
+import importlib.util
+
+import pytest
+
+pytest.importorskip("ayon_core")
+
+import pyblish.api  # noqa: E402
+import pyblish.util  # noqa: E402
+
+from ayon_max import MAX_HOST_DIR  # noqa: E402
+from ayon_max.api import publish_timing  # noqa: E402
+
+
+COLLECTOR_PATH = os.path.join(
+    MAX_HOST_DIR, "plugins", "publish", "collect_publish_timing.py")
+
+
+def _load_collector():
+    """Load the collector like pyblish discovery does."""
+    spec = importlib.util.spec_from_file_location(
+        "collect_publish_timing", COLLECTOR_PATH)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    sys.modules[COLLECTOR_PATH] = module
+    plugin = module.CollectPublishTiming
+    plugin.__module__ = COLLECTOR_PATH
+    return plugin
+
+
+class CollectTimingInstance(pyblish.api.ContextPlugin):
+    order = pyblish.api.CollectorOrder
+    label = "Collect Timing Instance"
+
+    def process(self, context):
+        context.create_instance("modelMain", family="model")
+
+
+class ValidateTimingInstance(pyblish.api.InstancePlugin):
+    order = pyblish.api.ValidatorOrder
+    label = "Validate Timing Instance"
+
+    def process(self, instance):
+        pass
+
+
+@pytest.fixture
+def timing_callback(monkeypatch):
+    # Plugins of this module are recorded like `ayon_max` plugins
+    monkeypatch.setattr(
+        publish_timing, "MAX_HOST_DIR",
+        os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    publish_timing.install()
+    yield
+    pyblish.api.deregister_callback(
+        "pluginProcessed", publish_timing.on_plugin_processed)
+    publish_timing.set_current_context(None)
+
+
+def test_plugins_are_recorded_to_context(timing_callback):
+    context = pyblish.util.publish(plugins=[
+        _load_collector(),
+        CollectTimingInstance,
+        ValidateTimingInstance,
+    ])
+
+    records = publish_timing.get_timing_records(context)
+    assert [record["plugin"] for record in records] == [
+        "CollectPublishTiming",
+        "CollectTimingInstance",
+        "ValidateTimingInstance",
+    ]
+    assert [record["instance"] for record in records] == [
+        None, None, "modelMain"]
+    assert all(record["success"] for record in records)
+
+
+def test_context_plugins_need_collected_context(timing_callback):
+    context = pyblish.util.publish(plugins=[
+        CollectTimingInstance,
+        ValidateTimingInstance,
+    ])
+
+    records = publish_timing.get_timing_records(context)
+    assert [record["plugin"] for record in records] == [
+        "ValidateTimingInstance"]